@@ -17,6 +17,10 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import math
 
+import artifact_writer
+import mmr_engine
+import rank_table
+
 # Map and Gametype Configuration
 MAP_GAMETYPES = {
     "Midship": ["MLG CTF5", "MLG Team Slayer", "MLG Oddball", "MLG Bomb"],
@@ -53,8 +57,8 @@ def load_json_file(filepath: str) -> dict:
 
 def save_json_file(filepath: str, data: dict):
     """Save data to JSON file and push to GitHub"""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Same writer and format as populate_stats.py, so neither reformats the other's output
+    artifact_writer.write_json_artifact(filepath, data, indent=artifact_writer.BOT_SHARED_INDENT)
     
     # Push to GitHub
     try:
@@ -187,29 +191,19 @@ def update_player_stats(user_id: int, stats_update: dict):
     
     save_json_file(RANKSTATS_FILE, stats)
 
+def get_rank_table() -> rank_table.RankTable:
+    """Get the shared RankTable for xp_config.json (rebuilt only when the file changes)"""
+    if not os.path.exists(XP_CONFIG_FILE):
+        get_xp_config()  # Writes the default config
+    return rank_table.get_rank_table(XP_CONFIG_FILE)
+
 def calculate_rank(xp: int) -> int:
     """Calculate rank level based on XP from config"""
-    thresholds = get_rank_thresholds()
-    for level in range(50, 0, -1):
-        min_xp, max_xp = thresholds[level]
-        if xp >= min_xp:
-            return level
-    return 1
+    return get_rank_table().calculate_rank(xp)
 
 def get_rank_progress(xp: int) -> Tuple[int, int, int]:
     """Get current rank, XP in rank, and XP needed for next rank"""
-    rank = calculate_rank(xp)
-    if rank == 50:
-        return rank, xp, 0  # Max rank
-    
-    thresholds = get_rank_thresholds()
-    current_min, current_max = thresholds[rank]
-    next_min, next_max = thresholds[rank + 1]
-    
-    xp_in_rank = xp - current_min
-    xp_for_next = next_min - xp
-    
-    return rank, xp_in_rank, xp_for_next
+    return get_rank_table().get_rank_progress(xp)
 
 # Rank icon URLs (for DMs)
 RANK_ICON_BASE = "https://r2-cdn.insignia.live/h2-rank"
@@ -339,6 +333,11 @@ def record_match_results(winners: List[int], losers: List[int], is_series_end: b
             update["total_series"] = 1
         update_player_stats(user_id, update)
 
+    # Move MMR for this game (populate_stats recomputes it from the full history)
+    stats = load_json_file(RANKSTATS_FILE)
+    mmr_engine.update_entries(stats, [str(uid) for uid in winners], [str(uid) for uid in losers])
+    save_json_file(RANKSTATS_FILE, stats)
+
 async def refresh_all_ranks(guild: discord.Guild, player_ids: List[int], send_dm: bool = True):
     """Refresh rank roles for all players in a match"""
     for user_id in player_ids:
@@ -350,9 +349,10 @@ def get_all_players_sorted(sort_by: str = "rank") -> List[Tuple[str, dict]]:
     """Get all players sorted by specified criteria"""
     stats = load_json_file(RANKSTATS_FILE)
     
+    table = get_rank_table()
     players = []
     for user_id, player_stats in stats.items():
-        player_stats["rank"] = calculate_rank(player_stats["xp"])
+        player_stats["rank"] = table.calculate_rank(player_stats["xp"])
         players.append((user_id, player_stats))
     
     # Sort based on criteria
@@ -461,7 +461,7 @@ class StatsCommands(commands.Cog):
         win_rate = (wins / total_games * 100) if total_games > 0 else 0
         
         # Get MMR
-        mmr = player_stats.get("mmr", 1500)
+        mmr = mmr_engine.effective_mmr(player_stats)
         
         # Create embed (NeatQueue style)
         embed = discord.Embed(
@@ -605,7 +605,7 @@ class StatsCommands(commands.Cog):
         )
         print(f"[VERIFY ALL] Refreshed {updated_count} ranks, {error_count} errors")
     
-    @app_commands.command(name="mmr", description="[ADMIN] Set a player's MMR")
+    @app_commands.command(name="mmr", description="[ADMIN] Set a player's MMR (kept as an offset from their rating)")
     @has_admin_role()
     @app_commands.describe(
         player="Player to set MMR for",
@@ -635,19 +635,20 @@ class StatsCommands(commands.Cog):
                 "series_losses": 0,
                 "total_games": 0,
                 "total_series": 0,
-                "mmr": value
+                "mmr": mmr_engine.INITIAL_RATING
             }
-        else:
-            stats[user_key]["mmr"] = value
+        # Stored as an offset from the computed rating, so it survives rating recomputes
+        mmr_engine.set_mmr(stats[user_key], value)
+        offset = stats[user_key]["mmr_offset"]
         
         # Save
         save_json_file(RANKSTATS_FILE, stats)
         
         await interaction.response.send_message(
-            f"✅ Set {player.mention}'s MMR to **{value}**",
+            f"✅ Set {player.mention}'s MMR to **{value}** (rating {stats[user_key]['mmr_rating']:.0f}, offset {offset:+.0f})",
             ephemeral=True
         )
-        print(f"[MMR] {interaction.user.name} set {player.name}'s MMR to {value}")
+        print(f"[MMR] {interaction.user.name} set {player.name}'s MMR to {value} (offset {offset:+.0f})")
     
     @app_commands.command(name="leaderboard", description="View the matchmaking leaderboard")
     @app_commands.describe(
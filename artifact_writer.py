@@ -0,0 +1,56 @@
+"""
+artifact_writer.py - Compact, atomic JSON for the static site
+
+populate_stats.py writes the site's data files (games/index.json,
+rankstats.json, matchhistory.json, ...) through write_json_artifact():
+
+- Compact separators by default (indent=2 only when asked for)
+- Files the bot also rewrites (BOT_SHARED_FILES) always use the bot's
+  indent=2, so the two writers never reformat each other's commits
+- Written to a temp file and renamed over the old one, so a page load or a
+  git push never sees half a file
+
+GitHub Pages serves these files straight from the repository and gzips
+responses itself, so no precompressed copies are written.
+
+Usage:
+    import artifact_writer
+    sizes = artifact_writer.write_json_artifact('rankstats.json', rankstats)
+"""
+
+import json
+import os
+
+# Rewritten by STATSRANKS.py and postgame.py as well as populate_stats.py
+BOT_SHARED_FILES = ('rankstats.json', 'gamestats.json', 'matchhistory.json')
+BOT_SHARED_INDENT = 2
+
+
+def encode_json(data, indent=None):
+    """Serialize to UTF-8 JSON bytes: compact separators, or indent=N for readable output."""
+    if indent is None:
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=indent).encode('utf-8')
+
+def write_atomic(path, raw):
+    """Write bytes to a temp file next to path, then rename it over path."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(raw)
+    os.replace(temp_path, path)
+
+def write_artifact(path, raw):
+    """
+    Write a file for the site (bytes).
+
+    Returns:
+        {path: size in bytes}
+    """
+    write_atomic(path, raw)
+    return {path: len(raw)}
+
+def write_json_artifact(path, data, indent=None):
+    """Write a JSON file for the site; BOT_SHARED_FILES always use BOT_SHARED_INDENT."""
+    if os.path.basename(path) in BOT_SHARED_FILES:
+        indent = BOT_SHARED_INDENT
+    return write_artifact(path, encode_json(data, indent))
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+benchmarks.py - Performance and parity checks for the stats pipeline
+
+Each benchmark is a subcommand that prints a small timing report, so
+regressions in populate_stats.py can be spotted before a rebuild goes live.
+
+Usage:
+    python benchmarks.py workbook [--repeat N]
+    python benchmarks.py parallel [--copies N] [--workers N]
+    python benchmarks.py parity
+    python benchmarks.py imports [--max-ms N] [--top N]
+    python benchmarks.py memory [--games N [N ...]]
+    python benchmarks.py ranks [--players N] [--repeat N]
+    python benchmarks.py mmr [--games N] [--players N] [--repeat N]
+    python benchmarks.py artifacts [--file PATH] [--repeat N]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+STATS_DIR = 'stats'
+
+# Modules loaded when the bot and the stats scripts start
+STARTUP_MODULES = ['twitch', 'commands', 'STATSRANKS', 'postgame', 'github_webhook',
+                   'sync_identity', 'populate_stats']
+
+# Imports that should stay deferred until first use
+DEFERRED_IMPORTS = ['pandas', 'paramiko']
+
+# Sheets parse_excel_file() reads from every game workbook
+GAME_SHEETS = ['Game Details', 'Post Game Report', 'Versus',
+               'Game Statistics', 'Medal Stats', 'Weapon Statistics']
+
+def list_stats_files(stats_dir=STATS_DIR):
+    """Get sorted paths of all xlsx files in the stats folder."""
+    return [os.path.join(stats_dir, f) for f in sorted(os.listdir(stats_dir)) if f.endswith('.xlsx')]
+
+def best_of(func, repeat):
+    """Run func repeat times and return the fastest wall time in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def bench_workbook(args):
+    """Compare per-sheet pd.read_excel calls against one GameWorkbook open per file."""
+    import pandas as pd
+    import populate_stats
+
+    def per_sheet_reads(file_path):
+        # The classification helpers each re-read the Post Game Report,
+        # determine_playlist re-reads Game Details, then every sheet is parsed
+        for _ in range(3):
+            pd.read_excel(file_path, sheet_name='Post Game Report')
+        pd.read_excel(file_path, sheet_name='Game Details')
+        for sheet_name in GAME_SHEETS:
+            pd.read_excel(file_path, sheet_name=sheet_name)
+
+    def single_open(file_path):
+        populate_stats.GameWorkbook(file_path)
+
+    files = list_stats_files()
+    if not files:
+        print(f"No xlsx files found in {STATS_DIR}/")
+        return
+
+    print(f"Workbook loading ({len(files)} files, best of {args.repeat}):")
+    total_before = total_after = 0.0
+    for file_path in files:
+        before = best_of(lambda: per_sheet_reads(file_path), args.repeat)
+        after = best_of(lambda: single_open(file_path), args.repeat)
+        total_before += before
+        total_after += after
+        print(f"  {os.path.basename(file_path):24s} | per-sheet: {before * 1000:7.1f} ms"
+              f" | single open: {after * 1000:7.1f} ms | {before / after:4.1f}x")
+    print(f"  {'TOTAL':24s} | per-sheet: {total_before * 1000:7.1f} ms"
+          f" | single open: {total_after * 1000:7.1f} ms | {total_before / total_after:4.1f}x")
+
+def build_synthetic_corpus(target_dir, copies):
+    """Fill target_dir with copies of the stats samples; returns the sorted file paths."""
+    samples = list_stats_files()
+    for i in range(copies):
+        for sample in samples:
+            name = f"{i:04d}_{os.path.basename(sample)}"
+            shutil.copyfile(sample, os.path.join(target_dir, name))
+    return list_stats_files(target_dir)
+
+def bench_parallel(args):
+    """
+    Compare serial and process-pool parsing on a synthetic corpus.
+
+    --workers is passed explicitly, so the pool is used whatever the corpus
+    size; compare the result with populate_stats.PARALLEL_MIN_FILES, the
+    crossover assumed when --workers isn't given.
+    """
+    import populate_stats
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        files = build_synthetic_corpus(corpus_dir, args.copies)
+        if not files:
+            print(f"No xlsx files found in {STATS_DIR}/")
+            return
+
+        # parse_excel_file() prints one line per file; keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            serial = populate_stats.ingest_game_files(files, workers=1)
+            serial_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parallel = populate_stats.ingest_game_files(files, workers=args.workers)
+            parallel_time = time.perf_counter() - start
+
+    print(f"Parsing {len(files)} files (synthetic corpus, {args.copies} copies of {STATS_DIR}/):")
+    print(f"  serial:     {serial_time:7.2f} s | {len(files) / serial_time:7.1f} files/s")
+    print(f"  {args.workers:2d} workers: {parallel_time:7.2f} s | {len(files) / parallel_time:7.1f} files/s"
+          f" | {serial_time / parallel_time:4.1f}x")
+    print(f"  Same results in same order: {serial == parallel}")
+    automatic = populate_stats.file_workers(None, len(files))
+    print(f"  Without --workers, populate_stats would use {automatic} process(es) for this corpus "
+          f"({os.cpu_count()} CPUs, pool from {populate_stats.PARALLEL_MIN_FILES} files)")
+
+def check_parity(args):
+    """
+    Check that the streaming xlsx reader matches pandas for every file in stats/.
+
+    Compares the raw sheets and the parse_excel_file() output of both readers.
+    Exits with status 1 if any file differs.
+    """
+    import populate_stats
+
+    files = list_stats_files()
+    if not files:
+        print(f"No xlsx files found in {STATS_DIR}/")
+        return
+
+    failures = 0
+    print(f"Streaming reader vs pandas ({len(files)} files):")
+    for file_path in files:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fast = populate_stats.GameWorkbook(file_path)
+            fast_time = time.perf_counter() - start
+            start = time.perf_counter()
+            slow = populate_stats.GameWorkbook(file_path, use_pandas=True)
+            slow_time = time.perf_counter() - start
+
+            problems = []
+            if fast.reader != 'xml':
+                problems.append("fast path fell back to pandas")
+            for name in populate_stats.GAME_SHEETS:
+                if fast.sheets.get(name) != slow.sheets.get(name):
+                    problems.append(f"sheet {name!r} differs")
+            fast_game = json.dumps(populate_stats.parse_excel_file(fast), sort_keys=True)
+            slow_game = json.dumps(populate_stats.parse_excel_file(slow), sort_keys=True)
+            if fast_game != slow_game:
+                problems.append("parse_excel_file output differs")
+
+        status = "OK  " if not problems else "FAIL"
+        print(f"  {status} {os.path.basename(file_path):24s} | xml: {fast_time * 1000:6.1f} ms"
+              f" | pandas: {slow_time * 1000:6.1f} ms")
+        for problem in problems:
+            print(f"         - {problem}")
+        failures += bool(problems)
+
+    print(f"  {len(files) - failures}/{len(files)} files match")
+    if failures:
+        raise SystemExit(1)
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        (total_us, {imported module: cumulative us}) or (None, error message)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'import failed'
+        return None, error
+    return timings.get(module, 0), timings
+
+def bench_imports(args):
+    """Report import time of the bot/script modules and flag heavy imports that aren't deferred."""
+    print(f"Import time (python -X importtime, cumulative):")
+    failures = 0
+    for module in STARTUP_MODULES:
+        total_us, timings = measure_import(module)
+        if total_us is None:
+            print(f"  SKIP {module:16s} | could not import: {timings}")
+            continue
+
+        eager = [name for name in DEFERRED_IMPORTS if name in timings]
+        too_slow = args.max_ms is not None and total_us / 1000 > args.max_ms
+        status = "FAIL" if eager or too_slow else "OK  "
+        print(f"  {status} {module:16s} | {total_us / 1000:7.1f} ms")
+
+        heaviest = sorted(((us, name) for name, us in timings.items()
+                           if name != module and '.' not in name), reverse=True)[:args.top]
+        for us, name in heaviest:
+            print(f"         {name:24s} {us / 1000:7.1f} ms")
+        if eager:
+            print(f"         imported at startup: {', '.join(eager)}")
+        failures += bool(eager or too_slow)
+
+    if failures:
+        raise SystemExit(1)
+
+def synthetic_game_dicts(count):
+    """
+    Yield count parsed games built from the stats samples, as independent dicts.
+
+    Each game goes through its own json.loads, so like separately parsed files
+    it doesn't share key or name strings with the others.
+    """
+    import populate_stats
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        samples = [json.dumps(populate_stats.parse_excel_file(f)) for f in list_stats_files()]
+    for i in range(count):
+        game = json.loads(samples[i % len(samples)])
+        game['source_file'] = f"{i:06d}.xlsx"
+        game['playlist'] = None
+        yield game
+
+def traced_size(build):
+    """Get the bytes still allocated by build()'s result, measured with tracemalloc."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+def bench_memory(args):
+    """Compare the memory held by the game history as nested dicts and as game_records."""
+    from game_records import Game
+
+    if not list_stats_files():
+        print(f"No xlsx files found in {STATS_DIR}/")
+        return
+
+    print(f"Game history memory (tracemalloc, synthetic games from {STATS_DIR}/):")
+    for count in args.games:
+        as_dicts = traced_size(lambda: list(synthetic_game_dicts(count)))
+        as_records = traced_size(lambda: [Game.from_json(g) for g in synthetic_game_dicts(count)])
+        print(f"  {count:6d} games | dicts: {as_dicts / 2**20:7.1f} MiB"
+              f" | records: {as_records / 2**20:7.1f} MiB | {as_dicts / as_records:4.1f}x smaller")
+
+def legacy_calculate_rank(xp):
+    """STATSRANKS.calculate_rank before RankTable: re-read xp_config.json and scan every level."""
+    import STATSRANKS
+
+    thresholds = STATSRANKS.get_rank_thresholds()
+    for level in range(50, 0, -1):
+        min_xp, max_xp = thresholds[level]
+        if xp >= min_xp:
+            return level
+    return 1
+
+class LegacyRankTable:
+    """Stands in for RankTable with the old per-call lookup."""
+
+    def calculate_rank(self, xp):
+        return legacy_calculate_rank(xp)
+
+def bench_ranks(args):
+    """Time STATSRANKS.get_all_players_sorted on a synthetic rankstats.json, old vs RankTable lookups."""
+    try:
+        import STATSRANKS
+    except ImportError as e:
+        print(f"SKIP: could not import STATSRANKS ({e})")
+        return
+
+    rng = random.Random(0)
+    rankstats = {str(10**17 + i): {'xp': rng.randint(0, 12000), 'wins': rng.randint(0, 300),
+                                   'losses': rng.randint(0, 300), 'series_wins': rng.randint(0, 50),
+                                   'mmr': rng.randint(500, 2500)}
+                 for i in range(args.players)}
+
+    original_dir = os.getcwd()
+    config_path = os.path.abspath(STATSRANKS.XP_CONFIG_FILE)
+    with tempfile.TemporaryDirectory() as work_dir:
+        shutil.copyfile(config_path, os.path.join(work_dir, STATSRANKS.XP_CONFIG_FILE))
+        with open(os.path.join(work_dir, STATSRANKS.RANKSTATS_FILE), 'w') as f:
+            json.dump(rankstats, f)
+
+        os.chdir(work_dir)
+        get_rank_table = STATSRANKS.get_rank_table
+        try:
+            STATSRANKS.get_rank_table = LegacyRankTable
+            before = best_of(lambda: STATSRANKS.get_all_players_sorted('rank'), args.repeat)
+            legacy_order = [uid for uid, _ in STATSRANKS.get_all_players_sorted('rank')]
+        finally:
+            STATSRANKS.get_rank_table = get_rank_table
+        try:
+            after = best_of(lambda: STATSRANKS.get_all_players_sorted('rank'), args.repeat)
+            same_order = legacy_order == [uid for uid, _ in STATSRANKS.get_all_players_sorted('rank')]
+        finally:
+            os.chdir(original_dir)
+
+    print(f"get_all_players_sorted('rank') over {args.players} players (best of {args.repeat}):")
+    print(f"  per-call config + linear scan: {before * 1000:8.1f} ms")
+    print(f"  RankTable bisect:              {after * 1000:8.1f} ms | {before / after:5.1f}x")
+    print(f"  Same order: {same_order}")
+
+def bench_mmr(args):
+    """Time mmr_engine.rate_matches on a synthetic 4v4 history."""
+    import mmr_engine
+
+    rng = random.Random(0)
+    players = [str(10**17 + i) for i in range(args.players)]
+    matches = []
+    for _ in range(args.games):
+        lobby = rng.sample(players, 8)
+        matches.append((lobby[:4], lobby[4:]))
+
+    elapsed = best_of(lambda: mmr_engine.rate_matches(matches), args.repeat)
+    ratings, _ = mmr_engine.rate_matches(matches)
+    print(f"MMR over {args.games} games, {args.players} players (best of {args.repeat}):")
+    print(f"  rate_matches: {elapsed * 1000:8.1f} ms | {args.games / elapsed:9.0f} games/s")
+    print(f"  Ratings: {min(ratings.values()):.0f} - {max(ratings.values()):.0f}")
+
+def bench_artifacts(args):
+    """Size and load time of a site JSON file: pretty vs compact, and gzipped as GitHub Pages sends it."""
+    import gzip
+    import artifact_writer
+
+    with open(args.file, 'r') as f:
+        data = json.load(f)
+    pretty = artifact_writer.encode_json(data, indent=2)
+    compact = artifact_writer.encode_json(data)
+    gzipped = gzip.compress(compact)
+
+    print(f"{args.file} (load time best of {args.repeat}):")
+    rows = [
+        ('pretty', pretty, lambda: json.loads(pretty)),
+        ('compact', compact, lambda: json.loads(compact)),
+        ('compact gzip', gzipped, lambda: json.loads(gzip.decompress(gzipped)))
+    ]
+    for label, raw, load in rows:
+        elapsed = best_of(load, args.repeat)
+        print(f"  {label:12s} {len(raw):11,d} bytes ({len(raw) / len(pretty):6.1%}) | load {elapsed * 1000:7.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Stats pipeline benchmarks")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    workbook_parser = subparsers.add_parser('workbook', help="Per-file workbook loading cost")
+    workbook_parser.add_argument('--repeat', type=int, default=3, help="Runs per file (best is reported)")
+    workbook_parser.set_defaults(func=bench_workbook)
+
+    parallel_parser = subparsers.add_parser('parallel', help="Serial vs process-pool parsing")
+    parallel_parser.add_argument('--copies', type=int, default=20, help="Copies of stats/ in the corpus")
+    parallel_parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help="Pool size")
+    parallel_parser.set_defaults(func=bench_parallel)
+
+    parity_parser = subparsers.add_parser('parity', help="Streaming xlsx reader vs pandas output")
+    parity_parser.set_defaults(func=check_parity)
+
+    imports_parser = subparsers.add_parser('imports', help="Import time of the bot modules")
+    imports_parser.add_argument('--max-ms', type=float, default=None,
+                                help="Fail if any module takes longer than this to import")
+    imports_parser.add_argument('--top', type=int, default=3, help="Heaviest imports to list per module")
+    imports_parser.set_defaults(func=bench_imports)
+
+    memory_parser = subparsers.add_parser('memory', help="Game history memory: dicts vs game_records")
+    memory_parser.add_argument('--games', type=int, nargs='+', default=[1000, 10000],
+                               help="Synthetic history sizes to measure")
+    memory_parser.set_defaults(func=bench_memory)
+
+    ranks_parser = subparsers.add_parser('ranks', help="Leaderboard sort with RankTable vs per-call lookups")
+    ranks_parser.add_argument('--players', type=int, default=10000, help="Players in the synthetic rankstats.json")
+    ranks_parser.add_argument('--repeat', type=int, default=3, help="Runs (best is reported)")
+    ranks_parser.set_defaults(func=bench_ranks)
+
+    mmr_parser = subparsers.add_parser('mmr', help="MMR recompute over a synthetic history")
+    mmr_parser.add_argument('--games', type=int, default=100000, help="Games in the synthetic history")
+    mmr_parser.add_argument('--players', type=int, default=400, help="Players in the synthetic history")
+    mmr_parser.add_argument('--repeat', type=int, default=3, help="Runs (best is reported)")
+    mmr_parser.set_defaults(func=bench_mmr)
+
+    artifacts_parser = subparsers.add_parser('artifacts', help="Site JSON size and load time by encoding")
+    artifacts_parser.add_argument('--file', default='games/index.json', help="JSON file to measure")
+    artifacts_parser.add_argument('--repeat', type=int, default=3, help="Runs (best is reported)")
+    artifacts_parser.set_defaults(func=bench_artifacts)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
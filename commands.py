@@ -25,12 +25,13 @@ def log_action(message: str):
     queue_log(message)
 
 async def get_player_mmr(user_id: int) -> int:
-    """Get player MMR"""
+    """Get player MMR (computed rating + admin offset)"""
     import STATSRANKS
+    import mmr_engine
     stats = STATSRANKS.get_player_stats(user_id)
-    if stats and 'mmr' in stats:
-        return stats['mmr']
-    return 1500
+    if stats:
+        return mmr_engine.effective_mmr(stats)
+    return mmr_engine.INITIAL_RATING
 
 def setup_commands(bot: commands.Bot, PREGAME_LOBBY_ID: int, POSTGAME_LOBBY_ID: int, QUEUE_CHANNEL_ID: int):
     """Setup all bot commands"""
@@ -693,6 +694,7 @@ def setup_commands(bot: commands.Bot, PREGAME_LOBBY_ID: int, POSTGAME_LOBBY_ID:
     async def link_alias(interaction: discord.Interaction, alias: str):
         """Link an in-game alias - can have multiple"""
         import twitch
+        import identity_index
         
         alias = alias.strip()
         
@@ -723,11 +725,13 @@ def setup_commands(bot: commands.Bot, PREGAME_LOBBY_ID: int, POSTGAME_LOBBY_ID:
             )
             return
         
-        # Check if alias is taken by someone else
+        # Check if alias is taken by someone else (as an alias or their stats profile)
+        wanted = [identity_index.normalize_name(alias), "alias"]
+        profile = [wanted[0], "stats_profile"]
         for other_id, other_data in players.items():
             if other_id != user_id:
-                other_aliases = other_data.get("aliases", [])
-                if alias.lower() in [a.lower() for a in other_aliases]:
+                other_names = identity_index.player_names(other_data)
+                if wanted in other_names or profile in other_names:
                     await interaction.response.send_message(
                         f"❌ Alias **{alias}** is already linked to another user.",
                         ephemeral=True
@@ -1113,7 +1117,7 @@ def setup_commands(bot: commands.Bot, PREGAME_LOBBY_ID: int, POSTGAME_LOBBY_ID:
         
         **Match Management:**
         • `/correctcurrent <game#> <winner>` - Fix game result
-        • `/mmr @user <value>` - Set player MMR
+        • `/mmr @user <value>` - Set player MMR (offset from computed rating)
         • `/addgamestats` - Add map/gametype info
         • `/silentrankrefresh` - Refresh all ranks silently (no DMs)
         
@@ -0,0 +1,233 @@
+"""
+game_records.py - Compact in-memory records for parsed games
+
+populate_stats.py keeps the whole game history in memory while it replays XP.
+As plain dicts every player line repeats the same keys ('kills', 'deaths',
+'shots_fired', ...) and every game carries its own copy of each player, map
+and variant name. These records store the values in __slots__, intern the
+repeated strings, and share one column tuple between all medal/weapon lines
+with the same layout.
+
+The on-disk format doesn't change: Game.from_json() reads a parse_excel_file()
+/ gameshistory.json dict and Game.to_json() writes the exact same dict back.
+
+Usage:
+    from game_records import Game
+    game = Game.from_json(parsed, source_file='20251128_201839.xlsx', playlist='MLG 4v4')
+    for player in game.players:
+        print(player.name, player.kills)
+    json.dump(game.to_json(), f)
+"""
+
+import sys
+
+from versus_matrix import VersusMatrix
+
+# Column tuples shared by every medal/weapon line with the same layout
+_COLUMN_TUPLES = {}
+
+
+def intern_str(value):
+    """Intern a string so repeated names share one object; other values pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+def shared_columns(columns):
+    """Get the shared tuple for a sequence of column names."""
+    columns = tuple(intern_str(c) for c in columns)
+    return _COLUMN_TUPLES.setdefault(columns, columns)
+
+
+class _Record:
+    """
+    Base for fixed-layout records; subclasses set __slots__ to their JSON keys.
+
+    Fields listed in INTERNED are run through sys.intern on the way in.
+    """
+
+    __slots__ = ()
+    INTERNED = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self.__slots__, values):
+            setattr(self, field, value)
+
+    @classmethod
+    def from_json(cls, data):
+        record = cls.__new__(cls)
+        for field in cls.__slots__:
+            value = data[field]
+            setattr(record, field, intern_str(value) if field in cls.INTERNED else value)
+        return record
+
+    def to_json(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{f}={getattr(self, f)!r}' for f in self.__slots__)})"
+
+
+class PlayerLine(_Record):
+    """One player's row of the Post Game Report."""
+
+    __slots__ = ('name', 'place', 'score', 'score_numeric', 'kills', 'deaths', 'assists', 'kda',
+                 'suicides', 'team', 'shots_fired', 'shots_hit', 'accuracy', 'head_shots')
+    INTERNED = ('name', 'place', 'team')
+
+
+class DetailedStats(_Record):
+    """One player's row of the Game Statistics sheet."""
+
+    __slots__ = ('player', 'emblem_url', 'kills', 'assists', 'deaths', 'headshots', 'betrayals',
+                 'suicides', 'best_spree', 'total_time_alive', 'ctf_scores', 'ctf_flag_steals',
+                 'ctf_flag_saves')
+    INTERNED = ('player', 'emblem_url')
+
+
+class _CounterLine:
+    """
+    A player name plus a row of integer counters (medals or weapons).
+
+    The counter names vary between files, so they are kept in a column tuple
+    shared by every line with the same layout.
+    """
+
+    __slots__ = ('player', 'columns', 'values')
+    NAME_KEY = 'player'
+
+    def __init__(self, player, columns, values):
+        self.player = intern_str(player)
+        self.columns = shared_columns(columns)
+        self.values = tuple(values)
+
+    @classmethod
+    def from_json(cls, data):
+        items = iter(data.items())
+        _, player = next(items)
+        columns, values = zip(*items) if len(data) > 1 else ((), ())
+        return cls(player, columns, values)
+
+    def get(self, column, default=0):
+        """Get one counter by column name."""
+        try:
+            return self.values[self.columns.index(column)]
+        except ValueError:
+            return default
+
+    def to_json(self):
+        data = {self.NAME_KEY: self.player}
+        data.update(zip(self.columns, self.values))
+        return data
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return (self.player, self.columns, self.values) == (other.player, other.columns, other.values)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.player!r}, {len(self.columns)} columns)"
+
+
+class MedalLine(_CounterLine):
+    """One player's row of the Medal Stats sheet."""
+
+    __slots__ = ()
+
+
+class WeaponLine(_CounterLine):
+    """One player's row of the Weapon Statistics sheet (keyed 'Player' on disk)."""
+
+    __slots__ = ()
+    NAME_KEY = 'Player'
+
+
+class Game:
+    """
+    One parsed game.
+
+    The Game Details fields are None when the sheet was empty. The detail
+    sheets (versus, detailed_stats, medals, weapons) are None for games that
+    were only triaged (populate_stats --rank-only). versus is a VersusMatrix.
+    """
+
+    __slots__ = ('game_type', 'variant', 'map_name', 'start_time', 'end_time', 'duration',
+                 'players', 'versus', 'detailed_stats', 'medals', 'weapons',
+                 'source_file', 'playlist')
+
+    # Game Details sheet column -> attribute
+    DETAIL_FIELDS = [('Game Type', 'game_type'), ('Variant Name', 'variant'), ('Map Name', 'map_name'),
+                     ('Start Time', 'start_time'), ('End Time', 'end_time'), ('Duration', 'duration')]
+
+    def __init__(self):
+        for field in self.__slots__:
+            setattr(self, field, None)
+
+    @classmethod
+    def from_json(cls, data, source_file=None, playlist=None):
+        """
+        Build a Game from a parse_excel_file() or gameshistory.json dict.
+
+        source_file/playlist override the dict's values when given.
+        """
+        game = cls()
+        details = data.get('details') or {}
+        for column, field in cls.DETAIL_FIELDS:
+            if column in details:
+                setattr(game, field, intern_str(details[column]))
+
+        game.players = tuple(PlayerLine.from_json(p) for p in data['players'])
+
+        if 'versus' in data:
+            game.versus = VersusMatrix.from_json(data['versus'])
+        if 'detailed_stats' in data:
+            game.detailed_stats = tuple(DetailedStats.from_json(s) for s in data['detailed_stats'])
+        if 'medals' in data:
+            game.medals = tuple(MedalLine.from_json(m) for m in data['medals'])
+        if 'weapons' in data:
+            game.weapons = tuple(WeaponLine.from_json(w) for w in data['weapons'])
+
+        game.source_file = source_file if source_file is not None else data.get('source_file')
+        game.playlist = playlist if playlist is not None else data.get('playlist')
+        return game
+
+    @property
+    def details(self):
+        """The Game Details sheet as a dict, like the parsed JSON."""
+        return {column: getattr(self, field) for column, field in self.DETAIL_FIELDS
+                if getattr(self, field) is not None}
+
+    def triage_copy(self):
+        """Copy without the detail sheets (all XP replay needs; cheap to send to worker processes)."""
+        game = Game()
+        for column, field in self.DETAIL_FIELDS:
+            setattr(game, field, getattr(self, field))
+        game.players = self.players
+        game.source_file = self.source_file
+        game.playlist = self.playlist
+        return game
+
+    def to_json(self):
+        """Convert back to the gameshistory.json dict layout."""
+        data = {
+            'details': self.details,
+            'players': [p.to_json() for p in self.players]
+        }
+        if self.versus is not None:
+            data['versus'] = self.versus.to_json()
+        if self.detailed_stats is not None:
+            data['detailed_stats'] = [s.to_json() for s in self.detailed_stats]
+        if self.medals is not None:
+            data['medals'] = [m.to_json() for m in self.medals]
+        if self.weapons is not None:
+            data['weapons'] = [w.to_json() for w in self.weapons]
+        if self.source_file is not None:
+            data['source_file'] = self.source_file
+            data['playlist'] = self.playlist
+        return data
+
+    def __repr__(self):
+        return f"Game({self.source_file!r}, {self.variant!r} on {self.map_name!r}, {len(self.players)} players)"
@@ -0,0 +1,171 @@
+"""
+game_shards.py - Game history split into a small index and per-month shards
+
+gameshistory.json held every sheet of every game in one file, so the site
+downloaded the whole history before it could list a single game, and
+populate_stats.py rewrote all of it on every run. The history is now written
+to games/:
+
+- games/index.json: one row per game with what the games list, search and
+  leaderboards read - Game Details, playlist, the Post Game Report lines,
+  teams and winner - plus the shard holding the rest
+- games/<YYYY-MM>.json: the detail sheets (versus, detailed_stats, medals,
+  weapons) of the games started that month, fetched by the site when a game
+  is opened or a view needs medals/weapons
+
+The index records the sha256 of every shard file as written, so an
+incremental run only rewrites the months whose games (or the output indent)
+changed (a new game normally touches one shard).
+
+Index format (games ordered by source file, like gameshistory.json):
+    {
+      "version": 1,
+      "shards": {"2025-11": {"file": "2025-11.json", "games": 12, "sha256": "..."}},
+      "games": [
+        {"source_file": "20251128_201839.xlsx", "playlist": "MLG 4v4", "shard": "2025-11",
+         "time": "2025-11-28T20:18:00", "details": {...}, "players": [...],
+         "teams": {"Red": ["Rocky", ...], "Blue": [...]}, "winner": "Red"}
+      ]
+    }
+
+winner is the top-scoring team, the top-scoring player of a free-for-all, or
+null for a tie.
+
+Shard format:
+    {"version": 1, "games": {"20251128_201839.xlsx": {"versus": ..., "detailed_stats": [...],
+                                                      "medals": [...], "weapons": [...]}}}
+
+Usage:
+    import game_shards
+    game_shards.write_game_shards(game_store.load_games(conn))
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import artifact_writer
+from game_store import parse_start_time
+
+GAMES_DIR = 'games'
+GAMES_INDEX_FILE = 'index.json'
+
+# Bump when the index or shard layout changes; every shard is rewritten
+GAME_SHARDS_VERSION = 1
+
+# Game keys moved out of the index into the shards
+DETAIL_KEYS = ('versus', 'detailed_stats', 'medals', 'weapons')
+
+# Shard for games without a usable Start Time or dated file name
+UNDATED_SHARD = 'undated'
+
+# Team values that mean "no team" (free-for-all)
+NO_TEAM = ('', 'none', 'null', 'undefined')
+
+
+def game_time(game):
+    """Get a game's ISO start time from Game Details, or None."""
+    return parse_start_time((game.get('details') or {}).get('Start Time'))
+
+def shard_key(game):
+    """Get the YYYY-MM shard of a gameshistory.json game dict."""
+    start = game_time(game)
+    if start:
+        return start[:7]
+    try:
+        return datetime.strptime((game.get('source_file') or '')[:8], '%Y%m%d').strftime('%Y-%m')
+    except ValueError:
+        return UNDATED_SHARD
+
+def game_teams(game):
+    """Get {team: [player names]} for the players on a team."""
+    teams = {}
+    for player in game['players']:
+        team = str(player.get('team') or '').strip()
+        if team.lower() not in NO_TEAM:
+            teams.setdefault(team, []).append(player['name'])
+    return teams
+
+def game_winner(game, teams):
+    """Get the winning team, the winning player of a free-for-all, or None for a tie."""
+    if len(teams) > 1:
+        scores = {team: 0 for team in teams}
+        for player in game['players']:
+            team = str(player.get('team') or '').strip()
+            if team in scores:
+                scores[team] += player.get('score_numeric') or 0
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    else:
+        ranked = sorted(((p['name'], p.get('score_numeric') or 0) for p in game['players']),
+                        key=lambda item: item[1], reverse=True)
+    if not ranked or (len(ranked) > 1 and ranked[0][1] == ranked[1][1]):
+        return None
+    return ranked[0][0]
+
+def index_entry(game, shard):
+    """Get a game's index row: the game dict without its detail sheets, plus shard, time, teams and winner."""
+    entry = {key: value for key, value in game.items() if key not in DETAIL_KEYS}
+    teams = game_teams(game)
+    entry.update(shard=shard, time=game_time(game), teams=teams, winner=game_winner(game, teams))
+    return entry
+
+def shard_path(shard, games_dir=GAMES_DIR):
+    return os.path.join(games_dir, f"{shard}.json")
+
+def load_index(games_dir=GAMES_DIR):
+    """Load games/index.json, or None if it is missing or from another version."""
+    try:
+        with open(os.path.join(games_dir, GAMES_INDEX_FILE), 'r') as f:
+            index = json.load(f)
+        if index.get('version') == GAME_SHARDS_VERSION:
+            return index
+    except:
+        pass
+    return None
+
+def remove_artifact(path):
+    """Remove a file written by artifact_writer."""
+    if os.path.exists(path):
+        os.remove(path)
+
+def write_game_shards(games, games_dir=GAMES_DIR, indent=None):
+    """
+    Write games/index.json and the month shards whose games changed.
+
+    Args:
+        games: gameshistory.json game dicts, oldest first
+        indent: JSON indent (default: compact)
+
+    Returns:
+        (index, written shard keys, removed shard keys)
+    """
+    os.makedirs(games_dir, exist_ok=True)
+    previous = (load_index(games_dir) or {}).get('shards', {})
+
+    entries = []
+    shards = {}
+    for game in games:
+        shard = shard_key(game)
+        entries.append(index_entry(game, shard))
+        shards.setdefault(shard, {})[game['source_file']] = {key: game.get(key) for key in DETAIL_KEYS}
+
+    shard_info = {}
+    written = []
+    for shard, shard_games in sorted(shards.items()):
+        # Hash the bytes as written, so switching between compact and --pretty rewrites the shard
+        raw = artifact_writer.encode_json({'version': GAME_SHARDS_VERSION, 'games': shard_games}, indent)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = shard_path(shard, games_dir)
+        shard_info[shard] = {'file': os.path.basename(path), 'games': len(shard_games), 'sha256': digest}
+        if previous.get(shard, {}).get('sha256') != digest or not os.path.exists(path):
+            artifact_writer.write_artifact(path, raw)
+            written.append(shard)
+
+    removed = sorted(set(previous) - set(shard_info))
+    for shard in removed:
+        remove_artifact(shard_path(shard, games_dir))
+
+    index = {'version': GAME_SHARDS_VERSION, 'shards': shard_info, 'games': entries}
+    artifact_writer.write_json_artifact(os.path.join(games_dir, GAMES_INDEX_FILE), index, indent)
+    return index, written, removed
@@ -0,0 +1,391 @@
+"""
+game_store.py - SQLite store for parsed game history
+
+populate_stats.py writes every parsed game into games.db as normalized tables
+(games, player_games, detailed_stats, versus_kills, medals, weapons), indexed by
+player name, map, variant, playlist and start time. The games/ history (see
+game_shards.py) and the other site files are generated from this store, and
+the bot or export scripts can run targeted queries instead of loading the
+whole history.
+
+Usage:
+    import game_store
+    conn = game_store.connect()
+    for game in game_store.find_games(conn, player='Rocky', map_name='Midship'):
+        print(game['source_file'], game['variant'])
+"""
+
+import sqlite3
+from datetime import datetime
+
+GAMES_DB_FILE = 'games.db'
+
+# Bump when the schema changes; an old store is dropped and rebuilt
+SCHEMA_VERSION = 3
+
+# Start Time formats written by the stats server
+START_TIME_FORMATS = ['%m/%d/%Y %H:%M', '%m/%d/%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S']
+
+# Per-player columns of the Post Game Report, in gameshistory.json order
+PLAYER_COLUMNS = ['name', 'place', 'score', 'score_numeric', 'kills', 'deaths', 'assists', 'kda',
+                  'suicides', 'team', 'shots_fired', 'shots_hit', 'accuracy', 'head_shots']
+
+DETAILED_STATS_COLUMNS = ['player', 'emblem_url', 'kills', 'assists', 'deaths', 'headshots', 'betrayals',
+                          'suicides', 'best_spree', 'total_time_alive', 'ctf_scores', 'ctf_flag_steals',
+                          'ctf_flag_saves']
+
+SCHEMA = """
+CREATE TABLE games (
+    id INTEGER PRIMARY KEY,
+    source_file TEXT NOT NULL UNIQUE,
+    source_sha256 TEXT,
+    parser_version INTEGER,
+    playlist TEXT,
+    game_type TEXT,
+    variant TEXT,
+    map TEXT,
+    start_time TEXT,
+    start_ts TEXT,
+    end_time TEXT,
+    duration TEXT
+);
+CREATE INDEX idx_games_map ON games(map);
+CREATE INDEX idx_games_variant ON games(variant);
+CREATE INDEX idx_games_playlist ON games(playlist);
+CREATE INDEX idx_games_start_ts ON games(start_ts);
+
+CREATE TABLE player_games (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    place TEXT,
+    score TEXT,
+    score_numeric INTEGER,
+    kills INTEGER,
+    deaths INTEGER,
+    assists INTEGER,
+    kda REAL,
+    suicides INTEGER,
+    team TEXT,
+    shots_fired INTEGER,
+    shots_hit INTEGER,
+    accuracy REAL,
+    head_shots INTEGER,
+    PRIMARY KEY (game_id, position)
+);
+CREATE INDEX idx_player_games_name ON player_games(name COLLATE NOCASE);
+
+CREATE TABLE detailed_stats (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    emblem_url TEXT,
+    kills INTEGER,
+    assists INTEGER,
+    deaths INTEGER,
+    headshots INTEGER,
+    betrayals INTEGER,
+    suicides INTEGER,
+    best_spree INTEGER,
+    total_time_alive INTEGER,
+    ctf_scores INTEGER,
+    ctf_flag_steals INTEGER,
+    ctf_flag_saves INTEGER,
+    PRIMARY KEY (game_id, position)
+);
+CREATE INDEX idx_detailed_stats_player ON detailed_stats(player COLLATE NOCASE);
+
+CREATE TABLE versus_kills (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    killer_position INTEGER NOT NULL,
+    victim_position INTEGER NOT NULL,
+    killer TEXT NOT NULL,
+    victim TEXT NOT NULL,
+    kills INTEGER NOT NULL,
+    PRIMARY KEY (game_id, killer_position, victim_position)
+);
+CREATE INDEX idx_versus_killer ON versus_kills(killer COLLATE NOCASE);
+CREATE INDEX idx_versus_victim ON versus_kills(victim COLLATE NOCASE);
+
+CREATE TABLE medals (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    medal_position INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    medal TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (game_id, position, medal_position)
+);
+CREATE INDEX idx_medals_player ON medals(player COLLATE NOCASE);
+
+CREATE TABLE weapons (
+    game_id INTEGER NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    stat_position INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    stat TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (game_id, position, stat_position)
+);
+CREATE INDEX idx_weapons_player ON weapons(player COLLATE NOCASE);
+"""
+
+TABLES = ['weapons', 'medals', 'versus_kills', 'detailed_stats', 'player_games', 'games']
+
+def connect(db_path=GAMES_DB_FILE):
+    """Open the game store, creating (or rebuilding an outdated) schema as needed."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+
+    version = conn.execute('PRAGMA user_version').fetchone()[0]
+    if version != SCHEMA_VERSION:
+        with conn:
+            for table in TABLES:
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+            conn.executescript(SCHEMA)
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    return conn
+
+def parse_start_time(start_time):
+    """Convert a Start Time cell to a sortable ISO timestamp, or None if unrecognised."""
+    for fmt in START_TIME_FORMATS:
+        try:
+            return datetime.strptime(start_time, fmt).isoformat()
+        except (TypeError, ValueError):
+            continue
+    return None
+
+def _insert_game(conn, game, source_sha256, parser_version):
+    """Insert one parsed game and all of its child rows; returns the new game id."""
+    details = game.get('details') or {}
+    start_time = details.get('Start Time')
+    cursor = conn.execute(
+        'INSERT INTO games (source_file, source_sha256, parser_version, playlist, game_type, variant, map, '
+        'start_time, start_ts, end_time, duration) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        (game['source_file'], source_sha256, parser_version, game.get('playlist'), details.get('Game Type'),
+         details.get('Variant Name'), details.get('Map Name'), start_time,
+         parse_start_time(start_time), details.get('End Time'), details.get('Duration'))
+    )
+    game_id = cursor.lastrowid
+    versus = game.get('versus') or {'players': [], 'kills': []}
+
+    conn.executemany(
+        f'INSERT INTO player_games (game_id, position, {", ".join(PLAYER_COLUMNS)}) '
+        f'VALUES (?, ?, {", ".join("?" * len(PLAYER_COLUMNS))})',
+        [(game_id, i, *(p.get(c) for c in PLAYER_COLUMNS)) for i, p in enumerate(game.get('players', []))]
+    )
+    conn.executemany(
+        f'INSERT INTO detailed_stats (game_id, position, {", ".join(DETAILED_STATS_COLUMNS)}) '
+        f'VALUES (?, ?, {", ".join("?" * len(DETAILED_STATS_COLUMNS))})',
+        [(game_id, i, *(s.get(c) for c in DETAILED_STATS_COLUMNS))
+         for i, s in enumerate(game.get('detailed_stats', []))]
+    )
+    conn.executemany(
+        'INSERT INTO versus_kills (game_id, killer_position, victim_position, killer, victim, kills) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        [(game_id, i, j, killer, victim, kills)
+         for i, (killer, row) in enumerate(zip(versus['players'], versus['kills']))
+         for j, (victim, kills) in enumerate(zip(versus['players'], row))]
+    )
+    conn.executemany(
+        'INSERT INTO medals (game_id, position, medal_position, player, medal, count) VALUES (?, ?, ?, ?, ?, ?)',
+        [(game_id, i, j, m['player'], medal, count)
+         for i, m in enumerate(game.get('medals', []))
+         for j, (medal, count) in enumerate((k, v) for k, v in m.items() if k != 'player')]
+    )
+    conn.executemany(
+        'INSERT INTO weapons (game_id, position, stat_position, player, stat, value) VALUES (?, ?, ?, ?, ?, ?)',
+        [(game_id, i, j, w['Player'], stat, value)
+         for i, w in enumerate(game.get('weapons', []))
+         for j, (stat, value) in enumerate((k, v) for k, v in w.items() if k != 'Player')]
+    )
+    return game_id
+
+def sync_games(conn, games, source_hashes=None, parser_version=None):
+    """
+    Make the store hold exactly `games`, rewriting only what changed.
+
+    Games are matched by source_file. A game whose source file hash and parser
+    version are unchanged only has its playlist updated; new or changed games
+    are (re)inserted and games no longer present are deleted.
+
+    Args:
+        conn: Connection from connect()
+        games: Parsed games, each with 'source_file' and 'playlist'
+        source_hashes: Optional {source_file: sha256} of the xlsx files
+        parser_version: Version of the parser that produced `games`; rows written
+            by another version are rewritten even if the file hash matches
+
+    Returns:
+        (inserted, updated, deleted) counts
+    """
+    source_hashes = source_hashes or {}
+    existing = {row['source_file']: (row['id'], row['source_sha256'], row['parser_version'])
+                for row in conn.execute('SELECT id, source_file, source_sha256, parser_version FROM games')}
+    inserted = updated = 0
+
+    with conn:
+        for game in games:
+            source_file = game['source_file']
+            source_sha256 = source_hashes.get(source_file)
+            current = existing.pop(source_file, None)
+
+            if current and source_sha256 and current[1:] == (source_sha256, parser_version):
+                conn.execute('UPDATE games SET playlist = ? WHERE id = ?', (game.get('playlist'), current[0]))
+                updated += 1
+                continue
+
+            if current:
+                conn.execute('DELETE FROM games WHERE id = ?', (current[0],))
+            _insert_game(conn, game, source_sha256, parser_version)
+            inserted += 1
+
+        for game_id, _, _ in existing.values():
+            conn.execute('DELETE FROM games WHERE id = ?', (game_id,))
+
+    return inserted, updated, len(existing)
+
+def _load_children(conn, game_ids):
+    """Fetch the child rows of the given games, grouped by game id."""
+    placeholders = ', '.join('?' * len(game_ids))
+
+    def grouped(query):
+        groups = {game_id: [] for game_id in game_ids}
+        for row in conn.execute(query.format(ids=placeholders), game_ids):
+            groups[row['game_id']].append(row)
+        return groups
+
+    return {
+        'players': grouped('SELECT * FROM player_games WHERE game_id IN ({ids}) ORDER BY game_id, position'),
+        'detailed_stats': grouped('SELECT * FROM detailed_stats WHERE game_id IN ({ids}) ORDER BY game_id, position'),
+        'versus': grouped('SELECT * FROM versus_kills WHERE game_id IN ({ids}) '
+                          'ORDER BY game_id, killer_position, victim_position'),
+        'medals': grouped('SELECT * FROM medals WHERE game_id IN ({ids}) '
+                          'ORDER BY game_id, position, medal_position'),
+        'weapons': grouped('SELECT * FROM weapons WHERE game_id IN ({ids}) '
+                           'ORDER BY game_id, position, stat_position')
+    }
+
+def _build_game(game_row, children):
+    """Rebuild the gameshistory.json dict for one game."""
+    game_id = game_row['id']
+
+    details = {}
+    if game_row['game_type'] is not None:
+        details = {
+            'Game Type': game_row['game_type'],
+            'Variant Name': game_row['variant'],
+            'Map Name': game_row['map'],
+            'Start Time': game_row['start_time'],
+            'End Time': game_row['end_time'],
+            'Duration': game_row['duration']
+        }
+
+    # Every player has a row in the square matrix, so the killers give the name order
+    versus = {'players': [], 'kills': []}
+    for row in children['versus'][game_id]:
+        if row['victim_position'] == 0:
+            versus['players'].append(row['killer'])
+            versus['kills'].append([])
+        versus['kills'][-1].append(row['kills'])
+
+    medals = []
+    for row in children['medals'][game_id]:
+        if not medals or medals[-1][1] != row['position']:
+            medals.append(({'player': row['player']}, row['position']))
+        medals[-1][0][row['medal']] = row['count']
+
+    weapons = []
+    for row in children['weapons'][game_id]:
+        if not weapons or weapons[-1][1] != row['position']:
+            weapons.append(({'Player': row['player']}, row['position']))
+        weapons[-1][0][row['stat']] = row['value']
+
+    return {
+        'details': details,
+        'players': [{c: row[c] for c in PLAYER_COLUMNS} for row in children['players'][game_id]],
+        'versus': versus,
+        'detailed_stats': [{c: row[c] for c in DETAILED_STATS_COLUMNS}
+                           for row in children['detailed_stats'][game_id]],
+        'medals': [m for m, _ in medals],
+        'weapons': [w for w, _ in weapons],
+        'source_file': game_row['source_file'],
+        'playlist': game_row['playlist']
+    }
+
+def load_games(conn, game_ids=None):
+    """
+    Load games in gameshistory.json format, ordered by source file.
+
+    Args:
+        game_ids: Only load these games (default: all)
+    """
+    if game_ids is None:
+        game_rows = conn.execute('SELECT * FROM games ORDER BY source_file').fetchall()
+    else:
+        game_ids = list(game_ids)
+        if not game_ids:
+            return []
+        placeholders = ', '.join('?' * len(game_ids))
+        game_rows = conn.execute(f'SELECT * FROM games WHERE id IN ({placeholders}) ORDER BY source_file',
+                                 game_ids).fetchall()
+
+    if not game_rows:
+        return []
+    children = _load_children(conn, [row['id'] for row in game_rows])
+    return [_build_game(row, children) for row in game_rows]
+
+def find_games(conn, player=None, map_name=None, variant=None, playlist=None, since=None, until=None):
+    """
+    Find games matching all of the given filters, oldest first.
+
+    Args:
+        player: In-game name (case-insensitive)
+        map_name, variant, playlist: Exact matches
+        since, until: ISO timestamps bounding the start time (inclusive)
+
+    Returns:
+        List of game rows (id, source_file, playlist, variant, map, start_time, ...)
+    """
+    clauses = []
+    params = []
+    if player is not None:
+        clauses.append('id IN (SELECT game_id FROM player_games WHERE name = ? COLLATE NOCASE)')
+        params.append(player)
+    if map_name is not None:
+        clauses.append('map = ?')
+        params.append(map_name)
+    if variant is not None:
+        clauses.append('variant = ?')
+        params.append(variant)
+    if playlist is not None:
+        clauses.append('playlist = ?')
+        params.append(playlist)
+    if since is not None:
+        clauses.append('start_ts >= ?')
+        params.append(since)
+    if until is not None:
+        clauses.append('start_ts <= ?')
+        params.append(until)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    return conn.execute(f'SELECT * FROM games {where} ORDER BY start_ts, source_file', params).fetchall()
+
+def player_totals(conn, player, playlist=None):
+    """
+    Sum a player's Post Game Report stats across games.
+
+    Returns:
+        dict with games, kills, deaths, assists, head_shots, shots_fired, shots_hit
+    """
+    query = ('SELECT COUNT(*) AS games, COALESCE(SUM(kills), 0) AS kills, COALESCE(SUM(deaths), 0) AS deaths, '
+             'COALESCE(SUM(assists), 0) AS assists, COALESCE(SUM(head_shots), 0) AS head_shots, '
+             'COALESCE(SUM(shots_fired), 0) AS shots_fired, COALESCE(SUM(shots_hit), 0) AS shots_hit '
+             'FROM player_games JOIN games ON games.id = player_games.game_id '
+             'WHERE player_games.name = ? COLLATE NOCASE')
+    params = [player]
+    if playlist is not None:
+        query += ' AND games.playlist = ?'
+        params.append(playlist)
+    return dict(conn.execute(query, params).fetchone())
@@ -0,0 +1,3 @@
+// Generated by populate_stats.py - do not edit
+let gamesData = [{"details":{"Game Type":"capture_the_flag","Variant Name":"MLG CTF MidWar","Map Name":"Midship","Start Time":"11/28/2025 20:03","End Time":"11/28/2025 20:18","Duration":"15:03"},"players":[{"name":"2D","place":"1st","score":"2","score_numeric":2,"kills":23,"deaths":29,"assists":20,"kda":1.483,"suicides":1,"team":"Red","shots_fired":840,"shots_hit":395,"accuracy":47.02,"head_shots":14},{"name":"KidMode","place":"1st","score":"1","score_numeric":1,"kills":27,"deaths":27,"assists":16,"kda":1.593,"suicides":0,"team":"Red","shots_fired":886,"shots_hit":325,"accuracy":36.68,"head_shots":17},{"name":"EpiiiC","place":"1st","score":"1","score_numeric":1,"kills":41,"deaths":22,"assists":25,"kda":3.0,"suicides":0,"team":"Red","shots_fired":973,"shots_hit":490,"accuracy":50.36,"head_shots":30},{"name":"Tetracide","place":"1st","score":"0","score_numeric":0,"kills":30,"deaths":26,"assists":13,"kda":1.654,"suicides":1,"team":"Red","shots_fired":1130,"shots_hit":432,"accuracy":38.23,"head_shots":23},{"name":"Rocky","place":"2nd","score":"1","score_numeric":1,"kills":30,"deaths":30,"assists":15,"kda":1.5,"suicides":0,"team":"Blue","shots_fired":704,"shots_hit":354,"accuracy":50.28,"head_shots":18},{"name":"Ralph Port","place":"2nd","score":"0","score_numeric":0,"kills":23,"deaths":30,"assists":20,"kda":1.433,"suicides":0,"team":"Blue","shots_fired":870,"shots_hit":396,"accuracy":45.52,"head_shots":14},{"name":"getitoutdaFLUD","place":"2nd","score":"0","score_numeric":0,"kills":30,"deaths":30,"assists":14,"kda":1.467,"suicides":0,"team":"Blue","shots_fired":814,"shots_hit":403,"accuracy":49.51,"head_shots":23},{"name":"roasted","place":"2nd","score":"0","score_numeric":0,"kills":21,"deaths":32,"assists":17,"kda":1.188,"suicides":0,"team":"Blue","shots_fired":781,"shots_hit":348,"accuracy":44.56,"head_shots":12}],"versus":{"2D":{"2D":0,"KidMode":0,"EpiiiC":0,"Tetracide":0,"Rocky":4,"Ralph Port":6,"getitoutdaFLUD":7,"roasted":6},"KidMode":{"2D":0,"KidMode":0,"EpiiiC":0,"Tetracide":0,"Rocky":9,"Ralph Port":4,"getitoutdaFLUD":4,"roasted":10},"EpiiiC":{"2D":0,"KidMode":0,"EpiiiC":0,"Tetracide":0,"Rocky":10,"Ralph Port":9,"getitoutdaFLUD":12,"roasted":10},"Tetracide":{"2D":0,"KidMode":0,"EpiiiC":0,"Tetracide":0,"Rocky":7,"Ralph Port":11,"getitoutdaFLUD":7,"roasted":5},"Rocky":{"2D":8,"KidMode":7,"EpiiiC":8,"Tetracide":7,"Rocky":0,"Ralph Port":0,"getitoutdaFLUD":0,"roasted":0},"Ralph Port":{"2D":7,"KidMode":7,"EpiiiC":5,"Tetracide":4,"Rocky":0,"Ralph Port":0,"getitoutdaFLUD":0,"roasted":0},"getitoutdaFLUD":{"2D":8,"KidMode":10,"EpiiiC":6,"Tetracide":6,"Rocky":0,"Ralph Port":0,"getitoutdaFLUD":0,"roasted":1},"roasted":{"2D":6,"KidMode":3,"EpiiiC":3,"Tetracide":9,"Rocky":0,"Ralph Port":0,"getitoutdaFLUD":0,"roasted":0}},"detailed_stats":[{"player":"EpiiiC","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=12&S=0&EP=1&ES=0&EF=52&EB=14&ET=0","kills":41,"assists":25,"deaths":22,"headshots":30,"betrayals":0,"suicides":0,"best_spree":5,"total_time_alive":672,"ctf_scores":1,"ctf_flag_steals":4,"ctf_flag_saves":0},{"player":"roasted","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=2&EP=0&ES=2&EF=22&EB=14&ET=0","kills":21,"assists":17,"deaths":32,"headshots":12,"betrayals":0,"suicides":0,"best_spree":2,"total_time_alive":574,"ctf_scores":0,"ctf_flag_steals":4,"ctf_flag_saves":0},{"player":"Tetracide","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=12&EP=4&ES=3&EF=22&EB=14&ET=0","kills":30,"assists":13,"deaths":26,"headshots":23,"betrayals":0,"suicides":1,"best_spree":4,"total_time_alive":627,"ctf_scores":0,"ctf_flag_steals":3,"ctf_flag_saves":1},{"player":"Rocky","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=11&S=1&EP=1&ES=0&EF=58&EB=0&ET=0","kills":30,"assists":15,"deaths":30,"headshots":18,"betrayals":0,"suicides":0,"best_spree":4,"total_time_alive":582,"ctf_scores":1,"ctf_flag_steals":3,"ctf_flag_saves":0},{"player":"getitoutdaFLUD","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=13&S=4&EP=13&ES=4&EF=6&EB=13&ET=0","kills":30,"assists":14,"deaths":30,"headshots":23,"betrayals":1,"suicides":0,"best_spree":4,"total_time_alive":592,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":1},{"player":"2D","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=0&S=0&EP=0&ES=2&EF=5&EB=0&ET=0","kills":23,"assists":20,"deaths":29,"headshots":14,"betrayals":0,"suicides":1,"best_spree":4,"total_time_alive":593,"ctf_scores":2,"ctf_flag_steals":1,"ctf_flag_saves":1},{"player":"Ralph Port","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=2&S=0&EP=7&ES=6&EF=25&EB=4&ET=0","kills":23,"assists":20,"deaths":30,"headshots":14,"betrayals":0,"suicides":0,"best_spree":3,"total_time_alive":583,"ctf_scores":0,"ctf_flag_steals":6,"ctf_flag_saves":0},{"player":"KidMode","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=0&EP=1&ES=0&EF=57&EB=5&ET=0","kills":27,"assists":16,"deaths":27,"headshots":17,"betrayals":0,"suicides":0,"best_spree":4,"total_time_alive":613,"ctf_scores":1,"ctf_flag_steals":3,"ctf_flag_saves":0}],"medals":[{"player":"EpiiiC","double_kill":5,"triple_kill":1,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":3,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":2,"killing_spree":1,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":4,"flag_carrier_kill":0,"flag_returned":1,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"roasted","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":3,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":1,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":4,"flag_carrier_kill":0,"flag_returned":3,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Tetracide","double_kill":2,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":1,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":1,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":3,"flag_carrier_kill":1,"flag_returned":2,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Rocky","double_kill":2,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":5,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":2,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":3,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"getitoutdaFLUD","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":1,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":2,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":1,"flag_returned":1,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"2D","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":2,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":2,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":1,"flag_carrier_kill":1,"flag_returned":1,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Ralph Port","double_kill":2,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":3,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":1,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":6,"flag_carrier_kill":0,"flag_returned":2,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"KidMode","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":2,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":3,"flag_carrier_kill":0,"flag_returned":6,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0}],"weapons":[{"Player":"EpiiiC","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":31,"battle rifle headshot kills":29,"battle rifle deaths":14,"battle rifle suicide":0,"battle rifle shots fired":948,"battle rifle shots hit":484,"carbine kills":2,"carbine headshot kills":1,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":23,"carbine shots hit":6,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":2,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":4,"plasma grenade headshot kills":0,"plasma grenade deaths":4,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"roasted","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":13,"battle rifle headshot kills":12,"battle rifle deaths":23,"battle rifle suicide":0,"battle rifle shots fired":781,"battle rifle shots hit":348,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":1,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":2,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":4,"plasma grenade headshot kills":0,"plasma grenade deaths":5,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Tetracide","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":25,"battle rifle headshot kills":23,"battle rifle deaths":14,"battle rifle suicide":0,"battle rifle shots fired":1130,"battle rifle shots hit":432,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":1,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":4,"plasma grenade headshot kills":0,"plasma grenade deaths":7,"plasma grenade suicide":1,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Rocky","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":19,"battle rifle headshot kills":18,"battle rifle deaths":22,"battle rifle suicide":0,"battle rifle shots fired":704,"battle rifle shots hit":354,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":1,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":1,"energy sword headshot kills":0,"energy sword deaths":1,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":5,"plasma grenade headshot kills":0,"plasma grenade deaths":4,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"getitoutdaFLUD","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":24,"battle rifle headshot kills":23,"battle rifle deaths":24,"battle rifle suicide":0,"battle rifle shots fired":814,"battle rifle shots hit":403,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":5,"plasma grenade headshot kills":0,"plasma grenade deaths":5,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"2D","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":17,"battle rifle headshot kills":14,"battle rifle deaths":23,"battle rifle suicide":1,"battle rifle shots fired":834,"battle rifle shots hit":394,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":1,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":4,"plasma grenade headshot kills":0,"plasma grenade deaths":2,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Ralph Port","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":16,"battle rifle headshot kills":14,"battle rifle deaths":24,"battle rifle suicide":0,"battle rifle shots fired":870,"battle rifle shots hit":396,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":2,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":3,"plasma grenade headshot kills":0,"plasma grenade deaths":4,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"KidMode","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":20,"battle rifle headshot kills":17,"battle rifle deaths":21,"battle rifle suicide":0,"battle rifle shots fired":886,"battle rifle shots hit":325,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":2,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":5,"plasma grenade headshot kills":0,"plasma grenade deaths":4,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0}],"source_file":"20251128_201839.xlsx","playlist":"MLG 4v4"},{"details":{"Game Type":"slayer","Variant Name":"MLG TS 2007","Map Name":"Beaver Creek","Start Time":"11/28/2025 20:19","End Time":"11/28/2025 20:22","Duration":"03:34"},"players":[{"name":"getitoutdaFLUD","place":"1st","score":"10","score_numeric":10,"kills":10,"deaths":3,"assists":2,"kda":4.0,"suicides":0,"team":"Blue","shots_fired":255,"shots_hit":125,"accuracy":49.02,"head_shots":9},{"name":"roasted","place":"1st","score":"9","score_numeric":9,"kills":9,"deaths":7,"assists":3,"kda":1.714,"suicides":0,"team":"Blue","shots_fired":317,"shots_hit":157,"accuracy":49.53,"head_shots":6},{"name":"Ralph Port","place":"1st","score":"8","score_numeric":8,"kills":8,"deaths":5,"assists":2,"kda":2.0,"suicides":0,"team":"Blue","shots_fired":232,"shots_hit":97,"accuracy":41.81,"head_shots":4},{"name":"Rocky","place":"1st","score":"6","score_numeric":6,"kills":6,"deaths":4,"assists":5,"kda":2.75,"suicides":0,"team":"Blue","shots_fired":152,"shots_hit":69,"accuracy":45.39,"head_shots":3},{"name":"KidMode","place":"2nd","score":"7","score_numeric":7,"kills":7,"deaths":6,"assists":3,"kda":1.667,"suicides":0,"team":"Red","shots_fired":215,"shots_hit":77,"accuracy":35.81,"head_shots":6},{"name":"2D","place":"2nd","score":"5","score_numeric":5,"kills":5,"deaths":11,"assists":3,"kda":0.727,"suicides":0,"team":"Red","shots_fired":257,"shots_hit":102,"accuracy":39.69,"head_shots":4},{"name":"Tetracide","place":"2nd","score":"4","score_numeric":4,"kills":4,"deaths":6,"assists":5,"kda":1.5,"suicides":0,"team":"Red","shots_fired":269,"shots_hit":119,"accuracy":44.24,"head_shots":3},{"name":"EpiiiC","place":"2nd","score":"3","score_numeric":3,"kills":3,"deaths":10,"assists":4,"kda":0.7,"suicides":0,"team":"Red","shots_fired":286,"shots_hit":134,"accuracy":46.85,"head_shots":2}],"versus":{"getitoutdaFLUD":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":1,"2D":5,"Tetracide":1,"EpiiiC":3},"roasted":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":3,"2D":2,"Tetracide":2,"EpiiiC":2},"Ralph Port":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":1,"2D":3,"Tetracide":3,"EpiiiC":1},"Rocky":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":1,"2D":1,"Tetracide":0,"EpiiiC":4},"KidMode":{"getitoutdaFLUD":1,"roasted":1,"Ralph Port":2,"Rocky":3,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":0},"2D":{"getitoutdaFLUD":1,"roasted":2,"Ralph Port":1,"Rocky":1,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":0},"Tetracide":{"getitoutdaFLUD":1,"roasted":2,"Ralph Port":1,"Rocky":0,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":0},"EpiiiC":{"getitoutdaFLUD":0,"roasted":2,"Ralph Port":1,"Rocky":0,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":0}},"detailed_stats":[{"player":"EpiiiC","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=12&S=0&EP=1&ES=0&EF=52&EB=14&ET=0","kills":3,"assists":4,"deaths":9,"headshots":2,"betrayals":0,"suicides":0,"best_spree":1,"total_time_alive":152,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"roasted","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=2&EP=0&ES=2&EF=22&EB=14&ET=0","kills":8,"assists":2,"deaths":7,"headshots":6,"betrayals":0,"suicides":0,"best_spree":2,"total_time_alive":163,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Tetracide","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=12&EP=4&ES=3&EF=22&EB=14&ET=0","kills":3,"assists":5,"deaths":6,"headshots":2,"betrayals":0,"suicides":0,"best_spree":1,"total_time_alive":170,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Rocky","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=11&S=1&EP=1&ES=0&EF=58&EB=0&ET=0","kills":6,"assists":4,"deaths":4,"headshots":3,"betrayals":0,"suicides":0,"best_spree":3,"total_time_alive":182,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"getitoutdaFLUD","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=13&S=4&EP=13&ES=4&EF=6&EB=13&ET=0","kills":8,"assists":2,"deaths":3,"headshots":7,"betrayals":0,"suicides":0,"best_spree":4,"total_time_alive":187,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"2D","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=0&S=0&EP=0&ES=2&EF=5&EB=0&ET=0","kills":5,"assists":3,"deaths":10,"headshots":4,"betrayals":0,"suicides":0,"best_spree":2,"total_time_alive":148,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Ralph Port","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=2&S=0&EP=7&ES=6&EF=25&EB=4&ET=0","kills":8,"assists":2,"deaths":4,"headshots":4,"betrayals":0,"suicides":0,"best_spree":4,"total_time_alive":181,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"KidMode","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=0&EP=1&ES=0&EF=57&EB=5&ET=0","kills":7,"assists":3,"deaths":5,"headshots":6,"betrayals":0,"suicides":0,"best_spree":4,"total_time_alive":174,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0}],"medals":[{"player":"EpiiiC","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"roasted","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Tetracide","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Rocky","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"getitoutdaFLUD","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"2D","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Ralph Port","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"KidMode","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0}],"weapons":[{"Player":"EpiiiC","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":2,"battle rifle headshot kills":2,"battle rifle deaths":7,"battle rifle suicide":0,"battle rifle shots fired":275,"battle rifle shots hit":126,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":1,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"roasted","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":7,"battle rifle headshot kills":6,"battle rifle deaths":6,"battle rifle suicide":0,"battle rifle shots fired":272,"battle rifle shots hit":135,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":3,"rocket launcher shots hit":2,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Tetracide","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":3,"battle rifle headshot kills":2,"battle rifle deaths":5,"battle rifle suicide":0,"battle rifle shots fired":245,"battle rifle shots hit":106,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Rocky","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":3,"battle rifle headshot kills":3,"battle rifle deaths":2,"battle rifle suicide":0,"battle rifle shots fired":139,"battle rifle shots hit":65,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":1,"shotgun shots hit":1,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":3,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":3,"rocket launcher shots hit":3,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"getitoutdaFLUD","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":7,"battle rifle headshot kills":7,"battle rifle deaths":3,"battle rifle suicide":0,"battle rifle shots fired":219,"battle rifle shots hit":106,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":6,"sniper rifle shots hit":3,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"2D","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":4,"battle rifle headshot kills":4,"battle rifle deaths":6,"battle rifle suicide":0,"battle rifle shots fired":248,"battle rifle shots hit":96,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":1,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Ralph Port","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":5,"battle rifle headshot kills":4,"battle rifle deaths":4,"battle rifle suicide":0,"battle rifle shots fired":232,"battle rifle shots hit":97,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":3,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"KidMode","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":6,"battle rifle headshot kills":6,"battle rifle deaths":4,"battle rifle suicide":0,"battle rifle shots fired":206,"battle rifle shots hit":70,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":6,"sniper rifle shots hit":4,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":1,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0}],"source_file":"20251128_202256.xlsx","playlist":"MLG 4v4"},{"details":{"Game Type":"oddball","Variant Name":"MLG Ball 2007","Map Name":"Lockout","Start Time":"11/28/2025 20:29","End Time":"11/28/2025 20:44","Duration":"15:00"},"players":[{"name":"getitoutdaFLUD","place":"1st","score":"1:10","score_numeric":70,"kills":29,"deaths":24,"assists":15,"kda":1.833,"suicides":0,"team":"Blue","shots_fired":663,"shots_hit":311,"accuracy":46.91,"head_shots":12},{"name":"roasted","place":"1st","score":":39","score_numeric":0,"kills":18,"deaths":31,"assists":17,"kda":1.129,"suicides":1,"team":"Blue","shots_fired":616,"shots_hit":260,"accuracy":42.21,"head_shots":9},{"name":"Ralph Port","place":"1st","score":":29","score_numeric":0,"kills":21,"deaths":32,"assists":17,"kda":1.188,"suicides":2,"team":"Blue","shots_fired":775,"shots_hit":341,"accuracy":44.0,"head_shots":12},{"name":"Rocky","place":"1st","score":":24","score_numeric":0,"kills":28,"deaths":23,"assists":9,"kda":1.609,"suicides":0,"team":"Blue","shots_fired":787,"shots_hit":257,"accuracy":32.66,"head_shots":14},{"name":"KidMode","place":"2nd","score":":51","score_numeric":0,"kills":35,"deaths":27,"assists":9,"kda":1.63,"suicides":1,"team":"Red","shots_fired":1106,"shots_hit":463,"accuracy":41.86,"head_shots":24},{"name":"2D","place":"2nd","score":":46","score_numeric":0,"kills":18,"deaths":27,"assists":14,"kda":1.185,"suicides":0,"team":"Red","shots_fired":913,"shots_hit":329,"accuracy":36.04,"head_shots":13},{"name":"Tetracide","place":"2nd","score":":32","score_numeric":0,"kills":28,"deaths":20,"assists":15,"kda":2.15,"suicides":1,"team":"Red","shots_fired":795,"shots_hit":288,"accuracy":36.23,"head_shots":16},{"name":"EpiiiC","place":"2nd","score":":19","score_numeric":0,"kills":29,"deaths":23,"assists":18,"kda":2.043,"suicides":1,"team":"Red","shots_fired":815,"shots_hit":308,"accuracy":37.79,"head_shots":19}],"versus":{"getitoutdaFLUD":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":7,"2D":6,"Tetracide":5,"EpiiiC":11},"roasted":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":4,"2D":6,"Tetracide":4,"EpiiiC":4},"Ralph Port":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":6,"2D":6,"Tetracide":6,"EpiiiC":3},"Rocky":{"getitoutdaFLUD":0,"roasted":0,"Ralph Port":0,"Rocky":0,"KidMode":10,"2D":9,"Tetracide":5,"EpiiiC":4},"KidMode":{"getitoutdaFLUD":11,"roasted":9,"Ralph Port":7,"Rocky":8,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":0},"2D":{"getitoutdaFLUD":3,"roasted":6,"Ralph Port":7,"Rocky":2,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":0},"Tetracide":{"getitoutdaFLUD":5,"roasted":5,"Ralph Port":10,"Rocky":8,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":0},"EpiiiC":{"getitoutdaFLUD":5,"roasted":11,"Ralph Port":8,"Rocky":5,"KidMode":0,"2D":0,"Tetracide":0,"EpiiiC":1}},"detailed_stats":[{"player":"EpiiiC","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=12&S=0&EP=1&ES=0&EF=52&EB=14&ET=0","kills":29,"assists":17,"deaths":22,"headshots":19,"betrayals":0,"suicides":0,"best_spree":8,"total_time_alive":663,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"roasted","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=2&EP=0&ES=2&EF=22&EB=14&ET=0","kills":18,"assists":17,"deaths":31,"headshots":9,"betrayals":0,"suicides":1,"best_spree":3,"total_time_alive":568,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Tetracide","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=12&EP=4&ES=3&EF=22&EB=14&ET=0","kills":27,"assists":15,"deaths":20,"headshots":16,"betrayals":0,"suicides":1,"best_spree":5,"total_time_alive":678,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Rocky","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=11&S=1&EP=1&ES=0&EF=58&EB=0&ET=0","kills":28,"assists":9,"deaths":23,"headshots":14,"betrayals":0,"suicides":0,"best_spree":5,"total_time_alive":655,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"getitoutdaFLUD","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=13&S=4&EP=13&ES=4&EF=6&EB=13&ET=0","kills":29,"assists":15,"deaths":24,"headshots":12,"betrayals":0,"suicides":0,"best_spree":9,"total_time_alive":640,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"2D","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=0&S=0&EP=0&ES=2&EF=5&EB=0&ET=0","kills":18,"assists":14,"deaths":27,"headshots":13,"betrayals":0,"suicides":0,"best_spree":3,"total_time_alive":610,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Ralph Port","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=2&S=0&EP=7&ES=6&EF=25&EB=4&ET=0","kills":21,"assists":17,"deaths":31,"headshots":12,"betrayals":0,"suicides":1,"best_spree":4,"total_time_alive":566,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"KidMode","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=0&EP=1&ES=0&EF=57&EB=5&ET=0","kills":35,"assists":9,"deaths":27,"headshots":24,"betrayals":0,"suicides":1,"best_spree":5,"total_time_alive":606,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0}],"medals":[{"player":"EpiiiC","double_kill":3,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":2,"road_kill":0,"bone_cracker":3,"assassin":4,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":2,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"roasted","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":1,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Tetracide","double_kill":4,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":2,"road_kill":0,"bone_cracker":2,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":3,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Rocky","double_kill":2,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":2,"road_kill":0,"bone_cracker":4,"assassin":2,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":3,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"getitoutdaFLUD","double_kill":2,"triple_kill":1,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":3,"road_kill":0,"bone_cracker":4,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":2,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"2D","double_kill":3,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Ralph Port","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":2,"assassin":2,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"KidMode","double_kill":2,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":2,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0}],"weapons":[{"Player":"EpiiiC","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":17,"battle rifle headshot kills":17,"battle rifle deaths":10,"battle rifle suicide":0,"battle rifle shots fired":806,"battle rifle shots hit":304,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":2,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":2,"sniper rifle headshot kills":2,"sniper rifle deaths":1,"sniper rifle suicide":0,"sniper rifle shots fired":9,"sniper rifle shots hit":4,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":2,"energy sword headshot kills":0,"energy sword deaths":1,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":3,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":2,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"roasted","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":12,"battle rifle headshot kills":9,"battle rifle deaths":23,"battle rifle suicide":1,"battle rifle shots fired":613,"battle rifle shots hit":259,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":1,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":2,"shotgun shots hit":1,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":1,"energy sword headshot kills":0,"energy sword deaths":1,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":2,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":2,"plasma grenade headshot kills":0,"plasma grenade deaths":1,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Tetracide","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":15,"battle rifle headshot kills":14,"battle rifle deaths":13,"battle rifle suicide":1,"battle rifle shots fired":787,"battle rifle shots hit":284,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":2,"sniper rifle headshot kills":2,"sniper rifle deaths":1,"sniper rifle suicide":0,"sniper rifle shots fired":8,"sniper rifle shots hit":4,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":2,"energy sword headshot kills":0,"energy sword deaths":1,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":4,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":2,"plasma grenade headshot kills":0,"plasma grenade deaths":1,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Rocky","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":15,"battle rifle headshot kills":13,"battle rifle deaths":10,"battle rifle suicide":0,"battle rifle shots fired":766,"battle rifle shots hit":241,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":2,"shotgun headshot kills":0,"shotgun deaths":1,"shotgun suicide":0,"shotgun shots fired":4,"shotgun shots hit":4,"sniper rifle kills":2,"sniper rifle headshot kills":1,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":5,"sniper rifle shots hit":4,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":2,"energy sword headshot kills":0,"energy sword deaths":1,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":3,"frag grenade headshot kills":0,"frag grenade deaths":6,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":1,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"getitoutdaFLUD","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":12,"battle rifle headshot kills":10,"battle rifle deaths":17,"battle rifle suicide":0,"battle rifle shots fired":652,"battle rifle shots hit":303,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":2,"shotgun shots hit":2,"sniper rifle kills":3,"sniper rifle headshot kills":2,"sniper rifle deaths":2,"sniper rifle suicide":0,"sniper rifle shots fired":9,"sniper rifle shots hit":6,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":2,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":4,"frag grenade headshot kills":0,"frag grenade deaths":3,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":5,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"2D","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":15,"battle rifle headshot kills":13,"battle rifle deaths":15,"battle rifle suicide":0,"battle rifle shots fired":899,"battle rifle shots hit":321,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":1,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":1,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":1,"plasma grenade headshot kills":0,"plasma grenade deaths":2,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Ralph Port","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":14,"battle rifle headshot kills":12,"battle rifle deaths":25,"battle rifle suicide":0,"battle rifle shots fired":770,"battle rifle shots hit":338,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":1,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":2,"shotgun shots hit":2,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":2,"sniper rifle suicide":0,"sniper rifle shots fired":3,"sniper rifle shots hit":1,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":2,"frag grenade headshot kills":0,"frag grenade deaths":3,"frag grenade suicide":1,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":1,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"KidMode","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":28,"battle rifle headshot kills":24,"battle rifle deaths":15,"battle rifle suicide":1,"battle rifle shots fired":1102,"battle rifle shots hit":459,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":1,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":4,"shotgun shots hit":4,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":2,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":1,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":6,"frag grenade headshot kills":0,"frag grenade deaths":5,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":2,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0}],"source_file":"20251128_204504.xlsx","playlist":"MLG 4v4"},{"details":{"Game Type":"slayer","Variant Name":"MLG TS 2007","Map Name":"Warlock","Start Time":"11/28/2025 20:45","End Time":"11/28/2025 20:50","Duration":"04:39"},"players":[{"name":"EpiiiC","place":"1st","score":"17","score_numeric":17,"kills":17,"deaths":10,"assists":4,"kda":2.1,"suicides":0,"team":"Red","shots_fired":370,"shots_hit":179,"accuracy":48.38,"head_shots":13},{"name":"Tetracide","place":"1st","score":"16","score_numeric":16,"kills":16,"deaths":6,"assists":6,"kda":3.667,"suicides":0,"team":"Red","shots_fired":368,"shots_hit":167,"accuracy":45.38,"head_shots":11},{"name":"KidMode","place":"1st","score":"10","score_numeric":10,"kills":10,"deaths":7,"assists":7,"kda":2.429,"suicides":0,"team":"Red","shots_fired":376,"shots_hit":126,"accuracy":33.51,"head_shots":7},{"name":"2D","place":"1st","score":"7","score_numeric":7,"kills":7,"deaths":9,"assists":10,"kda":1.889,"suicides":1,"team":"Red","shots_fired":348,"shots_hit":149,"accuracy":42.82,"head_shots":6},{"name":"getitoutdaFLUD","place":"2nd","score":"10","score_numeric":10,"kills":10,"deaths":14,"assists":7,"kda":1.214,"suicides":0,"team":"Blue","shots_fired":242,"shots_hit":113,"accuracy":46.69,"head_shots":5},{"name":"Ralph Port","place":"2nd","score":"9","score_numeric":9,"kills":9,"deaths":12,"assists":7,"kda":1.333,"suicides":0,"team":"Blue","shots_fired":313,"shots_hit":135,"accuracy":43.13,"head_shots":5},{"name":"Rocky","place":"2nd","score":"8","score_numeric":8,"kills":8,"deaths":12,"assists":7,"kda":1.25,"suicides":1,"team":"Blue","shots_fired":319,"shots_hit":158,"accuracy":49.53,"head_shots":6},{"name":"roasted","place":"2nd","score":"5","score_numeric":5,"kills":5,"deaths":12,"assists":9,"kda":1.167,"suicides":0,"team":"Blue","shots_fired":246,"shots_hit":102,"accuracy":41.46,"head_shots":3}],"versus":{"EpiiiC":{"EpiiiC":0,"Tetracide":0,"KidMode":0,"2D":0,"getitoutdaFLUD":1,"Ralph Port":5,"Rocky":6,"roasted":5},"Tetracide":{"EpiiiC":0,"Tetracide":0,"KidMode":0,"2D":0,"getitoutdaFLUD":4,"Ralph Port":2,"Rocky":5,"roasted":5},"KidMode":{"EpiiiC":0,"Tetracide":0,"KidMode":0,"2D":0,"getitoutdaFLUD":7,"Ralph Port":2,"Rocky":0,"roasted":1},"2D":{"EpiiiC":0,"Tetracide":0,"KidMode":0,"2D":0,"getitoutdaFLUD":2,"Ralph Port":3,"Rocky":1,"roasted":1},"getitoutdaFLUD":{"EpiiiC":4,"Tetracide":3,"KidMode":2,"2D":1,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0},"Ralph Port":{"EpiiiC":3,"Tetracide":0,"KidMode":2,"2D":4,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0},"Rocky":{"EpiiiC":3,"Tetracide":1,"KidMode":3,"2D":1,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0},"roasted":{"EpiiiC":0,"Tetracide":2,"KidMode":0,"2D":3,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0}},"detailed_stats":[{"player":"EpiiiC","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=12&S=0&EP=1&ES=0&EF=52&EB=14&ET=0","kills":16,"assists":4,"deaths":10,"headshots":12,"betrayals":0,"suicides":0,"best_spree":4,"total_time_alive":224,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"roasted","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=2&EP=0&ES=2&EF=22&EB=14&ET=0","kills":5,"assists":9,"deaths":12,"headshots":3,"betrayals":0,"suicides":0,"best_spree":2,"total_time_alive":213,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Tetracide","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=12&EP=4&ES=3&EF=22&EB=14&ET=0","kills":16,"assists":6,"deaths":6,"headshots":11,"betrayals":0,"suicides":0,"best_spree":6,"total_time_alive":244,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Rocky","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=11&S=1&EP=1&ES=0&EF=58&EB=0&ET=0","kills":8,"assists":7,"deaths":12,"headshots":6,"betrayals":0,"suicides":1,"best_spree":2,"total_time_alive":212,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"getitoutdaFLUD","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=13&S=4&EP=13&ES=4&EF=6&EB=13&ET=0","kills":10,"assists":7,"deaths":14,"headshots":5,"betrayals":0,"suicides":0,"best_spree":2,"total_time_alive":203,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"2D","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=0&S=0&EP=0&ES=2&EF=5&EB=0&ET=0","kills":7,"assists":10,"deaths":9,"headshots":6,"betrayals":0,"suicides":1,"best_spree":2,"total_time_alive":228,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Ralph Port","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=2&S=0&EP=7&ES=6&EF=25&EB=4&ET=0","kills":9,"assists":7,"deaths":11,"headshots":5,"betrayals":0,"suicides":0,"best_spree":3,"total_time_alive":218,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"KidMode","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=0&EP=1&ES=0&EF=57&EB=5&ET=0","kills":10,"assists":6,"deaths":7,"headshots":7,"betrayals":0,"suicides":0,"best_spree":4,"total_time_alive":240,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0}],"medals":[{"player":"EpiiiC","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"roasted","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Tetracide","double_kill":2,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":1,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":1,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Rocky","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":2,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"getitoutdaFLUD","double_kill":2,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":0,"assassin":2,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"2D","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":1,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Ralph Port","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":1,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"KidMode","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":2,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0}],"weapons":[{"Player":"EpiiiC","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":12,"battle rifle headshot kills":12,"battle rifle deaths":5,"battle rifle suicide":0,"battle rifle shots fired":368,"battle rifle shots hit":178,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":1,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":4,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"roasted","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":4,"battle rifle headshot kills":3,"battle rifle deaths":8,"battle rifle suicide":0,"battle rifle shots fired":246,"battle rifle shots hit":102,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":1,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Tetracide","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":12,"battle rifle headshot kills":11,"battle rifle deaths":4,"battle rifle suicide":0,"battle rifle shots fired":366,"battle rifle shots hit":165,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":1,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":2,"shotgun shots hit":2,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Rocky","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":6,"battle rifle headshot kills":6,"battle rifle deaths":10,"battle rifle suicide":0,"battle rifle shots fired":319,"battle rifle shots hit":158,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":1,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"getitoutdaFLUD","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":5,"battle rifle headshot kills":5,"battle rifle deaths":11,"battle rifle suicide":0,"battle rifle shots fired":240,"battle rifle shots hit":111,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":1,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":2,"shotgun shots hit":2,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":2,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"2D","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":6,"battle rifle headshot kills":6,"battle rifle deaths":7,"battle rifle suicide":1,"battle rifle shots fired":348,"battle rifle shots hit":149,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Ralph Port","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":6,"battle rifle headshot kills":5,"battle rifle deaths":8,"battle rifle suicide":0,"battle rifle shots fired":313,"battle rifle shots hit":135,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"KidMode","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":7,"battle rifle headshot kills":7,"battle rifle deaths":5,"battle rifle suicide":0,"battle rifle shots fired":372,"battle rifle shots hit":123,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":1,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":0,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":0,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0}],"source_file":"20251128_205019.xlsx","playlist":"MLG 4v4"},{"details":{"Game Type":"capture_the_flag","Variant Name":"MLG CTF Sanc","Map Name":"Sanctuary","Start Time":"11/28/2025 20:50","End Time":"11/28/2025 21:05","Duration":"15:01"},"players":[{"name":"Tetracide","place":"1st","score":"1","score_numeric":1,"kills":19,"deaths":21,"assists":9,"kda":1.333,"suicides":0,"team":"Red","shots_fired":869,"shots_hit":253,"accuracy":29.11,"head_shots":16},{"name":"KidMode","place":"1st","score":"0","score_numeric":0,"kills":25,"deaths":12,"assists":14,"kda":3.25,"suicides":0,"team":"Red","shots_fired":609,"shots_hit":261,"accuracy":42.86,"head_shots":18},{"name":"2D","place":"1st","score":"0","score_numeric":0,"kills":21,"deaths":26,"assists":10,"kda":1.192,"suicides":0,"team":"Red","shots_fired":617,"shots_hit":227,"accuracy":36.79,"head_shots":13},{"name":"EpiiiC","place":"1st","score":"0","score_numeric":0,"kills":34,"deaths":20,"assists":15,"kda":2.45,"suicides":0,"team":"Red","shots_fired":942,"shots_hit":380,"accuracy":40.34,"head_shots":26},{"name":"getitoutdaFLUD","place":"2nd","score":"0","score_numeric":0,"kills":26,"deaths":19,"assists":12,"kda":2.0,"suicides":0,"team":"Blue","shots_fired":589,"shots_hit":270,"accuracy":45.84,"head_shots":21},{"name":"Ralph Port","place":"2nd","score":"0","score_numeric":0,"kills":19,"deaths":25,"assists":10,"kda":1.16,"suicides":0,"team":"Blue","shots_fired":588,"shots_hit":272,"accuracy":46.26,"head_shots":14},{"name":"Rocky","place":"2nd","score":"0","score_numeric":0,"kills":22,"deaths":26,"assists":11,"kda":1.269,"suicides":0,"team":"Blue","shots_fired":944,"shots_hit":343,"accuracy":36.33,"head_shots":14},{"name":"roasted","place":"2nd","score":"0","score_numeric":0,"kills":11,"deaths":29,"assists":11,"kda":0.759,"suicides":0,"team":"Blue","shots_fired":524,"shots_hit":194,"accuracy":37.02,"head_shots":7}],"versus":{"Tetracide":{"Tetracide":0,"KidMode":0,"2D":0,"EpiiiC":0,"getitoutdaFLUD":7,"Ralph Port":3,"Rocky":5,"roasted":4},"KidMode":{"Tetracide":0,"KidMode":0,"2D":1,"EpiiiC":0,"getitoutdaFLUD":5,"Ralph Port":11,"Rocky":2,"roasted":7},"2D":{"Tetracide":0,"KidMode":0,"2D":0,"EpiiiC":0,"getitoutdaFLUD":2,"Ralph Port":4,"Rocky":9,"roasted":6},"EpiiiC":{"Tetracide":0,"KidMode":0,"2D":0,"EpiiiC":0,"getitoutdaFLUD":5,"Ralph Port":7,"Rocky":10,"roasted":12},"getitoutdaFLUD":{"Tetracide":7,"KidMode":2,"2D":9,"EpiiiC":8,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0},"Ralph Port":{"Tetracide":4,"KidMode":4,"2D":6,"EpiiiC":5,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0},"Rocky":{"Tetracide":6,"KidMode":5,"2D":5,"EpiiiC":6,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0},"roasted":{"Tetracide":4,"KidMode":1,"2D":5,"EpiiiC":1,"getitoutdaFLUD":0,"Ralph Port":0,"Rocky":0,"roasted":0}},"detailed_stats":[{"player":"EpiiiC","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=12&S=0&EP=1&ES=0&EF=52&EB=14&ET=0","kills":34,"assists":15,"deaths":20,"headshots":26,"betrayals":0,"suicides":0,"best_spree":5,"total_time_alive":696,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":1},{"player":"roasted","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=2&EP=0&ES=2&EF=22&EB=14&ET=0","kills":11,"assists":11,"deaths":29,"headshots":7,"betrayals":0,"suicides":0,"best_spree":2,"total_time_alive":599,"ctf_scores":0,"ctf_flag_steals":2,"ctf_flag_saves":0},{"player":"Tetracide","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=12&EP=4&ES=3&EF=22&EB=14&ET=0","kills":19,"assists":9,"deaths":21,"headshots":16,"betrayals":0,"suicides":0,"best_spree":3,"total_time_alive":680,"ctf_scores":1,"ctf_flag_steals":0,"ctf_flag_saves":1},{"player":"Rocky","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=11&S=1&EP=1&ES=0&EF=58&EB=0&ET=0","kills":22,"assists":11,"deaths":26,"headshots":14,"betrayals":0,"suicides":0,"best_spree":3,"total_time_alive":630,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"getitoutdaFLUD","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=13&S=4&EP=13&ES=4&EF=6&EB=13&ET=0","kills":26,"assists":12,"deaths":19,"headshots":21,"betrayals":0,"suicides":0,"best_spree":7,"total_time_alive":700,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"2D","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=0&S=0&EP=0&ES=2&EF=5&EB=0&ET=0","kills":21,"assists":10,"deaths":26,"headshots":13,"betrayals":0,"suicides":0,"best_spree":5,"total_time_alive":625,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"Ralph Port","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=2&S=0&EP=7&ES=6&EF=25&EB=4&ET=0","kills":19,"assists":10,"deaths":25,"headshots":14,"betrayals":0,"suicides":0,"best_spree":3,"total_time_alive":639,"ctf_scores":0,"ctf_flag_steals":0,"ctf_flag_saves":0},{"player":"KidMode","emblem_url":"https://www.halo2pc.com/test-pages/CartoStat/Emblem/emblem.php?P=1&S=0&EP=1&ES=0&EF=57&EB=5&ET=0","kills":25,"assists":14,"deaths":12,"headshots":18,"betrayals":1,"suicides":0,"best_spree":8,"total_time_alive":773,"ctf_scores":0,"ctf_flag_steals":1,"ctf_flag_saves":1}],"medals":[{"player":"EpiiiC","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":3,"road_kill":0,"bone_cracker":1,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":2,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":1,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"roasted","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":3,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":2,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Tetracide","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":1,"road_kill":0,"bone_cracker":1,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":1,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":1,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Rocky","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":2,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"getitoutdaFLUD","double_kill":1,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":8,"road_kill":0,"bone_cracker":0,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":2,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"2D","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":4,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":1,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"Ralph Port","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":0,"road_kill":0,"bone_cracker":4,"assassin":0,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":0,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":0,"flag_carrier_kill":0,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0},{"player":"KidMode","double_kill":0,"triple_kill":0,"killtacular":0,"kill_frenzy":0,"killtrocity":0,"killamanjaro":0,"sniper_kill":6,"road_kill":0,"bone_cracker":0,"assassin":1,"vehicle_destroyed":0,"car_jacking":0,"stick_it":0,"killing_spree":1,"running_riot":0,"rampage":0,"beserker":0,"over_kill":0,"flag_taken":1,"flag_carrier_kill":1,"flag_returned":0,"bomb_planted":0,"bomb_carrier_kill":0,"bomb_returned":0}],"weapons":[{"Player":"EpiiiC","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":3,"plasma pistol shots hit":2,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":26,"battle rifle headshot kills":23,"battle rifle deaths":10,"battle rifle suicide":0,"battle rifle shots fired":930,"battle rifle shots hit":373,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":3,"sniper rifle headshot kills":3,"sniper rifle deaths":4,"sniper rifle suicide":0,"sniper rifle shots fired":9,"sniper rifle shots hit":5,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":3,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"roasted","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":6,"plasma pistol shots hit":3,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":8,"battle rifle headshot kills":7,"battle rifle deaths":19,"battle rifle suicide":0,"battle rifle shots fired":503,"battle rifle shots hit":189,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":14,"carbine shots hit":2,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":1,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":3,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":1,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":0,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":1,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Tetracide","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":1,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":2,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":15,"battle rifle headshot kills":15,"battle rifle deaths":15,"battle rifle suicide":0,"battle rifle shots fired":854,"battle rifle shots hit":251,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":1,"sniper rifle headshot kills":1,"sniper rifle deaths":2,"sniper rifle suicide":0,"sniper rifle shots fired":12,"sniper rifle shots hit":2,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":2,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":1,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Rocky","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":15,"battle rifle headshot kills":14,"battle rifle deaths":15,"battle rifle suicide":0,"battle rifle shots fired":943,"battle rifle shots hit":343,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":2,"sniper rifle suicide":0,"sniper rifle shots fired":1,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":2,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":4,"frag grenade headshot kills":0,"frag grenade deaths":4,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"getitoutdaFLUD","magnum kills":0,"magnum headshot kills":0,"magnum deaths":1,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":0,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":16,"battle rifle headshot kills":15,"battle rifle deaths":16,"battle rifle suicide":0,"battle rifle shots fired":565,"battle rifle shots hit":254,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":8,"sniper rifle headshot kills":6,"sniper rifle deaths":1,"sniper rifle suicide":0,"sniper rifle shots fired":24,"sniper rifle shots hit":16,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":2,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"2D","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":1,"plasma pistol shots hit":0,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":14,"battle rifle headshot kills":13,"battle rifle deaths":18,"battle rifle suicide":0,"battle rifle shots fired":616,"battle rifle shots hit":227,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":2,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":2,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":2,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"Ralph Port","magnum kills":0,"magnum headshot kills":0,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":0,"magnum shots hit":0,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":1,"plasma pistol shots hit":1,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":14,"battle rifle headshot kills":14,"battle rifle deaths":19,"battle rifle suicide":0,"battle rifle shots fired":587,"battle rifle shots hit":271,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":0,"sniper rifle headshot kills":0,"sniper rifle deaths":4,"sniper rifle suicide":0,"sniper rifle shots fired":0,"sniper rifle shots hit":0,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":1,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":1,"frag grenade headshot kills":0,"frag grenade deaths":2,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0},{"Player":"KidMode","magnum kills":1,"magnum headshot kills":1,"magnum deaths":0,"magnum suicide":0,"magnum shots fired":6,"magnum shots hit":2,"plasma pistol kills":0,"plasma pistol headshot kills":0,"plasma pistol deaths":0,"plasma pistol suicide":0,"plasma pistol shots fired":8,"plasma pistol shots hit":4,"needler kills":0,"needler headshot kills":0,"needler deaths":0,"needler suicide":0,"needler shots fired":0,"needler shots hit":0,"smg kills":0,"smg headshot kills":0,"smg deaths":0,"smg suicide":0,"smg shots fired":0,"smg shots hit":0,"plasma rifle kills":0,"plasma rifle headshot kills":0,"plasma rifle deaths":0,"plasma rifle suicide":0,"plasma rifle shots fired":0,"plasma rifle shots hit":0,"battle rifle kills":14,"battle rifle headshot kills":12,"battle rifle deaths":10,"battle rifle suicide":0,"battle rifle shots fired":566,"battle rifle shots hit":242,"carbine kills":0,"carbine headshot kills":0,"carbine deaths":0,"carbine suicide":0,"carbine shots fired":0,"carbine shots hit":0,"shotgun kills":0,"shotgun headshot kills":0,"shotgun deaths":0,"shotgun suicide":0,"shotgun shots fired":0,"shotgun shots hit":0,"sniper rifle kills":6,"sniper rifle headshot kills":5,"sniper rifle deaths":1,"sniper rifle suicide":0,"sniper rifle shots fired":29,"sniper rifle shots hit":13,"beam rifle kills":0,"beam rifle headshot kills":0,"beam rifle deaths":0,"beam rifle suicide":0,"beam rifle shots fired":0,"beam rifle shots hit":0,"brute plasma rifle kills":0,"brute plasma rifle headshot kills":0,"brute plasma rifle deaths":0,"brute plasma rifle suicide":0,"brute plasma rifle shots fired":0,"brute plasma rifle shots hit":0,"rocket launcher kills":0,"rocket launcher headshot kills":0,"rocket launcher deaths":0,"rocket launcher suicide":0,"rocket launcher shots fired":0,"rocket launcher shots hit":0,"fuel rod kills":0,"fuel rod headshot kills":0,"fuel rod deaths":0,"fuel rod suicide":0,"fuel rod shots fired":0,"fuel rod shots hit":0,"brute shot kills":0,"brute shot headshot kills":0,"brute shot deaths":0,"brute shot suicide":0,"brute shot shots fired":0,"brute shot shots hit":0,"unused 1 kills":0,"unused 1 headshot kills":0,"unused 1 deaths":0,"unused 1 suicide":0,"unused 1 shots fired":0,"unused 1 shots hit":0,"sentinal beam kills":0,"sentinal beam headshot kills":0,"sentinal beam deaths":0,"sentinal beam suicide":0,"sentinal beam shots fired":0,"sentinal beam shots hit":0,"unused 2 kills":0,"unused 2 headshot kills":0,"unused 2 deaths":0,"unused 2 suicide":0,"unused 2 shots fired":0,"unused 2 shots hit":0,"energy sword kills":0,"energy sword headshot kills":0,"energy sword deaths":0,"energy sword suicide":0,"energy sword shots fired":0,"energy sword shots hit":0,"frag grenade kills":3,"frag grenade headshot kills":0,"frag grenade deaths":1,"frag grenade suicide":0,"frag grenade shots fired":0,"frag grenade shots hit":0,"plasma grenade kills":0,"plasma grenade headshot kills":0,"plasma grenade deaths":0,"plasma grenade suicide":0,"plasma grenade shots fired":0,"plasma grenade shots hit":0,"flag kills":0,"flag headshot kills":0,"flag deaths":0,"flag suicide":0,"flag shots fired":0,"flag shots hit":0,"bomb kills":0,"bomb headshot kills":0,"bomb deaths":0,"bomb suicide":0,"bomb shots fired":0,"bomb shots hit":0,"oddball kills":0,"oddball headshot kills":0,"oddball deaths":0,"oddball suicide":0,"oddball shots fired":0,"oddball shots hit":0}],"source_file":"20251128_210553.xlsx","playlist":"MLG 4v4"}];
+let rankStats = {"1136095104663306240":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":950,"discord_name":"Hyrax","twitch_name":"hyrax__","twitch_url":"https://twitch.tv/hyrax__","rank":1},"283293015135748097":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"Dirk","twitch_name":"ogdirk","twitch_url":"https://twitch.tv/ogdirk","rank":1},"269681242335739905":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"Keylord","twitch_name":"justinkeylord","twitch_url":"https://twitch.tv/justinkeylord","alias":"keylord","rank":1},"132652800378142720":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1100,"discord_name":"Hammie","twitch_name":"ai2ejay","twitch_url":"https://twitch.tv/ai2ejay","alias":"RJ","rank":1},"136324687926919168":{"xp":190,"wins":2,"losses":3,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":750,"discord_name":"roasted","twitch_name":"h2roasted","twitch_url":"https://twitch.tv/h2roasted","rank":3,"MLG 4v4":3,"highest_rank":3,"kills":64,"deaths":111,"assists":57,"headshots":37},"426757496557010948":{"xp":190,"wins":2,"losses":3,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":1075,"discord_name":"Rocky","twitch_name":"c6rocky","twitch_url":"https://twitch.tv/c6rocky","rank":3,"MLG 4v4":3,"highest_rank":3,"kills":94,"deaths":95,"assists":47,"headshots":55},"412829053603807232":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":700,"discord_name":"Lefty","rank":1},"232556390839746560":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":925,"discord_name":"DSJ","rank":1},"293794892893782017":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"FrEnZy","twitch_name":"trailerparkrich","twitch_url":"https://twitch.tv/trailerparkrich","rank":1},"293507586131492864":{"xp":296,"wins":3,"losses":2,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":1100,"discord_name":"Prince KidMode","twitch_name":"kidm0de","twitch_url":"https://twitch.tv/kidm0de","rank":4,"MLG 4v4":4,"highest_rank":4,"kills":104,"deaths":79,"assists":49,"headshots":72},"284010072504270849":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":750,"discord_name":"DU7S","twitch_name":"du7s","twitch_url":"https://twitch.tv/du7s","rank":1},"299780772456431627":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":800,"discord_name":"Gava","rank":1},"210187331066396672":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":800,"discord_name":"Rinser","twitch_name":"mrwelfares","twitch_url":"https://twitch.tv/mrwelfares","rank":1},"334212655613214721":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1400,"discord_name":"fluhd","twitch_name":"floodandshiro","twitch_url":"https://twitch.tv/floodandshiro","rank":1},"212720585279537153":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":711,"discord_name":"Punny88","rank":1},"385632391089356810":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":950,"discord_name":"KraN","twitch_name":"kranlive","twitch_url":"https://twitch.tv/kranlive","rank":1},"1222926448084520970":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":250,"discord_name":"Old Man","twitch_name":"old_man_halo","twitch_url":"https://twitch.tv/old_man_halo","rank":1},"165626999891689474":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":950,"discord_name":"SHOW5TOPPER","rank":1},"486628967760003085":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":950,"discord_name":"NaDeShY","twitch_name":"nadeshy","twitch_url":"https://twitch.tv/nadeshy","rank":1},"558138736966238219":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1200,"discord_name":"waRRior Fresh","rank":1},"294558721474953219":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":750,"discord_name":"bignami","rank":1},"395302282914168852":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1550,"discord_name":"TimRager","rank":1},"859153194839965718":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1150,"discord_name":"Curts GLORY","twitch_name":"Curtsglory","twitch_url":"https://twitch.tv/Curtsglory","rank":1},"943239550782803988":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":600,"discord_name":"xX daVe Xx","rank":1},"771859735938072596":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":700,"discord_name":"JUiCE","rank":1},"554332927614517269":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"TGS NaTuRaL","rank":1},"658102055696859156":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":500,"discord_name":"-NeiLuZ-","rank":1},"384701805944111128":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":750,"discord_name":"Overseasons","rank":1},"141912473744703489":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":600,"discord_name":"LiaM","rank":1},"556272092408971294":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1300,"discord_name":"Dro","rank":1},"156907171433414656":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1050,"discord_name":"Lethal_HT","twitch_name":"lethal_ht","twitch_url":"https://twitch.tv/lethal_ht","alias":"lethal_ht","rank":1},"900612436686680095":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":300,"discord_name":"T.Robs","rank":1},"652998057087991838":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"TwoDashAngo","rank":1},"1380083223937290272":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":950,"discord_name":"Mr i Hockey","rank":1},"314217230390919174":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":850,"discord_name":"popq2","rank":1},"1179648030375424032":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1200,"discord_name":"Ben","rank":1},"1324420042494050338":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":800,"discord_name":"DrugAbuse goose \ud83c\uddfa\ud83c\uddf8","rank":1},"359216128959971329":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1650,"discord_name":"Hypnox","twitch_name":"hyp_nox","twitch_url":"https://twitch.tv/hyp_nox","alias":"Hypnosis","rank":1},"276552139084398592":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1325,"discord_name":"WoGG","rank":1},"639932733392683048":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1300,"discord_name":"fricken (retired)","rank":1},"980246369161855017":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":500,"discord_name":"Byceps","rank":1},"884896715432411178":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":850,"discord_name":"I2aMpAnT","twitch_name":"i2ampant_Gaming","twitch_url":"https://twitch.tv/i2ampant_Gaming","rank":1},"601594438233620521":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1000,"discord_name":"MadMikeWillEatU","rank":1},"173926727117045760":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1650,"discord_name":"Gor3","rank":1},"907034559248482314":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":200,"discord_name":"MohnJorrow","rank":1},"951202518396977203":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":362,"discord_name":"Wrecktangle\u2019s Mic","rank":1},"797210177786347530":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1200,"discord_name":"future trunks","rank":1},"213096674023833610":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":800,"discord_name":"Faulty","twitch_name":"texjas","twitch_url":"https://twitch.tv/texjas","rank":1},"176191518837702666":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"J2","rank":1},"225563156397686786":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"Sup","rank":1},"795707878388137995":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"Sauce","rank":1},"241980128631062539":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":700,"discord_name":"Conflictz","rank":1},"694412691015598140":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":700,"discord_name":"simon hagiwara","twitch_name":"spencerbrown","twitch_url":"https://twitch.tv/spencerbrown","rank":1},"851303681897791548":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":249,"discord_name":"Genkinz","twitch_name":"genkinz","twitch_url":"https://twitch.tv/genkinz","rank":1},"1351057247437852733":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1000,"discord_name":"GoonerRat","rank":1},"736026857572401214":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":400,"discord_name":"heyitsarcadia","rank":1},"359472455259127820":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":500,"discord_name":"GT: HeroicFool69 (Stormcrow2)","rank":1},"1126543913654698044":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":500,"discord_name":"Skaduf The Greatest Halo Player","twitch_name":"skaduf","twitch_url":"https://twitch.tv/skaduf","rank":1},"1118666385921425478":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":500,"discord_name":"oKrazed","rank":1},"1155320421672046672":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":750,"discord_name":"Csquared","rank":1},"1258601786533609554":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"Burn iTz","rank":1},"710585633474740306":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1000,"discord_name":"VirulentGrunt","rank":1},"1051302763633573978":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":750,"discord_name":"NomeOGx3","rank":1},"1218796844088430692":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":725,"discord_name":"ll Legend ll","twitch_name":"LtzLegend_","twitch_url":"https://twitch.tv/LtzLegend_","rank":1},"1343263695769305190":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":100,"discord_name":"Lux","rank":1},"1233040240210477160":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":600,"discord_name":"TeoulisComple \ud83c\uddec\ud83c\uddf7","twitch_name":"teouliscompleq","twitch_url":"https://twitch.tv/teouliscompleq","alias":"happyhippoheythere","rank":1},"196752652569149440":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1200,"discord_name":"BliNdFiRe","rank":1},"1348067996761063535":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":850,"discord_name":"Zony","rank":1},"1393893716338540675":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":600,"discord_name":"lzl WeakSide","rank":1},"161726300304834560":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":500,"discord_name":"Jay2","rank":1},"210280313262309376":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1050,"discord_name":"Grave","rank":1},"174522691917840384":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"BxSouljah","rank":1},"154836949964816384":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":900,"discord_name":"H4","rank":1},"198564445105029120":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":750,"discord_name":"Vonlionton","rank":1},"205738438773833728":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1400,"discord_name":"Xanticity","rank":1},"799264724021280768":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":750,"discord_name":"SoldieR","rank":1},"164725201907613696":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1350,"discord_name":"James | The Frenetic","twitch_name":"thefrenetic","twitch_url":"https://twitch.tv/thefrenetic","rank":1},"135116534388490240":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":850,"discord_name":"J1","rank":1},"296360818465964032":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":650,"discord_name":"Pinesauce","rank":1},"1040724126836457624":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":463,"discord_name":"M15F1T","rank":1},"653385687852253215":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":600,"discord_name":"DomerSimpson","twitch_name":"domer_simpson_","twitch_url":"https://twitch.tv/domer_simpson_","alias":"domer_simpson","rank":1},"352157745530667009":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":600,"discord_name":"TwoCaribous","rank":1},"274372368686776321":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1400,"discord_name":"sneakybeav3r","twitch_name":"SneeakyBeav3r","twitch_url":"https://twitch.tv/SneeakyBeav3r","rank":1},"156973309722886144":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":450,"discord_name":"LD50 II","twitch_name":"LD50_II","twitch_url":"https://twitch.tv/LD50_II","alias":"ld50_ii","rank":1},"173928028173369345":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1100,"discord_name":"ZeeD","rank":1},"175415359703089152":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1350,"discord_name":"Obi Juan","twitch_name":"defensevpower","twitch_url":"https://twitch.tv/defensevpower","rank":1},"390747330631958528":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1750,"discord_name":"cOn","rank":1},"180809401228197889":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":2000,"discord_name":"StoRmY v2","twitch_name":"Stormy_v2","twitch_url":"https://twitch.tv/Stormy_v2","rank":1},"164177623163994113":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1150,"discord_name":"WildCherry","rank":1},"174366760479358976":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1100,"discord_name":"Mathlete","rank":1},"107703779188580352":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1176,"discord_name":"helldotcom","rank":1},"111190770756657152":{"xp":296,"wins":3,"losses":2,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":1400,"discord_name":"EpiiiC","twitch_name":"e212","twitch_url":"https://twitch.tv/e212","rank":4,"MLG 4v4":4,"highest_rank":4,"kills":124,"deaths":85,"assists":66,"headshots":90},"84785392234012672":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":800,"discord_name":"re4thewin","rank":1},"335626718062837760":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":600,"discord_name":"LosOjosRojos","twitch_name":"LosOjosRojos_H2","twitch_url":"https://twitch.tv/LosOjosRojos_H2","alias":"losojosrojos","rank":1},"291104674839527424":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1000,"discord_name":"Siko","rank":1},"301971773077848064":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":100,"discord_name":"Korin","rank":1},"188009416556150784":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1450,"discord_name":"side","rank":1},"772288046905032704":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1300,"discord_name":"UltiMeGa","rank":1},"598584495641198592":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1500,"discord_name":"Welchs","rank":1},"167766278860177408":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":800,"discord_name":"CYRiX","rank":1},"177913649728323584":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1500,"discord_name":"Kryptonite","twitch_name":"slikryptoniite","twitch_url":"https://twitch.tv/slikryptoniite","rank":1},"187356723135119360":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1000,"discord_name":"Cortalisk","rank":1},"155302533345050624":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1500,"discord_name":"Famous","rank":1},"168151188741685248":{"xp":0,"wins":0,"losses":0,"series_wins":0,"series_losses":0,"total_games":0,"total_series":0,"mmr":1200,"discord_name":"AfroMaN","rank":1},"449344331426203546":{"xp":296,"wins":3,"losses":2,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":750,"discord_name":"2D","rank":4,"MLG 4v4":4,"highest_rank":4,"kills":74,"deaths":102,"assists":57,"headshots":50},"460394656304217571":{"xp":296,"wins":3,"losses":2,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":750,"discord_name":"Tetracide","rank":4,"MLG 4v4":4,"highest_rank":4,"kills":97,"deaths":79,"assists":48,"headshots":69},"467006237617687770":{"xp":190,"wins":2,"losses":3,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":750,"discord_name":"Ralph Port","rank":3,"MLG 4v4":3,"highest_rank":3,"kills":80,"deaths":104,"assists":56,"headshots":49},"270437833351157432":{"xp":190,"wins":2,"losses":3,"series_wins":0,"series_losses":0,"total_games":5,"total_series":0,"mmr":750,"discord_name":"getitoutdaFLUD","rank":3,"MLG 4v4":3,"highest_rank":3,"kills":105,"deaths":90,"assists":50,"headshots":70}};
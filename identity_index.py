@@ -0,0 +1,200 @@
+"""
+identity_index.py - Persistent in-game name -> Discord user_id index
+
+Matching an in-game name to a player used to rebuild a lookup from players.json
+on every run and then scan every rankstats.json entry's discord_name. This index
+keeps every name a user is known by, normalized, in identity_index.json:
+
+- stats_profile (from identity sync, MAC-linked)
+- aliases (from /linkalias)
+- display_name
+- discord_name (from rankstats.json)
+
+refresh_identity_index() only touches the users whose names changed, so keeping it current
+after players.json or rankstats.json changes is cheap. When two users claim
+the same name, lookup() prefers the stronger source (in the order above) and
+collisions() reports the clash.
+
+Used by populate_stats.py and by the bot (/linkalias).
+
+Usage:
+    import identity_index
+    index = identity_index.load_identity_index()
+    identity_index.refresh_identity_index(index, players, rankstats)
+    user_id = index.lookup('Rocky', valid_ids=rankstats)
+    identity_index.save_identity_index(index)
+"""
+
+import json
+import os
+
+IDENTITY_INDEX_FILE = 'identity_index.json'
+
+# Bump when normalization or the stored layout changes; an old index is rebuilt
+IDENTITY_INDEX_VERSION = 1
+
+# Lower wins when different users claim the same name
+SOURCE_PRIORITY = {'stats_profile': 0, 'alias': 1, 'display_name': 2, 'discord_name': 3}
+
+# Index shared by get_identity_index() callers in this process
+_INDEX_CACHE = None
+
+
+def normalize_name(name):
+    """Normalize an in-game or Discord name for matching."""
+    return str(name).strip().lower()
+
+def player_names(data):
+    """Get the [normalized name, source] pairs a players.json entry is known by."""
+    names = []
+    if data.get('stats_profile'):
+        names.append([normalize_name(data['stats_profile']), 'stats_profile'])
+    for alias in data.get('aliases', []):
+        if alias:
+            names.append([normalize_name(alias), 'alias'])
+    if data.get('display_name'):
+        names.append([normalize_name(data['display_name']), 'display_name'])
+    return names
+
+def rankstats_names(data):
+    """Get the [normalized name, source] pairs a rankstats.json entry is known by."""
+    if data.get('discord_name'):
+        return [[normalize_name(data['discord_name']), 'discord_name']]
+    return []
+
+
+class IdentityIndex:
+    """
+    Normalized name -> claiming user_ids.
+
+    entries holds each user's names per source file ('players', 'rankstats'),
+    claims holds {name: {user_id: best source priority}}.
+    """
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.entries = data.get('entries', {'players': {}, 'rankstats': {}})
+        self.claims = data.get('claims', {})
+
+    def to_json(self):
+        return {'version': IDENTITY_INDEX_VERSION, 'entries': self.entries, 'claims': self.claims}
+
+    def _reclaim(self, name, user_id):
+        """Recompute one user's claim on a name from their entries."""
+        priorities = [SOURCE_PRIORITY[source]
+                      for kind in self.entries.values()
+                      for entry_name, source in kind.get(user_id, [])
+                      if entry_name == name]
+        claimants = self.claims.setdefault(name, {})
+        if priorities:
+            claimants[user_id] = min(priorities)
+        else:
+            claimants.pop(user_id, None)
+            if not claimants:
+                del self.claims[name]
+
+    def set_names(self, kind, user_id, names):
+        """
+        Replace a user's names from one source file.
+
+        Returns:
+            True if anything changed
+        """
+        old = self.entries[kind].get(user_id, [])
+        if old == names:
+            return False
+        if names:
+            self.entries[kind][user_id] = names
+        else:
+            self.entries[kind].pop(user_id, None)
+        for name in {n for n, _ in old} | {n for n, _ in names}:
+            self._reclaim(name, user_id)
+        return True
+
+    def add_claim(self, name, user_id, source='discord_name'):
+        """Claim a name for a user not (yet) in the source files, e.g. a new rankstats entry."""
+        kind = 'rankstats' if source == 'discord_name' else 'players'
+        names = self.entries[kind].get(user_id, [])
+        pair = [normalize_name(name), source]
+        if pair not in names:
+            self.set_names(kind, user_id, names + [pair])
+
+    def claimants(self, name):
+        """Get [(user_id, source priority)] claiming a name, strongest first."""
+        claims = self.claims.get(normalize_name(name), {})
+        return sorted(claims.items(), key=lambda claim: (claim[1], claim[0]))
+
+    def lookup(self, name, valid_ids=None):
+        """
+        Get the user_id for a name, or None.
+
+        Args:
+            valid_ids: Only return users in this collection (e.g. rankstats);
+                weaker claims are tried if the strongest user isn't in it
+        """
+        for user_id, _ in self.claimants(name):
+            if valid_ids is None or user_id in valid_ids:
+                return user_id
+        return None
+
+    def linked_user(self, name):
+        """Get the strongest user claiming a name through players.json (stats_profile, alias, display_name), or None."""
+        for user_id, priority in self.claimants(name):
+            if priority < SOURCE_PRIORITY['discord_name']:
+                return user_id
+        return None
+
+    def collisions(self):
+        """Get {name: [user_id, ...]} for names claimed by more than one user, strongest first."""
+        return {name: [user_id for user_id, _ in self.claimants(name)]
+                for name, claims in self.claims.items() if len(claims) > 1}
+
+
+def load_identity_index(path=IDENTITY_INDEX_FILE):
+    """Load identity_index.json, or an empty index if it is missing or from another version."""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') == IDENTITY_INDEX_VERSION:
+            return IdentityIndex(data)
+    except:
+        pass
+    return IdentityIndex()
+
+def save_identity_index(index, path=IDENTITY_INDEX_FILE):
+    """Save identity_index.json (written to a temp file first so readers never see half a file)."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(index.to_json(), f)
+    os.replace(temp_path, path)
+
+def refresh_identity_index(index, players=None, rankstats=None):
+    """
+    Bring the index up to date with players.json and/or rankstats.json data.
+
+    Only users whose names changed are re-indexed.
+
+    Returns:
+        Number of users updated
+    """
+    updated = 0
+    for kind, data, extract in (('players', players, player_names), ('rankstats', rankstats, rankstats_names)):
+        if data is None:
+            continue
+        for user_id, entry in data.items():
+            updated += index.set_names(kind, user_id, extract(entry))
+        for user_id in [uid for uid in index.entries[kind] if uid not in data]:
+            updated += index.set_names(kind, user_id, [])
+    return updated
+
+def get_identity_index(players=None, rankstats=None, path=IDENTITY_INDEX_FILE):
+    """
+    Get the index shared by this process (loaded from disk once), refreshed
+    from the given players/rankstats data and saved if that changed anything.
+    """
+    global _INDEX_CACHE
+    if _INDEX_CACHE is None:
+        _INDEX_CACHE = load_identity_index(path)
+    if refresh_identity_index(_INDEX_CACHE, players, rankstats):
+        save_identity_index(_INDEX_CACHE, path)
+    return _INDEX_CACHE
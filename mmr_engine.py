@@ -0,0 +1,158 @@
+"""
+mmr_engine.py - Team skill ratings (MMR) computed from game results
+
+Team balancing reads each player's MMR. Instead of a hand-set number, the MMR
+is now a team Elo rating computed from the ranked game history:
+
+- A side's strength is the mean rating of its players
+- The winners' expected score is 1 / (1 + 10 ** ((losers - winners) / ELO_SCALE))
+- Every player moves by K * (result - expected), where K is PROVISIONAL_K_FACTOR
+  for a player's first PROVISIONAL_GAMES games, then K_FACTOR (new players
+  settle quickly, established players move slowly - the Glicko idea without
+  the bookkeeping)
+
+Ties and games without two sides don't change ratings.
+
+rate_matches() replays the whole history in one pass (100k 4v4 games take
+about a second, see benchmarks.py mmr); populate_stats.py recomputes every
+rating this way. rate_match() applies a single game, for the bot after each
+reported game.
+
+rankstats.json fields:
+    mmr_rating: the computed rating
+    mmr_games: rated games so far (picks the K factor)
+    mmr_offset: admin adjustment from /mmr (or the hand-set mmr an entry had
+        before ratings were computed, minus INITIAL_RATING), kept across recomputes
+    mmr: round(mmr_rating + mmr_offset) - what team balancing and leaderboards read
+
+Usage:
+    import mmr_engine
+    ratings, games_played = mmr_engine.rate_matches([(['111', '222'], ['333', '444']), ...])
+    mmr_engine.apply_ratings(rankstats, ratings, games_played)
+"""
+
+INITIAL_RATING = 1500
+ELO_SCALE = 400
+K_FACTOR = 24
+PROVISIONAL_K_FACTOR = 48
+PROVISIONAL_GAMES = 10
+
+
+def k_factor(games_played):
+    """Get the K factor for a player with this many rated games."""
+    return PROVISIONAL_K_FACTOR if games_played < PROVISIONAL_GAMES else K_FACTOR
+
+def expected_score(rating, opponent_rating):
+    """Get the expected score (0-1) of a side against another."""
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / ELO_SCALE))
+
+def compile_match(winners, losers):
+    """
+    Get (winners, losers) without repeats, or None if the game can't be rated.
+
+    A player listed on both sides is dropped from the losers.
+    """
+    winners = list(dict.fromkeys(winners))
+    winner_set = set(winners)
+    losers = [player for player in dict.fromkeys(losers) if player not in winner_set]
+    if not winners or not losers:
+        return None
+    return winners, losers
+
+
+def rate_match(ratings, games_played, winners, losers):
+    """
+    Apply one game to the ratings.
+
+    Args:
+        ratings: {player: rating}, updated in place (new players start at INITIAL_RATING)
+        games_played: {player: rated games}, updated in place
+        winners, losers: Player keys of each side
+
+    Returns:
+        {player: rating change}
+    """
+    match = compile_match(winners, losers)
+    if match is None:
+        return {}
+    winners, losers = match
+
+    winners_rating = sum(ratings.get(p, INITIAL_RATING) for p in winners) / len(winners)
+    losers_rating = sum(ratings.get(p, INITIAL_RATING) for p in losers) / len(losers)
+    surprise = 1 - expected_score(winners_rating, losers_rating)
+
+    changes = {}
+    for players, sign in ((winners, 1), (losers, -1)):
+        for player in players:
+            played = games_played.get(player, 0)
+            changes[player] = sign * k_factor(played) * surprise
+            ratings[player] = ratings.get(player, INITIAL_RATING) + changes[player]
+            games_played[player] = played + 1
+    return changes
+
+def rate_matches(matches, ratings=None, games_played=None):
+    """
+    Replay a sequence of games in order.
+
+    Args:
+        matches: (winners, losers) per game, oldest first
+        ratings, games_played: Starting state (default: everyone new); not modified
+
+    Returns:
+        (ratings, games_played) dicts after the last game
+    """
+    ratings = dict(ratings or {})
+    games_played = dict(games_played or {})
+    for winners, losers in matches:
+        rate_match(ratings, games_played, winners, losers)
+    return ratings, games_played
+
+
+def effective_mmr(entry):
+    """Get the MMR team balancing uses for a rankstats entry (rating + admin offset)."""
+    if 'mmr_rating' not in entry:
+        return entry.get('mmr', INITIAL_RATING)
+    return round(entry['mmr_rating'] + entry.get('mmr_offset', 0))
+
+def migrate_entry(entry):
+    """
+    Give a rankstats entry from before computed ratings its rating fields.
+
+    Every existing mmr (hand-set on the old 100-2000 scale, defaults included)
+    becomes an offset from INITIAL_RATING, so the player keeps their MMR and
+    the roster keeps its order until games move their ratings.
+    """
+    if 'mmr_rating' in entry:
+        return
+    mmr = entry.get('mmr', INITIAL_RATING)
+    entry['mmr_offset'] = mmr - INITIAL_RATING
+    entry['mmr_rating'] = INITIAL_RATING
+    entry['mmr_games'] = 0
+
+def store_rating(entry, rating, games):
+    """Write a computed rating into a rankstats entry and refresh its mmr."""
+    migrate_entry(entry)
+    entry['mmr_rating'] = round(rating, 2)
+    entry['mmr_games'] = games
+    entry['mmr'] = effective_mmr(entry)
+
+def apply_ratings(rankstats, ratings, games_played):
+    """Store rate_matches() results in rankstats (players without rated games go back to INITIAL_RATING)."""
+    for user_id, entry in rankstats.items():
+        store_rating(entry, ratings.get(user_id, INITIAL_RATING), games_played.get(user_id, 0))
+
+def update_entries(rankstats, winners, losers):
+    """Apply one game to the rankstats entries of its players (incremental update)."""
+    for user_id in list(winners) + list(losers):
+        migrate_entry(rankstats[user_id])
+    ratings = {user_id: rankstats[user_id]['mmr_rating'] for user_id in list(winners) + list(losers)}
+    games_played = {user_id: rankstats[user_id]['mmr_games'] for user_id in ratings}
+    rate_match(ratings, games_played, winners, losers)
+    for user_id in ratings:
+        store_rating(rankstats[user_id], ratings[user_id], games_played[user_id])
+
+def set_mmr(entry, value):
+    """Admin override: set the offset so the entry's MMR is value now and moves with its rating later."""
+    migrate_entry(entry)
+    entry['mmr_offset'] = round(value - entry['mmr_rating'], 2)
+    entry['mmr'] = effective_mmr(entry)
@@ -0,0 +1,118 @@
+"""
+player_registry.py - Stable rankstats IDs for players without a Discord link
+
+populate_stats.py gives every in-game profile it can't match to a Discord user a
+placeholder rankstats.json entry. player_registry.json remembers which ID each
+such profile got, so the ID never changes between runs:
+
+- New profiles get stable_player_id(name), derived from the normalized name
+  (not Python's per-process salted hash()).
+- Placeholder entries left by older runs are adopted under the ID they already have.
+- Once /linkalias or identity sync links the profile to a Discord user, the
+  profile is merged into that user and its placeholder ID is retired.
+
+Usage:
+    import player_registry
+    registry = player_registry.load_player_registry()
+    user_id = registry.issue('SomeNewGuy')
+    player_registry.save_player_registry(registry)
+"""
+
+import hashlib
+import json
+import os
+
+from identity_index import normalize_name
+
+PLAYER_REGISTRY_FILE = 'player_registry.json'
+PLAYER_REGISTRY_VERSION = 1
+
+# Placeholder IDs are numeric strings like Discord IDs, below 10**18
+PLAYER_ID_MODULUS = 10**18
+
+
+def stable_player_id(name, salt=0):
+    """Get the deterministic placeholder ID for an in-game name."""
+    key = normalize_name(name) if not salt else f"{normalize_name(name)}#{salt}"
+    return str(int(hashlib.sha256(key.encode('utf-8')).hexdigest(), 16) % PLAYER_ID_MODULUS)
+
+
+class PlayerRegistry:
+    """
+    Normalized profile name -> {'id', 'name', 'merged_into'}.
+
+    merged_into is the Discord user_id the profile was linked to, or None
+    while the placeholder ID is in use.
+    """
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.profiles = data.get('profiles', {})
+
+    def to_json(self):
+        return {'version': PLAYER_REGISTRY_VERSION, 'profiles': self.profiles}
+
+    def get(self, name):
+        """Get the registry entry for a profile name, or None."""
+        return self.profiles.get(normalize_name(name))
+
+    def active_ids(self):
+        """Get {placeholder id: normalized name} for profiles that aren't merged."""
+        return {p['id']: name for name, p in self.profiles.items() if not p['merged_into']}
+
+    def issue(self, name):
+        """Get the placeholder ID for a profile, registering it on first sight."""
+        profile = self.get(name)
+        if profile and not profile['merged_into']:
+            return profile['id']
+
+        taken = self.active_ids()
+        salt = 0
+        user_id = stable_player_id(name)
+        while user_id in taken:
+            salt += 1
+            user_id = stable_player_id(name, salt)
+        self.profiles[normalize_name(name)] = {'id': user_id, 'name': name, 'merged_into': None}
+        return user_id
+
+    def adopt(self, name, user_id):
+        """Register an existing placeholder entry (from an older run) under its current ID."""
+        profile = self.get(name)
+        if not profile or profile['merged_into'] or profile['id'] != user_id:
+            self.profiles[normalize_name(name)] = {'id': user_id, 'name': name, 'merged_into': None}
+
+    def merge(self, name, user_id):
+        """
+        Mark a profile as linked to a Discord user.
+
+        Returns:
+            The retired placeholder ID, or None if there was nothing to merge
+        """
+        profile = self.get(name)
+        if not profile or profile['merged_into'] or profile['id'] == user_id:
+            return None
+        profile['merged_into'] = user_id
+        return profile['id']
+
+    def forget(self, name):
+        """Drop a profile from the registry."""
+        self.profiles.pop(normalize_name(name), None)
+
+
+def load_player_registry(path=PLAYER_REGISTRY_FILE):
+    """Load player_registry.json, or an empty registry if it is missing or from another version."""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') == PLAYER_REGISTRY_VERSION:
+            return PlayerRegistry(data)
+    except:
+        pass
+    return PlayerRegistry()
+
+def save_player_registry(registry, path=PLAYER_REGISTRY_FILE):
+    """Save player_registry.json (via a temp file, like identity_index.json)."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(registry.to_json(), f, indent=2)
+    os.replace(temp_path, path)
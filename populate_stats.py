@@ -7,22 +7,67 @@ Supports multiple playlists based on active matches from the Discord bot:
 - Head to Head: 1v1 games
 """
 
-import pandas as pd
+import argparse
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import os
+import time
 from datetime import datetime
 
+import artifact_writer
+import game_shards
+import game_store
+import identity_index
+import mmr_engine
+import player_registry
+import seasons
+import site_aggregates
+import trajectory_store
+from game_records import Game
+from rank_table import RankTable
+from versus_matrix import build_versus
+from xlsx_reader import read_sheets, sheet_from_dataframe, UnsupportedWorkbook
+
 # File paths
 STATS_DIR = 'stats'
 RANKSTATS_FILE = 'rankstats.json'
 GAMESTATS_FILE = 'gamestats.json'
 MATCHHISTORY_FILE = 'matchhistory.json'
+# Single-file history the site falls back to until games/ is deployed
 GAMESDATA_FILE = 'gameshistory.json'
 XP_CONFIG_FILE = 'xp_config.json'
 PLAYERS_FILE = 'players.json'
 EMBLEMS_FILE = 'emblems.json'
 HTML_FILE = 'h2carnagereport.html'
+HTML_DATA_FILE = 'h2carnagereport_data.js'
 ACTIVE_MATCHES_FILE = 'active_matches.json'
+INGEST_MANIFEST_FILE = 'ingest_manifest.json'
+GAMES_DB_FILE = 'games.db'
+XP_CHECKPOINT_FILE = 'xp_checkpoint.json'
+
+# Bump when parse_excel_file() or get_playlist_facts() output changes,
+# so games cached by an older parser are re-parsed
+INGEST_MANIFEST_VERSION = 4
+
+# Without --workers, parsing uses one process per CPU from this many files up and is
+# serial below it. This is an estimate, not a multi-core measurement: on a 1-CPU
+# machine (where a pool can't win) a parsed file costs about 33 ms serially, the pool
+# adds about 8 ms per file for pickling results back, and starting 4 workers takes
+# about 0.02 s with fork and 0.5 s of CPU time with spawn (Windows). With 4 cores
+# that breaks even near 8 files; 16 leaves a margin. An explicit --workers N is
+# always used as given. Check a machine with `benchmarks.py parallel`.
+PARALLEL_MIN_FILES = 16
+
+# Bump when the XP replay rules change, so checkpointed XP is replayed from scratch
+XP_CHECKPOINT_VERSION = 2
+
+# Watch mode: how often to poll STATS_DIR, and how long it must stay
+# unchanged before a burst of new files is ingested (seconds)
+WATCH_POLL_INTERVAL = 2.0
+WATCH_DEBOUNCE = 5.0
 
 # Default playlist name for 4v4 games (fallback)
 PLAYLIST_NAME = 'MLG 4v4'
@@ -36,25 +81,34 @@ VALID_MLG_4V4_COMBOS = {
     "Sanctuary": ["MLG CTF3", "MLG Team Slayer"]
 }
 
+# Sheets needed to classify and rank a game
+TRIAGE_SHEETS = ['Game Details', 'Post Game Report']
+# Sheets only needed for the site's per-game detail tabs
+DETAIL_SHEETS = ['Versus', 'Game Statistics', 'Medal Stats', 'Weapon Statistics']
+# Sheets read from every game workbook
+GAME_SHEETS = TRIAGE_SHEETS + DETAIL_SHEETS
+
+# Game keys filled from DETAIL_SHEETS
+DETAIL_KEYS = ['versus', 'detailed_stats', 'medals', 'weapons']
+
+# Columns the fast xlsx reader must find before its output is trusted;
+# anything else falls back to pandas
+GAME_SHEET_KEY_COLUMNS = {
+    'Game Details': ['Map Name', 'Variant Name'],
+    'Post Game Report': ['name', 'team'],
+    'Game Statistics': ['Player'],
+    'Medal Stats': ['player'],
+    'Weapon Statistics': ['Player']
+}
+
 # Playlist types
 PLAYLIST_MLG_4V4 = 'MLG 4v4'
 PLAYLIST_TEAM_HARDCORE = 'Team Hardcore'
 PLAYLIST_DOUBLE_TEAM = 'Double Team'
 PLAYLIST_HEAD_TO_HEAD = 'Head to Head'
 
-def get_loss_factor(rank, loss_factors):
-    """Get the loss factor for a given rank. Lower ranks lose less XP."""
-    rank_str = str(rank)
-    if rank >= 30:
-        return 1.0  # Full loss penalty
-    return loss_factors.get(rank_str, 1.0)
-
-def get_win_factor(rank, win_factors):
-    """Get the win factor for a given rank. Higher ranks gain less XP."""
-    rank_str = str(rank)
-    if rank <= 40:
-        return 1.0  # Full win bonus
-    return win_factors.get(rank_str, 0.50)
+# Playlists whose games count for XP/rank, in replay order
+RANKED_PLAYLISTS = [PLAYLIST_MLG_4V4, PLAYLIST_TEAM_HARDCORE, PLAYLIST_DOUBLE_TEAM, PLAYLIST_HEAD_TO_HEAD]
 
 def load_xp_config():
     """Load XP configuration for ranking."""
@@ -117,28 +171,78 @@ def is_valid_mlg_combo(map_name, gametype):
             return True
     return False
 
-def get_game_player_count(file_path):
+def read_sheets_with_pandas(file_path, sheet_names=None):
+    """Read sheets (default: all) with pandas and convert them to xlsx_reader.Sheet rows."""
+    # Only the fallback path needs pandas, so it isn't imported at startup
+    import pandas as pd
+
+    frames = pd.read_excel(file_path, sheet_name=None)
+    if sheet_names is not None:
+        frames = {name: df for name, df in frames.items() if name in sheet_names}
+    return {name: sheet_from_dataframe(name, df) for name, df in frames.items()}
+
+class GameWorkbook:
+    """
+    All sheets of one stats workbook, read from disk in a single pass.
+
+    pd.read_excel unzips and parses the whole xlsx container on every call, so
+    reading one sheet at a time costs a full parse per sheet. Opening the file
+    once here and handing the parsed sheets to determine_playlist() and
+    parse_excel_file() keeps ingestion to one parse per game.
+
+    The sheet XML is streamed into plain rows by xlsx_reader; pandas is only
+    used when a file doesn't have the expected layout. Pass sheet_names to
+    read a subset (e.g. TRIAGE_SHEETS) and skip the other sheets' XML entirely.
+    """
+
+    def __init__(self, file_path, use_pandas=False, sheet_names=GAME_SHEETS):
+        self.file_path = file_path
+        self.reader = 'pandas'
+        if not use_pandas:
+            try:
+                self.sheets = read_sheets(file_path, sheet_names)
+                for name, columns in GAME_SHEET_KEY_COLUMNS.items():
+                    sheet = self.sheets.get(name)
+                    if sheet and sheet.rows and not all(c in sheet.columns for c in columns):
+                        raise UnsupportedWorkbook(f"Unexpected columns in {name!r}")
+                self.reader = 'xml'
+                return
+            except UnsupportedWorkbook as e:
+                print(f"  {file_path}: {e} - falling back to pandas")
+        self.sheets = read_sheets_with_pandas(file_path, sheet_names)
+
+    def sheet(self, name):
+        """Get the parsed Sheet (KeyError if the sheet is missing)."""
+        return self.sheets[name]
+
+def open_workbook(source):
+    """Return a GameWorkbook for a file path, or the workbook itself if already open."""
+    if isinstance(source, GameWorkbook):
+        return source
+    return GameWorkbook(source)
+
+def get_game_player_count(source):
     """Get the number of players in a game from the Post Game Report."""
     try:
-        post_df = pd.read_excel(file_path, sheet_name='Post Game Report')
-        return len(post_df)
+        post_sheet = open_workbook(source).sheet('Post Game Report')
+        return len(post_sheet)
     except:
         return 0
 
-def is_team_game(file_path):
+def is_team_game(source):
     """Check if a game has Red and Blue teams."""
     try:
-        post_df = pd.read_excel(file_path, sheet_name='Post Game Report')
-        teams = post_df['team'].unique().tolist()
+        post_sheet = open_workbook(source).sheet('Post Game Report')
+        teams = {row.get('team') for row in post_sheet.rows}
         return 'Red' in teams and 'Blue' in teams
     except:
         return False
 
-def get_game_players(file_path):
+def get_game_players(source):
     """Get list of player names from the game."""
     try:
-        post_df = pd.read_excel(file_path, sheet_name='Post Game Report')
-        return [str(row.get('name', '')).strip() for _, row in post_df.iterrows() if row.get('name')]
+        post_sheet = open_workbook(source).sheet('Post Game Report')
+        return [str(row.get('name', '')).strip() for row in post_sheet.rows if row.get('name')]
     except:
         return []
 
@@ -165,31 +269,56 @@ def players_match_active_match(game_players, active_match):
     # At least 75% of game players should be in active match
     return matches >= len(game_players) * 0.75
 
-def determine_playlist(file_path, active_match=None):
+def get_playlist_facts(source):
     """
-    Determine the appropriate playlist for a game based on:
-    1. Active match from Discord bot (if any)
-    2. Game characteristics (player count, teams, map/gametype)
+    Collect the game characteristics that playlist classification depends on.
 
-    Returns: playlist name string or None if game doesn't qualify for any playlist
+    Args:
+        source: Path to the Excel stats file, or an already opened GameWorkbook
+
+    Returns:
+        dict with player_count, is_team, players, map_name and gametype
     """
-    player_count = get_game_player_count(file_path)
-    is_team = is_team_game(file_path)
-    game_players = get_game_players(file_path)
+    facts = {
+        'player_count': 0,
+        'is_team': False,
+        'players': [],
+        'map_name': '',
+        'gametype': ''
+    }
+
+    try:
+        workbook = open_workbook(source)
+    except:
+        return facts
+
+    facts['player_count'] = get_game_player_count(workbook)
+    facts['is_team'] = is_team_game(workbook)
+    facts['players'] = get_game_players(workbook)
 
     # Get map and gametype from game details
     try:
-        game_details_df = pd.read_excel(file_path, sheet_name='Game Details')
-        if len(game_details_df) > 0:
-            row = game_details_df.iloc[0]
-            map_name = str(row.get('Map Name', '')).strip()
-            gametype = str(row.get('Variant Name', '')).strip()
-        else:
-            map_name = ''
-            gametype = ''
+        game_details = workbook.sheet('Game Details')
+        if len(game_details) > 0:
+            row = game_details.rows[0]
+            facts['map_name'] = str(row.get('Map Name', '')).strip()
+            facts['gametype'] = str(row.get('Variant Name', '')).strip()
     except:
-        map_name = ''
-        gametype = ''
+        pass
+
+    return facts
+
+def classify_playlist(facts, active_match=None):
+    """
+    Pick the playlist for a game from its get_playlist_facts() result.
+
+    Returns: playlist name string or None if game doesn't qualify for any playlist
+    """
+    player_count = facts['player_count']
+    is_team = facts['is_team']
+    game_players = facts['players']
+    map_name = facts['map_name']
+    gametype = facts['gametype']
 
     # If there's an active match, check if this game matches it
     if active_match:
@@ -219,49 +348,23 @@ def determine_playlist(file_path, active_match=None):
 
     return None
 
-def build_profile_lookup(players):
-    """
-    Build a lookup from stats profile name to Discord user_id.
-
-    Uses stats_profile field from players.json (populated by the bot from identity XLSX files).
-    The bot parses identity files to get MAC -> profile_name, then stores stats_profile
-    for each user based on their mac_addresses.
-    Also includes aliases from the /linkalias command.
+def determine_playlist(source, active_match=None):
     """
-    profile_to_user = {}
-
-    for user_id, data in players.items():
-        # Primary: use stats_profile (in-game name from identity files)
-        stats_profile = data.get('stats_profile', '')
-        if stats_profile:
-            profile_to_user[stats_profile.lower()] = user_id
-
-        # Also include display_name as alias
-        display_name = data.get('display_name', '')
-        if display_name:
-            profile_to_user[display_name.lower()] = user_id
-
-        # Include aliases from /linkalias command
-        aliases = data.get('aliases', [])
-        for alias in aliases:
-            if alias:
-                profile_to_user[alias.lower()] = user_id
+    Determine the appropriate playlist for a game based on:
+    1. Active match from Discord bot (if any)
+    2. Game characteristics (player count, teams, map/gametype)
 
-    return profile_to_user
+    Args:
+        source: Path to the Excel stats file, or an already opened GameWorkbook
+        active_match: Active match info from load_active_matches()
 
-def calculate_rank(xp, rank_thresholds):
-    """Calculate rank based on XP and thresholds."""
-    for rank in range(50, 0, -1):
-        rank_str = str(rank)
-        if rank_str in rank_thresholds:
-            min_xp, max_xp = rank_thresholds[rank_str]
-            if min_xp <= xp <= max_xp:
-                return rank
-    return 1
+    Returns: playlist name string or None if game doesn't qualify for any playlist
+    """
+    return classify_playlist(get_playlist_facts(source), active_match)
 
 def parse_score(score_val):
     """Parse score which can be an integer or time format (M:SS)."""
-    if pd.isna(score_val):
+    if score_val is None:
         return 0, '0'
 
     score_str = str(score_val).strip()
@@ -281,31 +384,32 @@ def parse_score(score_val):
     except:
         return 0, str(score_val)
 
-def is_4v4_team_game(file_path, require_valid_combo=True):
+def is_4v4_team_game(source, require_valid_combo=True):
     """
     Check if a game is a 4v4 team game (has Red and Blue teams).
 
     Args:
-        file_path: Path to the Excel stats file
+        source: Path to the Excel stats file, or an already opened GameWorkbook
         require_valid_combo: If True, also require valid MLG map/gametype combo
 
     Returns:
         bool: True if it's a valid 4v4 team game
     """
     try:
-        post_df = pd.read_excel(file_path, sheet_name='Post Game Report')
-        teams = post_df['team'].unique().tolist()
+        workbook = open_workbook(source)
+        post_sheet = workbook.sheet('Post Game Report')
+        teams = {row.get('team') for row in post_sheet.rows}
         # Must have both Red and Blue teams and 8 players
-        is_4v4 = 'Red' in teams and 'Blue' in teams and len(post_df) == 8
+        is_4v4 = 'Red' in teams and 'Blue' in teams and len(post_sheet) == 8
 
         if not is_4v4:
             return False
 
         if require_valid_combo:
             # Check map/gametype combo
-            game_details_df = pd.read_excel(file_path, sheet_name='Game Details')
-            if len(game_details_df) > 0:
-                row = game_details_df.iloc[0]
+            game_details = workbook.sheet('Game Details')
+            if len(game_details) > 0:
+                row = game_details.rows[0]
                 map_name = str(row.get('Map Name', '')).strip()
                 gametype = str(row.get('Variant Name', '')).strip()
                 return is_valid_mlg_combo(map_name, gametype)
@@ -315,22 +419,118 @@ def is_4v4_team_game(file_path, require_valid_combo=True):
     except:
         return False
 
-def parse_excel_file(file_path):
-    """Parse a single Excel stats file and return game data."""
-    print(f"Parsing {file_path}...")
+def score_display(score_val):
+    """Display form of a score cell (see parse_score)."""
+    return parse_score(score_val)[1]
+
+def score_numeric(score_val):
+    """Numeric form of a score cell, in seconds for time scores (see parse_score)."""
+    return parse_score(score_val)[0]
+
+def clean_str(value):
+    """String cell with surrounding whitespace removed."""
+    return str(value).strip()
+
+def int_cell(value):
+    """Integer cell; numeric text like '3' or '3.0' is converted, anything else reads as 0."""
+    try:
+        return int(float(value))
+    except:
+        return 0
+
+def float_cell(value):
+    """Float cell; numeric text is converted, anything else reads as 0."""
+    try:
+        return float(value)
+    except:
+        return 0.0
+
+# Column schemas for parse_excel_file(): (source column, output key, type, default).
+# The default is used as-is for empty or missing cells; other cells are cast with type.
+PLAYER_SCHEMA = [
+    ('name', 'name', clean_str, ''),
+    ('place', 'place', str, ''),
+    ('score', 'score', score_display, '0'),
+    ('score', 'score_numeric', score_numeric, 0),
+    ('kills', 'kills', int_cell, 0),
+    ('deaths', 'deaths', int_cell, 0),
+    ('assists', 'assists', int_cell, 0),
+    ('kda', 'kda', float_cell, 0),
+    ('suicides', 'suicides', int_cell, 0),
+    ('team', 'team', clean_str, ''),
+    ('shots_fired', 'shots_fired', int_cell, 0),
+    ('shots_hit', 'shots_hit', int_cell, 0),
+    ('accuracy', 'accuracy', float_cell, 0),
+    ('head_shots', 'head_shots', int_cell, 0)
+]
+
+DETAILED_STATS_SCHEMA = [
+    ('Player', 'player', clean_str, ''),
+    ('Emblem URL', 'emblem_url', str, ''),
+    ('kills', 'kills', int_cell, 0),
+    ('assists', 'assists', int_cell, 0),
+    ('deaths', 'deaths', int_cell, 0),
+    ('headshots', 'headshots', int_cell, 0),
+    ('betrayals', 'betrayals', int_cell, 0),
+    ('suicides', 'suicides', int_cell, 0),
+    ('best_spree', 'best_spree', int_cell, 0),
+    ('total_time_alive', 'total_time_alive', int_cell, 0),
+    ('ctf_scores', 'ctf_scores', int_cell, 0),
+    ('ctf_flag_steals', 'ctf_flag_steals', int_cell, 0),
+    ('ctf_flag_saves', 'ctf_flag_saves', int_cell, 0)
+]
+
+MEDAL_COLUMNS = ['double_kill', 'triple_kill', 'killtacular', 'kill_frenzy', 'killtrocity',
+                 'killamanjaro', 'sniper_kill', 'road_kill', 'bone_cracker', 'assassin',
+                 'vehicle_destroyed', 'car_jacking', 'stick_it', 'killing_spree',
+                 'running_riot', 'rampage', 'beserker', 'over_kill', 'flag_taken',
+                 'flag_carrier_kill', 'flag_returned', 'bomb_planted', 'bomb_carrier_kill', 'bomb_returned']
+
+def extract_records(sheet, schema, name_key):
+    """
+    Convert sheet rows to output records using a column schema.
+
+    Each column is pulled out and cast in one pass, then the columns are zipped
+    back into one dict per row. Rows whose name_key value is empty are dropped.
+    """
+    keys = []
+    columns = []
+    for source, key, cast, default in schema:
+        values = [row.get(source) for row in sheet.rows]
+        if None in values:
+            values = [default if v is None else cast(v) for v in values]
+        else:
+            values = list(map(cast, values))
+        keys.append(key)
+        columns.append(values)
+
+    records = [dict(zip(keys, values)) for values in zip(*columns)]
+    return [record for record in records if record[name_key]]
+
+def parse_excel_file(source, include_details=True):
+    """
+    Parse a single Excel stats file and return game data.
 
-    # Read all sheets
-    game_details_df = pd.read_excel(file_path, sheet_name='Game Details')
-    post_game_df = pd.read_excel(file_path, sheet_name='Post Game Report')
-    versus_df = pd.read_excel(file_path, sheet_name='Versus')
-    game_stats_df = pd.read_excel(file_path, sheet_name='Game Statistics')
-    medal_stats_df = pd.read_excel(file_path, sheet_name='Medal Stats')
-    weapon_stats_df = pd.read_excel(file_path, sheet_name='Weapon Statistics')
+    Args:
+        source: Path to the Excel stats file, or an already opened GameWorkbook
+        include_details: If False, only parse the triage sheets (details and
+            players) - enough to classify and rank the game. The detail sheets
+            can be added later with parse_detail_sheets().
+    """
+    if isinstance(source, GameWorkbook):
+        workbook = source
+    else:
+        workbook = GameWorkbook(source, sheet_names=GAME_SHEETS if include_details else TRIAGE_SHEETS)
+    print(f"Parsing {workbook.file_path}...")
+
+    # All sheets were read when the workbook was opened
+    game_details = workbook.sheet('Game Details')
+    post_game = workbook.sheet('Post Game Report')
 
     # Extract game details
     details = {}
-    if len(game_details_df) > 0:
-        row = game_details_df.iloc[0]
+    if len(game_details) > 0:
+        row = game_details.rows[0]
         details = {
             'Game Type': str(row.get('Game Type', 'Unknown')),
             'Variant Name': str(row.get('Variant Name', 'Unknown')),
@@ -341,114 +541,254 @@ def parse_excel_file(file_path):
         }
 
     # Extract players from Post Game Report
-    players = []
-    for _, row in post_game_df.iterrows():
-        score_numeric, score_display = parse_score(row.get('score', 0))
-        player = {
-            'name': str(row.get('name', '')).strip(),
-            'place': str(row.get('place', '')),
-            'score': score_display,
-            'score_numeric': score_numeric,
-            'kills': int(row.get('kills', 0)) if pd.notna(row.get('kills')) else 0,
-            'deaths': int(row.get('deaths', 0)) if pd.notna(row.get('deaths')) else 0,
-            'assists': int(row.get('assists', 0)) if pd.notna(row.get('assists')) else 0,
-            'kda': float(row.get('kda', 0)) if pd.notna(row.get('kda')) else 0,
-            'suicides': int(row.get('suicides', 0)) if pd.notna(row.get('suicides')) else 0,
-            'team': str(row.get('team', '')).strip(),
-            'shots_fired': int(row.get('shots_fired', 0)) if pd.notna(row.get('shots_fired')) else 0,
-            'shots_hit': int(row.get('shots_hit', 0)) if pd.notna(row.get('shots_hit')) else 0,
-            'accuracy': float(row.get('accuracy', 0)) if pd.notna(row.get('accuracy')) else 0,
-            'head_shots': int(row.get('head_shots', 0)) if pd.notna(row.get('head_shots')) else 0
-        }
-        if player['name']:
-            players.append(player)
+    players = extract_records(post_game, PLAYER_SCHEMA, 'name')
+
+    game = {
+        'details': details,
+        'players': players
+    }
+    if include_details:
+        game.update(parse_detail_sheets(workbook))
+
+    return game
+
+def parse_detail_sheets(source):
+    """
+    Parse the detail sheets (versus, game statistics, medals, weapons) of a stats file.
 
-    # Extract versus data
+    Args:
+        source: Path to the Excel stats file, or an already opened GameWorkbook
+
+    Returns:
+        dict with the DETAIL_KEYS of a game
+    """
+    if isinstance(source, GameWorkbook):
+        workbook = source
+    else:
+        workbook = GameWorkbook(source, sheet_names=DETAIL_SHEETS)
+
+    versus_sheet = workbook.sheet('Versus')
+    game_stats = workbook.sheet('Game Statistics')
+    medal_stats = workbook.sheet('Medal Stats')
+    weapon_stats = workbook.sheet('Weapon Statistics')
+
+    # Extract versus data (first column is the killer, one column per victim),
+    # stored as a name list plus a square kill matrix
     versus = {}
-    if len(versus_df) > 0:
-        for i, row in versus_df.iterrows():
-            player_name = str(row.iloc[0]).strip()
-            if player_name:
-                versus[player_name] = {}
-                for col in versus_df.columns[1:]:
-                    opponent = str(col).strip()
-                    kills = int(row[col]) if pd.notna(row[col]) else 0
-                    versus[player_name][opponent] = kills
+    if len(versus_sheet) > 0:
+        name_column = versus_sheet.columns[0]
+        # Header cells are never blank, so '' can't clash with a victim column
+        versus_schema = [(name_column, '', clean_str, '')]
+        versus_schema += [(col, str(col).strip(), int_cell, 0) for col in versus_sheet.columns[1:]]
+        for record in extract_records(versus_sheet, versus_schema, ''):
+            player_name = record.pop('')
+            versus[player_name] = record
 
     # Extract detailed game statistics
-    detailed_stats = []
-    for _, row in game_stats_df.iterrows():
-        player_name = str(row.get('Player', '')).strip()
-        if player_name:
-            stats = {
-                'player': player_name,
-                'emblem_url': str(row.get('Emblem URL', '')) if pd.notna(row.get('Emblem URL')) else '',
-                'kills': int(row.get('kills', 0)) if pd.notna(row.get('kills')) else 0,
-                'assists': int(row.get('assists', 0)) if pd.notna(row.get('assists')) else 0,
-                'deaths': int(row.get('deaths', 0)) if pd.notna(row.get('deaths')) else 0,
-                'headshots': int(row.get('headshots', 0)) if pd.notna(row.get('headshots')) else 0,
-                'betrayals': int(row.get('betrayals', 0)) if pd.notna(row.get('betrayals')) else 0,
-                'suicides': int(row.get('suicides', 0)) if pd.notna(row.get('suicides')) else 0,
-                'best_spree': int(row.get('best_spree', 0)) if pd.notna(row.get('best_spree')) else 0,
-                'total_time_alive': int(row.get('total_time_alive', 0)) if pd.notna(row.get('total_time_alive')) else 0,
-                'ctf_scores': int(row.get('ctf_scores', 0)) if pd.notna(row.get('ctf_scores')) else 0,
-                'ctf_flag_steals': int(row.get('ctf_flag_steals', 0)) if pd.notna(row.get('ctf_flag_steals')) else 0,
-                'ctf_flag_saves': int(row.get('ctf_flag_saves', 0)) if pd.notna(row.get('ctf_flag_saves')) else 0
-            }
-            detailed_stats.append(stats)
-
-    # Extract medal statistics
-    medals = []
-    medal_columns = ['double_kill', 'triple_kill', 'killtacular', 'kill_frenzy', 'killtrocity',
-                     'killamanjaro', 'sniper_kill', 'road_kill', 'bone_cracker', 'assassin',
-                     'vehicle_destroyed', 'car_jacking', 'stick_it', 'killing_spree',
-                     'running_riot', 'rampage', 'beserker', 'over_kill', 'flag_taken',
-                     'flag_carrier_kill', 'flag_returned', 'bomb_planted', 'bomb_carrier_kill', 'bomb_returned']
-
-    for _, row in medal_stats_df.iterrows():
-        player_name = str(row.get('player', '')).strip()
-        if player_name:
-            medal_data = {'player': player_name}
-            for col in medal_columns:
-                if col in row:
-                    medal_data[col] = int(row[col]) if pd.notna(row[col]) else 0
-            medals.append(medal_data)
-
-    # Extract weapon statistics
-    weapons = []
-    for _, row in weapon_stats_df.iterrows():
-        player_name = str(row.get('Player', '')).strip()
-        if player_name:
-            weapon_data = {'Player': player_name}
-            for col in weapon_stats_df.columns:
-                if col != 'Player':
-                    col_clean = str(col).strip().lower()
-                    weapon_data[col_clean] = int(row[col]) if pd.notna(row[col]) else 0
-            weapons.append(weapon_data)
+    detailed_stats = extract_records(game_stats, DETAILED_STATS_SCHEMA, 'player')
 
-    game = {
-        'details': details,
-        'players': players,
-        'versus': versus,
+    # Extract medal statistics (only the medal columns this file has)
+    medal_schema = [('player', 'player', clean_str, '')]
+    medal_schema += [(col, col, int_cell, 0) for col in MEDAL_COLUMNS if col in medal_stats.columns]
+    medals = extract_records(medal_stats, medal_schema, 'player')
+
+    # Extract weapon statistics (every column is a weapon counter)
+    weapon_schema = [('Player', 'Player', clean_str, '')]
+    weapon_schema += [(col, str(col).strip().lower(), int_cell, 0) for col in weapon_stats.columns if col != 'Player']
+    weapons = extract_records(weapon_stats, weapon_schema, 'Player')
+
+    return {
+        'versus': build_versus(versus),
         'detailed_stats': detailed_stats,
         'medals': medals,
         'weapons': weapons
     }
 
-    return game
+def file_content_hash(file_path):
+    """Get the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def new_ingest_manifest():
+    """Create an empty ingestion manifest."""
+    return {'version': INGEST_MANIFEST_VERSION, 'files': {}, 'fingerprints': {}}
+
+def load_ingest_manifest():
+    """
+    Load ingest_manifest.json, which caches the parsed game for every stats file.
+
+    Format:
+    {
+        "version": 4,
+        "files": {
+            "20251128_201839.xlsx": {
+                "size": 12345,
+                "mtime_ns": 1764360000000000000,
+                "sha256": "...",
+                "fingerprint": "...",   // game_fingerprint() result
+                "facts": {...},      // get_playlist_facts() result
+                "playlist": "MLG 4v4",  // playlist from the run that parsed it
+                "game": {...}        // parse_excel_file() result
+            }
+        },
+        "fingerprints": {
+            "...": "20251128_201839.xlsx"  // fingerprint -> file counted for that game
+        }
+    }
+
+    Returns an empty manifest if the file is missing or from another parser version.
+    """
+    try:
+        with open(INGEST_MANIFEST_FILE, 'r') as f:
+            manifest = json.load(f)
+        if (manifest.get('version') == INGEST_MANIFEST_VERSION and isinstance(manifest.get('files'), dict)
+                and isinstance(manifest.get('fingerprints'), dict)):
+            return manifest
+    except:
+        pass
+    return new_ingest_manifest()
+
+def save_ingest_manifest(manifest):
+    """Save ingest_manifest.json."""
+    with open(INGEST_MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f)
+
+def ingest_game_file(file_path, include_details=True):
+    """
+    Open a stats workbook once, then classify and parse it.
+
+    Args:
+        include_details: If False, only the triage sheets are read (see parse_excel_file)
+
+    Returns:
+        (game, facts) - parse_excel_file() and get_playlist_facts() results
+    """
+    workbook = GameWorkbook(file_path, sheet_names=GAME_SHEETS if include_details else TRIAGE_SHEETS)
+    facts = get_playlist_facts(workbook)
+    game = parse_excel_file(workbook, include_details=include_details)
+    return game, facts
+
+def file_workers(workers, file_count):
+    """
+    Number of processes map_files() uses for file_count files.
+
+    An explicit workers value is used as given; None (automatic) means one
+    per CPU from PARALLEL_MIN_FILES files up, else serial.
+    """
+    if workers is None:
+        workers = (os.cpu_count() or 1) if file_count >= PARALLEL_MIN_FILES else 1
+    return max(1, min(workers, file_count))
+
+def map_files(func, file_paths, workers=None):
+    """
+    Apply func to every file path, in a process pool when file_workers()
+    gives more than one process.
+
+    Results always come back in the order of file_paths, so XP replay stays deterministic.
+    """
+    workers = file_workers(workers, len(file_paths))
+    if workers <= 1:
+        return [func(file_path) for file_path in file_paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, file_paths))
+
+def ingest_game_files(file_paths, workers=None, include_details=True):
+    """Run ingest_game_file() over several stats files (see map_files)."""
+    return map_files(functools.partial(ingest_game_file, include_details=include_details), file_paths, workers)
+
+def has_detail_sheets(game):
+    """Check if a parsed game includes the detail sheets."""
+    return all(key in game for key in DETAIL_KEYS)
+
+def get_cached_entry(manifest, filename):
+    """
+    Get the manifest entry for a stats file if it is still up to date, else None.
+
+    An entry is reused when size and mtime match, or when the size and content
+    hash match (e.g. the file was copied again with a new mtime).
+    """
+    entry = manifest['files'].get(filename)
+    if not entry:
+        return None
+
+    stat = os.stat(os.path.join(STATS_DIR, filename))
+    if entry['size'] != stat.st_size:
+        return None
+    if entry['mtime_ns'] == stat.st_mtime_ns:
+        return entry
+
+    if entry['sha256'] == file_content_hash(os.path.join(STATS_DIR, filename)):
+        entry['mtime_ns'] = stat.st_mtime_ns
+        return entry
+    return None
+
+def game_fingerprint(game):
+    """
+    Fingerprint a parsed game by start time, map, variant and its sorted player lines.
+
+    The same game exported twice (under different file names) gets the same fingerprint.
+    Only the triage sheets are used, so it can be computed before the detail sheets are read.
+    """
+    details = game['details']
+    player_lines = sorted(json.dumps(player, sort_keys=True) for player in game['players'])
+    key = [details.get('Start Time'), details.get('Map Name'), details.get('Variant Name'), player_lines]
+    return hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+
+def forget_game_file(manifest, filename):
+    """Remove a file from the manifest, and from the fingerprint index if it was counted there."""
+    entry = manifest['files'].pop(filename, None)
+    if entry and manifest['fingerprints'].get(entry['fingerprint']) == filename:
+        del manifest['fingerprints'][entry['fingerprint']]
+
+def register_fingerprint(manifest, filename):
+    """
+    Add a file to the fingerprint index.
+
+    The earliest file name (stats files are named by export time) is the one that
+    counts; later files with the same fingerprint are duplicates.
+
+    Returns:
+        Name of the file this one duplicates, or None
+    """
+    fingerprint = manifest['files'][filename]['fingerprint']
+    owner = manifest['fingerprints'].get(fingerprint)
+    if owner is None or filename <= owner:
+        manifest['fingerprints'][fingerprint] = filename
+        return None
+    return owner
+
+def record_game_file(manifest, filename, game, facts):
+    """Store a freshly parsed game in the manifest."""
+    file_path = os.path.join(STATS_DIR, filename)
+    stat = os.stat(file_path)
+    # A changed file may no longer match its old fingerprint
+    forget_game_file(manifest, filename)
+    manifest['files'][filename] = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': file_content_hash(file_path),
+        'fingerprint': game_fingerprint(game),
+        'facts': facts,
+        'playlist': None,
+        'game': game
+    }
+    return manifest['files'][filename]
 
 def determine_winners_losers(game):
     """Determine winning and losing teams for a 4v4 team game."""
-    players = game['players']
-
     teams = {}
-    for player in players:
-        team = player.get('team', '').strip()
+    for player in game.players:
+        team = player.team.strip()
         if team and team in ['Red', 'Blue']:
             if team not in teams:
                 teams[team] = {'score': 0, 'players': []}
-            teams[team]['score'] += player.get('score_numeric', 0)
-            teams[team]['players'].append(player['name'])
+            teams[team]['score'] += player.score_numeric
+            teams[team]['players'].append(player.name)
 
     if len(teams) == 2:
         sorted_teams = sorted(teams.items(), key=lambda x: x[1]['score'], reverse=True)
@@ -463,41 +803,360 @@ def determine_winners_losers(game):
 
     return [], []
 
-def find_player_by_name(rankstats, name, profile_lookup=None):
+def find_player_by_name(rankstats, name, identity):
     """
     Find a player in rankstats by their stats profile name.
 
-    Matching priority:
-    1. MAC ID-linked stats_profile from players.json (via profile_lookup)
-    2. discord_name field in rankstats.json
+    Matching priority (see identity_index.SOURCE_PRIORITY):
+    1. MAC ID-linked stats_profile from players.json
+    2. /linkalias aliases, then display_name from players.json
+    3. discord_name field in rankstats.json
     """
-    name_lower = name.lower().strip()
+    return identity.lookup(name, valid_ids=rankstats)
+
+def new_rankstats_entry(player_name):
+    """Create the rankstats entry for a player first seen in the stats files."""
+    return {
+        'xp': 0,
+        'wins': 0,
+        'losses': 0,
+        'series_wins': 0,
+        'series_losses': 0,
+        'total_games': 0,
+        'total_series': 0,
+        # The hand-set scale's default; kept as an offset like every other existing mmr
+        'mmr': 750,
+        'discord_name': player_name,
+        'rank': 1
+    }
 
-    # First try MAC ID-linked profile lookup from players.json
-    if profile_lookup and name_lower in profile_lookup:
-        user_id = profile_lookup[name_lower]
-        if user_id in rankstats:
-            return user_id
+def compact_player_registry(registry, rankstats, players, matched_ids):
+    """
+    Drop placeholder entries nothing points at any more.
 
-    # Fall back to discord_name matching in rankstats
-    for user_id, data in rankstats.items():
-        discord_name = data.get('discord_name', '').lower()
-        if discord_name == name_lower:
-            return user_id
+    A placeholder is removed from rankstats once its profile was merged into a
+    Discord user (the registry keeps the merge), or when no game in the stats
+    files matched it this run (the registry forgets it too). Users in
+    players.json are never removed.
 
-    return None
+    Returns:
+        Number of rankstats entries removed
+    """
+    removed = 0
+    for name, profile in list(registry.profiles.items()):
+        user_id = profile['id']
+        if user_id in matched_ids or user_id in players:
+            continue
+        if rankstats.pop(user_id, None) is not None:
+            removed += 1
+        if not profile['merged_into']:
+            registry.forget(name)
+    return removed
+
+def xp_config_hash(xp_config):
+    """Hash the XP settings; checkpointed XP is only valid for the settings it was replayed with."""
+    return hashlib.sha256(json.dumps(xp_config, sort_keys=True).encode('utf-8')).hexdigest()
+
+def new_xp_checkpoint(config_hash):
+    """Create an empty XP checkpoint."""
+    return {'version': XP_CHECKPOINT_VERSION, 'config_hash': config_hash, 'playlists': {}}
+
+def load_xp_checkpoint(config_hash):
+    """
+    Load xp_checkpoint.json, the per-playlist XP state after the last replayed game.
+
+    Format:
+    {
+        "version": 2,
+        "config_hash": "...",       // xp_config_hash() of the settings used
+        "playlists": {
+            "MLG 4v4": {
+                "games": [["20251128_201839.xlsx", "<sha256>"], ...],  // replayed games, in order
+                "players": {
+                    "Rocky": {"xp": 100, "rank": 2, "highest_rank": 2, "wins": 1, "losses": 0, "games": 1}
+                },
+                "trajectories": {
+                    "Rocky": [[0, 100, 2], ...]  // [game index, xp, rank] after each game
+                }
+            }
+        }
+    }
+
+    Returns an empty checkpoint if the file is missing, from another replay
+    version, or was built with different XP settings.
+    """
+    try:
+        with open(XP_CHECKPOINT_FILE, 'r') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('version') != XP_CHECKPOINT_VERSION:
+            return new_xp_checkpoint(config_hash)
+        if checkpoint.get('config_hash') != config_hash:
+            print(f"  {XP_CONFIG_FILE} changed - replaying all ranked games")
+            return new_xp_checkpoint(config_hash)
+        return checkpoint
+    except:
+        return new_xp_checkpoint(config_hash)
+
+def save_xp_checkpoint(checkpoint):
+    """Save xp_checkpoint.json."""
+    with open(XP_CHECKPOINT_FILE, 'w') as f:
+        json.dump(checkpoint, f)
+
+def new_playlist_state():
+    """Create an empty per-playlist XP state (see load_xp_checkpoint)."""
+    return {'games': [], 'players': {}, 'trajectories': {}}
+
+def replay_ranked_game(player_states, game, rank_table, verbose=True, trajectories=None, game_index=None):
+    """
+    Apply one ranked game to the XP state of its playlist.
+
+    Args:
+        player_states: {player_name: {xp, rank, highest_rank, wins, losses, games}}, updated in place
+        game: The game (game_records.Game)
+        rank_table: RankTable built from xp_config.json
+        verbose: Print each player's XP change
+        trajectories: {player_name: [[game_index, xp, rank], ...]}; if given, each
+            player's point after this game is appended
+        game_index: Position of the game in its playlist (for trajectories)
+    """
+    xp_win = rank_table.game_win  # 100 XP per win
+    xp_loss = rank_table.game_loss  # -100 XP per loss
+
+    winners, losers = determine_winners_losers(game)
+    for player in game.players:
+        player_name = player.name
+
+        # Initialize playlist tracking if needed
+        if player_name not in player_states:
+            player_states[player_name] = {'xp': 0, 'rank': 1, 'highest_rank': 1, 'wins': 0, 'losses': 0, 'games': 0}
+        state = player_states[player_name]
+
+        # Get current XP and rank for this playlist
+        old_xp = state['xp']
+        current_rank = state['rank']
+
+        if player_name in winners:
+            state['wins'] += 1
+            state['games'] += 1
+            # Apply win factor (high ranks gain less)
+            win_factor = rank_table.get_win_factor(current_rank)
+            xp_change = int(xp_win * win_factor)
+            state['xp'] += xp_change
+            result = f"WIN (+{xp_change} @ {int(win_factor*100)}%)"
+        elif player_name in losers:
+            state['losses'] += 1
+            state['games'] += 1
+            # Apply loss factor (low ranks lose less)
+            loss_factor = rank_table.get_loss_factor(current_rank)
+            xp_change = int(xp_loss * loss_factor)  # xp_loss is negative
+            state['xp'] += xp_change
+            # Ensure XP cannot go below 0
+            if state['xp'] < 0:
+                state['xp'] = 0
+            result = f"LOSS ({xp_change} @ {int(loss_factor*100)}%)"
+        else:
+            state['games'] += 1
+            result = "TIE"
+
+        new_xp = state['xp']
+        new_rank = rank_table.calculate_rank(new_xp)
+        state['rank'] = new_rank
+        # Track highest rank achieved in this playlist
+        if new_rank > state['highest_rank']:
+            state['highest_rank'] = new_rank
+        if trajectories is not None:
+            trajectories.setdefault(player_name, []).append([game_index, new_xp, new_rank])
+        if verbose:
+            print(f"    {player_name}: {result} | XP: {old_xp} -> {new_xp} | Rank: {new_rank}")
+
+def resume_playlist_state(checkpoint, playlist, game_keys):
+    """
+    Get (state, games already replayed) for one playlist from the XP checkpoint.
+
+    If the checkpointed games are still the first games of the playlist (same
+    files, same contents), only the games after them need replaying. Otherwise
+    (an older game was inserted, changed, removed or re-tagged) the playlist
+    starts over from an empty state.
+    """
+    state = checkpoint['playlists'].get(playlist)
+    done = len(state['games']) if state else 0
+
+    if state and state['games'] != game_keys[:done]:
+        print(f"  [{playlist}] Earlier games changed - replaying all {len(game_keys)} games")
+        state, done = None, 0
+    if state is None:
+        state = new_playlist_state()
+    elif done:
+        print(f"  [{playlist}] Resuming after {done} checkpointed games")
+    return state, done
+
+def replay_playlist_games(playlist, state, games, game_keys, rank_table):
+    """
+    Replay one playlist's new games (those after state['games']) onto its state.
+
+    Runs in a worker process when playlists are replayed in parallel, so the
+    per-game log is captured and returned instead of printed.
+
+    Returns:
+        (state, seconds spent, log text)
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        for game_num, (game, game_key) in enumerate(zip(games, game_keys), len(state['games']) + 1):
+            print(f"\n  Ranked Game {game_num} [{playlist}]: {game.details.get('Variant Name', 'Unknown')}")
+            replay_ranked_game(state['players'], game, rank_table,
+                               trajectories=state['trajectories'], game_index=len(state['games']))
+            state['games'].append(game_key)
+    return state, time.perf_counter() - start, log.getvalue()
+
+def replay_playlists(checkpoint, games_by_playlist, source_hashes, rank_table, workers=1):
+    """
+    Bring every ranked playlist's checkpointed XP state up to date.
+
+    XP state is independent between playlists, so with workers > 1 the
+    playlists that have games to replay are replayed in a process pool. Logs
+    are printed in RANKED_PLAYLISTS order either way, followed by how long
+    each playlist took.
+
+    Returns:
+        Number of games replayed
+    """
+    jobs = []
+    for playlist in RANKED_PLAYLISTS:
+        games = games_by_playlist.get(playlist, [])
+        game_keys = [[game.source_file, source_hashes.get(game.source_file)] for game in games]
+        state, done = resume_playlist_state(checkpoint, playlist, game_keys)
+        # Workers only need the Game Details and Post Game Report
+        jobs.append((playlist, state, [game.triage_copy() for game in games[done:]],
+                     game_keys[done:], rank_table))
+
+    pending = sum(1 for job in jobs if job[2])
+    if workers > 1 and pending > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, pending)) as executor:
+            results = list(executor.map(replay_playlist_games, *zip(*jobs)))
+    else:
+        results = [replay_playlist_games(*job) for job in jobs]
+
+    replayed = 0
+    timings = []
+    for (playlist, _, games, _, _), (state, seconds, log) in zip(jobs, results):
+        print(log, end='')
+        checkpoint['playlists'][playlist] = state
+        replayed += len(games)
+        timings.append((playlist, len(games), len(state['games']), seconds))
+
+    print("\n  Replay time per playlist:")
+    for playlist, new_games, total_games, seconds in timings:
+        print(f"    {playlist:<14} {new_games:>6} replayed / {total_games:>6} games  {seconds:7.3f}s")
+    return replayed
+
+def season_inputs_hash(config_hash, games_by_playlist, source_hashes, player_to_id):
+    """Hash everything a season snapshot is built from; a final snapshot is only rebuilt when this changes."""
+    inputs = {
+        'xp_config': config_hash,
+        'games': {playlist: [[game.source_file, source_hashes.get(game.source_file)] for game in games]
+                  for playlist, games in games_by_playlist.items()},
+        'players': sorted({player.name: player_to_id[player.name]
+                           for games in games_by_playlist.values()
+                           for game in games for player in game.players}.items())
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
+
+def build_season_snapshot(season, status, playlist_states, inputs, player_to_id, rankstats):
+    """
+    Build a seasons/<id>.json snapshot from replayed playlist states.
+
+    Names that belong to the same user are folded into one entry per playlist,
+    keeping the state with the most games.
+    """
+    players = {}
+    for playlist, state in playlist_states.items():
+        for player_name, player_state in state['players'].items():
+            user_id = player_to_id[player_name]
+            entry = players.setdefault(user_id, {
+                'name': rankstats[user_id].get('alias') or rankstats[user_id].get('discord_name') or player_name,
+                'playlists': {}
+            })
+            current = entry['playlists'].get(playlist)
+            if current is None or player_state['games'] > current['games']:
+                entry['playlists'][playlist] = dict(player_state)
+    return {
+        'version': seasons.SEASON_SNAPSHOT_VERSION,
+        'season': season,
+        'status': status,
+        'inputs': inputs,
+        'games': {playlist: len(state['games']) for playlist, state in playlist_states.items()},
+        'players': players
+    }
+
+def write_season_snapshots(season_list, live_season, games_by_season, checkpoint, source_hashes,
+                           rank_table, player_to_id, rankstats):
+    """
+    Write seasons/<id>.json for every season with ranked games, plus seasons/index.json.
 
-def main():
+    The live season's snapshot comes from the XP checkpoint that was just
+    brought up to date. Other seasons are replayed from their own games,
+    unless they have ended and their snapshot's inputs are unchanged (frozen).
+    """
+    statuses = {}
+    for season in season_list:
+        season_games = games_by_season[season['id']]
+        if not any(season_games.values()):
+            continue
+        status = seasons.STATUS_FINAL if seasons.season_ended(season) else seasons.STATUS_LIVE
+        statuses[season['id']] = status
+        inputs = season_inputs_hash(checkpoint['config_hash'], season_games, source_hashes, player_to_id)
+
+        existing = seasons.load_snapshot(season)
+        if (status == seasons.STATUS_FINAL and existing and existing['status'] == status
+                and existing['inputs'] == inputs and existing['season'] == season):
+            print(f"  [{season['name']}] Final snapshot unchanged")
+            continue
+
+        if live_season and season['id'] == live_season['id']:
+            playlist_states = checkpoint['playlists']
+        else:
+            playlist_states = {}
+            for playlist, games in season_games.items():
+                game_keys = [[game.source_file, source_hashes.get(game.source_file)] for game in games]
+                state, _, _ = replay_playlist_games(playlist, new_playlist_state(), games,
+                                                    game_keys, rank_table)
+                playlist_states[playlist] = state
+
+        seasons.save_snapshot(build_season_snapshot(season, status, playlist_states, inputs,
+                                                    player_to_id, rankstats))
+        print(f"  [{season['name']}] Saved {seasons.snapshot_path(season)} ({status})")
+    seasons.save_index(season_list, statuses)
+
+def save_artifact(path, data, indent=None, note=None):
+    """Write a site data file (compact unless indent is given) and report its size."""
+    sizes = artifact_writer.write_json_artifact(path, data, indent)
+    details = ', '.join(part for part in (note, f"{sizes[path] / 1024:.1f} KB") if part)
+    print(f"  Saved {path} ({details})")
+
+def main(full_rebuild=False, workers=None, rank_only=False, pretty=False):
+    """
+    Rebuild rankings and site data from every game in the stats folder.
+
+    Args:
+        full_rebuild: If True, ignore the ingestion manifest and XP checkpoint, re-parse
+            every file and replay every ranked game
+        workers: Number of processes used to parse new/changed files and to
+            replay the ranked playlists; None picks for parsing (see file_workers)
+            and replays serially
+        rank_only: Only read the triage sheets and update rankstats.json, gamestats.json
+            and matchhistory.json. Game history, emblems and the HTML are left as they are.
+        pretty: Indent the site JSON files instead of writing them compactly
+            (files the bot also rewrites are always indented, see artifact_writer)
+    """
     print("Starting stats population...")
     print("=" * 50)
 
     # Load configurations
     xp_config = load_xp_config()
-    rank_thresholds = xp_config['rank_thresholds']
-    xp_win = xp_config['game_win']  # 100 XP per win
-    xp_loss = xp_config['game_loss']  # -100 XP per loss
-    loss_factors = xp_config.get('loss_factors', {})
-    win_factors = xp_config.get('win_factors', {})
+    rank_table = RankTable(xp_config)
 
     # Load existing rankstats
     rankstats = load_rankstats()
@@ -507,9 +1166,12 @@ def main():
     players = load_players()
     print(f"Loaded {len(players)} players from players.json")
 
-    # Build profile name to user_id lookup using stats_profile field
-    profile_lookup = build_profile_lookup(players)
-    print(f"Built {len(profile_lookup)} profile->user mappings")
+    # Bring the name -> user_id index up to date (only changed users are re-indexed)
+    identity = identity_index.load_identity_index()
+    updated = identity_index.refresh_identity_index(identity, players, rankstats)
+    print(f"Identity index: {len(identity.claims)} names, {updated} users updated")
+    for name, user_ids in identity.collisions().items():
+        print(f"  [COLLISION] {name!r} is claimed by {', '.join(user_ids)} - using {user_ids[0]}")
 
     # Load active matches from Discord bot (if any)
     active_match = load_active_matches()
@@ -545,25 +1207,70 @@ def main():
     print("\nStep 2: Finding and categorizing games...")
     stats_files = sorted([f for f in os.listdir(STATS_DIR) if f.endswith('.xlsx')])
 
-    # Store ALL games (for stats tracking)
+    # Store ALL games (for stats tracking), as compact game_records.Game objects
     all_games = []
     # Group games by playlist (for ranking)
     games_by_playlist = {}
     untagged_games = []
 
+    # Reuse games parsed by earlier runs; only new or changed files are opened
+    manifest = new_ingest_manifest() if full_rebuild else load_ingest_manifest()
+    pending_files = [f for f in stats_files if get_cached_entry(manifest, f) is None]
+
+    if pending_files:
+        parse_workers = file_workers(workers, len(pending_files))
+        mode = f"{parse_workers} workers" if parse_workers > 1 else "serial"
+        print(f"  Parsing {len(pending_files)} new/changed files ({mode})...")
+    parse_start = time.perf_counter()
+    # A full run reads every sheet in the one open and fingerprints from the triage fields
+    # of that result; --rank-only reads just the triage sheets
+    pending_paths = [os.path.join(STATS_DIR, f) for f in pending_files]
+    parsed = ingest_game_files(pending_paths, workers, include_details=not rank_only)
+    for filename, (parsed_game, facts) in zip(pending_files, parsed):
+        record_game_file(manifest, filename, parsed_game, facts)
+
+    # Drop entries for files that are no longer in the stats folder
+    stats_file_set = set(stats_files)
+    for filename in list(manifest['files']):
+        if filename not in stats_file_set:
+            forget_game_file(manifest, filename)
+
+    # The same game exported twice only counts once. Files are registered in
+    # name order, so the earliest export always ends up as the counted copy.
+    duplicates = {}
+    for filename in stats_files:
+        owner = register_fingerprint(manifest, filename)
+        if owner:
+            duplicates[filename] = owner
+
+    # Read detail sheets for games first ingested by a --rank-only run
+    if not rank_only:
+        detail_files = [f for f in stats_files
+                        if f not in duplicates and not has_detail_sheets(manifest['files'][f]['game'])]
+        if detail_files:
+            print(f"  Reading detail sheets for {len(detail_files)} files...")
+        detail_paths = [os.path.join(STATS_DIR, f) for f in detail_files]
+        for filename, detail in zip(detail_files, map_files(parse_detail_sheets, detail_paths, workers)):
+            manifest['files'][filename]['game'].update(detail)
+    parse_elapsed = time.perf_counter() - parse_start
+
     for filename in stats_files:
-        file_path = os.path.join(STATS_DIR, filename)
-        playlist = determine_playlist(file_path, active_match)
+        if filename in duplicates:
+            print(f"  [DUPLICATE] {filename} is the same game as {duplicates[filename]} - skipped")
+            continue
+
+        entry = manifest['files'][filename]
+        playlist = classify_playlist(entry['facts'], active_match)
+        entry['playlist'] = playlist
 
-        game = parse_excel_file(file_path)
-        game['source_file'] = filename
-        game['playlist'] = playlist  # Will be None for untagged games
+        # playlist will be None for untagged games
+        game = Game.from_json(entry['game'], source_file=filename, playlist=playlist)
 
         # ALL games go into all_games for stats tracking
         all_games.append(game)
 
-        map_name = game['details'].get('Map Name', 'Unknown')
-        gametype = game['details'].get('Variant Name', 'Unknown')
+        map_name = game.details.get('Map Name', 'Unknown')
+        gametype = game.details.get('Variant Name', 'Unknown')
 
         if playlist:
             if playlist not in games_by_playlist:
@@ -574,19 +1281,27 @@ def main():
             untagged_games.append(game)
             print(f"  [UNRANKED] {gametype} on {map_name} - stats only")
 
+    save_ingest_manifest(manifest)
+    source_hashes = {filename: entry['sha256'] for filename, entry in manifest['files'].items()}
+    # The game records hold everything the rest of the run needs; free the parsed dicts
+    del manifest
+    print(f"\n  Parsed {len(pending_files)} new/changed files in {parse_elapsed:.2f}s, "
+          f"reused {len(stats_files) - len(pending_files)} from {INGEST_MANIFEST_FILE}")
+
     # Summary
     print(f"\nGames categorized by playlist:")
     for playlist, games in games_by_playlist.items():
         print(f"  {playlist}: {len(games)} games (ranked)")
     if untagged_games:
         print(f"  Unranked (stats only): {len(untagged_games)} games")
+    if duplicates:
+        print(f"  Duplicates (skipped): {len(duplicates)} files")
     print(f"  Total games: {len(all_games)}")
 
     # Ranked games are those with a valid playlist tag
-    ranked_games = games_by_playlist.get(PLAYLIST_MLG_4V4, [])
-    ranked_games.extend(games_by_playlist.get(PLAYLIST_TEAM_HARDCORE, []))
-    ranked_games.extend(games_by_playlist.get(PLAYLIST_DOUBLE_TEAM, []))
-    ranked_games.extend(games_by_playlist.get(PLAYLIST_HEAD_TO_HEAD, []))
+    ranked_games = []
+    for playlist in RANKED_PLAYLISTS:
+        ranked_games.extend(games_by_playlist.get(playlist, []))
 
     print(f"\nTotal ranked games (for XP/rank): {len(ranked_games)}")
     print(f"Total games (for stats): {len(all_games)}")
@@ -596,150 +1311,119 @@ def main():
 
     # Track cumulative stats per player (from ALL games)
     player_game_stats = {}
-    # Track XP per playlist per player (only from ranked games)
-    player_playlist_xp = {}  # {player_name: {playlist: xp}}
-    player_playlist_wins = {}  # {player_name: {playlist: wins}}
-    player_playlist_losses = {}  # {player_name: {playlist: losses}}
-    player_playlist_games = {}  # {player_name: {playlist: games}}
 
     # First, identify all players from ALL games and match them to rankstats
     all_player_names = set()
     for game in all_games:
-        for player in game['players']:
-            all_player_names.add(player['name'])
+        for player in game.players:
+            all_player_names.add(player.name)
 
     # Match players to existing entries or create new ones
-    # Uses MAC ID-linked profile matching from players.json
+    # Uses MAC ID-linked profile matching from players.json; players without a
+    # Discord link get a stable placeholder ID from the player registry
+    registry = player_registry.load_player_registry()
     player_to_id = {}
-    for player_name in all_player_names:
-        user_id = find_player_by_name(rankstats, player_name, profile_lookup)
-        if user_id:
-            player_to_id[player_name] = user_id
-            # Update alias from players.json if available
-            if user_id in players:
-                player_data = players[user_id]
-                # Set alias from first entry in aliases array (for website display)
-                # Priority: aliases[0] > display_name
-                aliases = player_data.get('aliases', [])
-                if aliases:
-                    rankstats[user_id]['alias'] = aliases[0]
-                elif player_data.get('display_name'):
-                    rankstats[user_id]['alias'] = player_data['display_name']
+    merged = 0
+    for player_name in sorted(all_player_names):
+        linked_id = identity.linked_user(player_name)
+        if linked_id:
+            # Linked by /linkalias or identity sync: fold any placeholder into the Discord user
+            user_id = linked_id
+            if not registry.get(player_name):
+                # Placeholder from before the registry existed, found by its discord_name
+                for claimant, priority in identity.claimants(player_name):
+                    if (priority == identity_index.SOURCE_PRIORITY['discord_name'] and claimant != user_id
+                            and claimant in rankstats and claimant not in players):
+                        registry.adopt(player_name, claimant)
+                        break
+            placeholder_id = registry.merge(player_name, user_id)
+            if placeholder_id:
+                merged += 1
+                placeholder = rankstats.pop(placeholder_id, None)
+                if placeholder is not None and user_id not in rankstats:
+                    rankstats[user_id] = placeholder
+                print(f"  [MERGED] {player_name}: {placeholder_id} -> {user_id}")
+            if user_id not in rankstats:
+                rankstats[user_id] = new_rankstats_entry(player_name)
         else:
-            # Create new entry for unmatched player
-            temp_id = str(abs(hash(player_name)) % 10**18)
-            player_to_id[player_name] = temp_id
-            rankstats[temp_id] = {
-                'xp': 0,
-                'wins': 0,
-                'losses': 0,
-                'series_wins': 0,
-                'series_losses': 0,
-                'total_games': 0,
-                'total_series': 0,
-                'mmr': 750,
-                'discord_name': player_name,
-                'rank': 1
-            }
+            user_id = find_player_by_name(rankstats, player_name, identity)
+            if user_id and user_id not in players:
+                # Placeholder from an earlier run: keep its ID
+                registry.adopt(player_name, user_id)
+            elif not user_id:
+                # Create new entry for unmatched player
+                user_id = registry.issue(player_name)
+                identity.add_claim(player_name, user_id)
+                rankstats[user_id] = new_rankstats_entry(player_name)
+        player_to_id[player_name] = user_id
+
+        # Update alias from players.json if available
+        if user_id in players:
+            player_data = players[user_id]
+            # Set alias from first entry in aliases array (for website display)
+            # Priority: aliases[0] > display_name
+            aliases = player_data.get('aliases', [])
+            if aliases:
+                rankstats[user_id]['alias'] = aliases[0]
+            elif player_data.get('display_name'):
+                rankstats[user_id]['alias'] = player_data['display_name']
 
         # Initialize overall stats tracking (from ALL games)
         player_game_stats[player_name] = {
             'kills': 0, 'deaths': 0, 'assists': 0,
             'games': 0, 'headshots': 0
         }
-        # Initialize per-playlist tracking (only from ranked games)
-        player_playlist_xp[player_name] = {}
-        player_playlist_wins[player_name] = {}
-        player_playlist_losses[player_name] = {}
-        player_playlist_games[player_name] = {}
-
-    # Track current rank per player per playlist
-    player_playlist_rank = {}  # {player_name: {playlist: rank}}
-    # Track highest rank achieved per player per playlist
-    player_playlist_highest_rank = {}  # {player_name: {playlist: highest_rank}}
-    for name in all_player_names:
-        player_playlist_rank[name] = {}
-        player_playlist_highest_rank[name] = {}
 
     print(f"  Found {len(all_player_names)} unique players")
 
+    compacted = compact_player_registry(registry, rankstats, players, set(player_to_id.values()))
+    print(f"  Player registry: {len(registry.active_ids())} placeholder IDs, "
+          f"{merged} merged, {compacted} orphans compacted")
+
     # STEP 3a: Process ALL games for stats (kills, deaths, etc.)
     print("\n  Processing ALL games for stats...")
     for game_num, game in enumerate(all_games, 1):
-        game_name = game['details'].get('Variant Name', 'Unknown')
-        playlist = game.get('playlist')
+        game_name = game.details.get('Variant Name', 'Unknown')
+        playlist = game.playlist
         playlist_tag = f"[{playlist}]" if playlist else "[UNRANKED]"
 
-        for player in game['players']:
-            player_name = player['name']
+        for player in game.players:
+            player_name = player.name
 
             # Update cumulative stats from ALL games
-            player_game_stats[player_name]['kills'] += player.get('kills', 0)
-            player_game_stats[player_name]['deaths'] += player.get('deaths', 0)
-            player_game_stats[player_name]['assists'] += player.get('assists', 0)
-            player_game_stats[player_name]['headshots'] += player.get('head_shots', 0)
+            player_game_stats[player_name]['kills'] += player.kills
+            player_game_stats[player_name]['deaths'] += player.deaths
+            player_game_stats[player_name]['assists'] += player.assists
+            player_game_stats[player_name]['headshots'] += player.head_shots
             player_game_stats[player_name]['games'] += 1
 
     print(f"  Processed {len(all_games)} games for stats")
 
-    # STEP 3b: Process RANKED games for XP/wins/losses (per playlist)
+    # STEP 3b: Replay RANKED games for XP/wins/losses (per playlist)
+    # XP factors depend on rank at game time, so games are replayed in order.
+    # The checkpoint holds the state after the last replayed game; only new games are replayed.
+    # With seasons.json, only the current season's games count (ranks reset every season)
     print("\n  Processing RANKED games for XP (per playlist)...")
-    for game_num, game in enumerate(ranked_games, 1):
-        winners, losers = determine_winners_losers(game)
-        game_name = game['details'].get('Variant Name', 'Unknown')
-        playlist = game.get('playlist')
-
-        if not playlist:
-            continue  # Skip untagged games for ranking
-
-        print(f"\n  Ranked Game {game_num} [{playlist}]: {game_name}")
-
-        for player in game['players']:
-            player_name = player['name']
-
-            # Initialize playlist tracking if needed
-            if playlist not in player_playlist_xp[player_name]:
-                player_playlist_xp[player_name][playlist] = 0
-                player_playlist_wins[player_name][playlist] = 0
-                player_playlist_losses[player_name][playlist] = 0
-                player_playlist_games[player_name][playlist] = 0
-                player_playlist_rank[player_name][playlist] = 1
-                player_playlist_highest_rank[player_name][playlist] = 1
-
-            # Get current XP and rank for this playlist
-            old_xp = player_playlist_xp[player_name][playlist]
-            current_rank = player_playlist_rank[player_name][playlist]
-
-            if player_name in winners:
-                player_playlist_wins[player_name][playlist] += 1
-                player_playlist_games[player_name][playlist] += 1
-                # Apply win factor (high ranks gain less)
-                win_factor = get_win_factor(current_rank, win_factors)
-                xp_change = int(xp_win * win_factor)
-                player_playlist_xp[player_name][playlist] += xp_change
-                result = f"WIN (+{xp_change} @ {int(win_factor*100)}%)"
-            elif player_name in losers:
-                player_playlist_losses[player_name][playlist] += 1
-                player_playlist_games[player_name][playlist] += 1
-                # Apply loss factor (low ranks lose less)
-                loss_factor = get_loss_factor(current_rank, loss_factors)
-                xp_change = int(xp_loss * loss_factor)  # xp_loss is negative
-                player_playlist_xp[player_name][playlist] += xp_change
-                # Ensure XP cannot go below 0
-                if player_playlist_xp[player_name][playlist] < 0:
-                    player_playlist_xp[player_name][playlist] = 0
-                result = f"LOSS ({xp_change} @ {int(loss_factor*100)}%)"
-            else:
-                player_playlist_games[player_name][playlist] += 1
-                result = "TIE"
-
-            new_xp = player_playlist_xp[player_name][playlist]
-            new_rank = calculate_rank(new_xp, rank_thresholds)
-            player_playlist_rank[player_name][playlist] = new_rank
-            # Track highest rank achieved in this playlist
-            if new_rank > player_playlist_highest_rank[player_name][playlist]:
-                player_playlist_highest_rank[player_name][playlist] = new_rank
-            print(f"    {player_name}: {result} | XP: {old_xp} -> {new_xp} | Rank: {new_rank}")
+    season_list = seasons.load_seasons()
+    live_season = seasons.current_season(season_list)
+    games_by_season = seasons.split_by_season(season_list, games_by_playlist)
+    live_games_by_playlist = games_by_season[live_season['id']] if live_season else games_by_playlist
+    if live_season:
+        print(f"  Current season: {live_season['name']} (from {live_season['start']})")
+
+    config_hash = xp_config_hash(xp_config)
+    checkpoint = new_xp_checkpoint(config_hash) if full_rebuild else load_xp_checkpoint(config_hash)
+    # Playlist replay is only parallel when asked for; there are just a few playlists
+    replayed = replay_playlists(checkpoint, live_games_by_playlist, source_hashes, rank_table, workers or 1)
+    save_xp_checkpoint(checkpoint)
+    live_games = sum(len(games) for games in live_games_by_playlist.values())
+    print(f"\n  Replayed {replayed} ranked games, {live_games - replayed} from {XP_CHECKPOINT_FILE}")
+
+    # {player_name: {playlist: state}} from the checkpoint
+    player_playlists = {name: {} for name in all_player_names}
+    for playlist in RANKED_PLAYLISTS:
+        for player_name, state in checkpoint['playlists'][playlist]['players'].items():
+            player_playlists[player_name][playlist] = state
 
     # STEP 4: Update rankstats with final values
     print("\n\nStep 4: Updating rankstats with final values...")
@@ -756,9 +1440,9 @@ def main():
         rankstats[user_id]['headshots'] = stats['headshots']
 
         # Calculate total wins/losses across all playlists (for legacy compatibility)
-        total_wins = sum(player_playlist_wins[player_name].values())
-        total_losses = sum(player_playlist_losses[player_name].values())
-        total_ranked_games = sum(player_playlist_games[player_name].values())
+        playlist_states = player_playlists[player_name]
+        total_wins = sum(state['wins'] for state in playlist_states.values())
+        total_losses = sum(state['losses'] for state in playlist_states.values())
 
         rankstats[user_id]['wins'] = total_wins
         rankstats[user_id]['losses'] = total_losses
@@ -769,13 +1453,13 @@ def main():
         primary_playlist = None
         primary_xp = 0
 
-        for playlist in player_playlist_xp[player_name]:
-            playlist_xp = player_playlist_xp[player_name][playlist]
-            playlist_rank = calculate_rank(playlist_xp, rank_thresholds)
-            playlist_highest = player_playlist_highest_rank[player_name].get(playlist, 1)
-            playlist_wins = player_playlist_wins[player_name].get(playlist, 0)
-            playlist_losses = player_playlist_losses[player_name].get(playlist, 0)
-            playlist_games = player_playlist_games[player_name].get(playlist, 0)
+        for playlist, state in playlist_states.items():
+            playlist_xp = state['xp']
+            playlist_rank = rank_table.calculate_rank(playlist_xp)
+            playlist_highest = state['highest_rank']
+            playlist_wins = state['wins']
+            playlist_losses = state['losses']
+            playlist_games = state['games']
 
             playlists_data[playlist] = {
                 'xp': playlist_xp,
@@ -804,7 +1488,7 @@ def main():
         # For legacy compatibility: use primary playlist's XP/rank as the main one
         if primary_playlist:
             rankstats[user_id]['xp'] = primary_xp
-            rankstats[user_id]['rank'] = calculate_rank(primary_xp, rank_thresholds)
+            rankstats[user_id]['rank'] = rank_table.calculate_rank(primary_xp)
         else:
             # No ranked games played
             rankstats[user_id]['xp'] = 0
@@ -812,58 +1496,56 @@ def main():
 
         rankstats[user_id]['highest_rank'] = overall_highest_rank
 
+    # STEP 4b: Recompute MMR from every ranked game, oldest first (admin /mmr offsets are kept)
+    start = time.perf_counter()
+    matches = []
+    for game in sorted(ranked_games, key=lambda g: g.source_file):
+        winners, losers = determine_winners_losers(game)
+        matches.append(([player_to_id[name] for name in winners], [player_to_id[name] for name in losers]))
+    ratings, games_played = mmr_engine.rate_matches(matches)
+    mmr_engine.apply_ratings(rankstats, ratings, games_played)
+    print(f"  MMR: rated {len(ratings)} players from {len(matches)} ranked games "
+          f"in {time.perf_counter() - start:.2f}s")
+
     # STEP 5: Save all data files
     print("\nStep 5: Saving data files...")
 
-    with open(RANKSTATS_FILE, 'w') as f:
-        json.dump(rankstats, f, indent=2)
-    print(f"  Saved {RANKSTATS_FILE}")
+    indent = 2 if pretty else None
+    save_artifact(RANKSTATS_FILE, rankstats, indent)
 
-    # Save ALL games to gameshistory.json (includes ranked and unranked)
-    # Games have their playlist set from determine_playlist() - None for unranked
-    with open(GAMESDATA_FILE, 'w') as f:
-        json.dump(all_games, f, indent=2)
-    print(f"  Saved {GAMESDATA_FILE} ({len(all_games)} total games)")
+    identity_index.refresh_identity_index(identity, rankstats=rankstats)
+    identity_index.save_identity_index(identity)
+    print(f"  Saved {identity_index.IDENTITY_INDEX_FILE}")
 
-    # Extract and save player emblems (most recent emblem for each player)
-    # Maps discord_id to their emblem_url
-    emblems = {}
-    for game in all_games:
-        for player in game['players']:
-            emblem_url = player.get('emblem_url')
-            if emblem_url:
-                player_name = player['name']
-                # Get discord ID for this player
-                user_id = player_to_id.get(player_name)
-                if user_id:
-                    emblems[user_id] = {
-                        'emblem_url': emblem_url,
-                        'player_name': player_name,
-                        'discord_name': rankstats.get(user_id, {}).get('discord_name', player_name)
-                    }
-
-    with open(EMBLEMS_FILE, 'w') as f:
-        json.dump(emblems, f, indent=2)
-    print(f"  Saved {EMBLEMS_FILE} ({len(emblems)} player emblems)")
+    player_registry.save_player_registry(registry)
+    print(f"  Saved {player_registry.PLAYER_REGISTRY_FILE}")
+
+    names = {user_id: entry.get('alias') or entry.get('discord_name') or user_id
+             for user_id, entry in rankstats.items()}
+    save_artifact(trajectory_store.TRAJECTORIES_FILE,
+                  trajectory_store.build_trajectories(checkpoint['playlists'], player_to_id, names))
+
+    if season_list:
+        write_season_snapshots(season_list, live_season, games_by_season, checkpoint, source_hashes,
+                               rank_table, player_to_id, rankstats)
 
     # Create gamestats.json (includes all games)
     gamestats = {}
     for i, game in enumerate(all_games, 1):
         match_key = f"match_{i}"
+        details = game.details
         gamestats[match_key] = {
             "game_1": {
-                'map': game['details'].get('Map Name', 'Unknown'),
-                'gametype': game['details'].get('Variant Name', 'Unknown'),
-                'game_type': game['details'].get('Game Type', 'Unknown'),
-                'timestamp': game['details'].get('Start Time', ''),
-                'duration': game['details'].get('Duration', ''),
-                'playlist': game.get('playlist')  # None for unranked games
+                'map': details.get('Map Name', 'Unknown'),
+                'gametype': details.get('Variant Name', 'Unknown'),
+                'game_type': details.get('Game Type', 'Unknown'),
+                'timestamp': details.get('Start Time', ''),
+                'duration': details.get('Duration', ''),
+                'playlist': game.playlist  # None for unranked games
             }
         }
 
-    with open(GAMESTATS_FILE, 'w') as f:
-        json.dump(gamestats, f, indent=2)
-    print(f"  Saved {GAMESTATS_FILE}")
+    save_artifact(GAMESTATS_FILE, gamestats, indent)
 
     # Create matchhistory.json (includes all games with proper tagging)
     matchhistory = {
@@ -874,17 +1556,18 @@ def main():
 
     for i, game in enumerate(all_games, 1):
         winners, losers = determine_winners_losers(game)
-        red_team = [p['name'] for p in game['players'] if p.get('team') == 'Red']
-        blue_team = [p['name'] for p in game['players'] if p.get('team') == 'Blue']
-        playlist = game.get('playlist')
+        red_team = [p.name for p in game.players if p.team == 'Red']
+        blue_team = [p.name for p in game.players if p.team == 'Blue']
+        playlist = game.playlist
+        details = game.details
 
         match_entry = {
             'match_number': i,
             'match_type': 'RANKED' if playlist else 'UNRANKED',
             'playlist': playlist,  # None for unranked games
-            'timestamp': game['details'].get('Start Time', ''),
-            'map': game['details'].get('Map Name', 'Unknown'),
-            'gametype': game['details'].get('Variant Name', 'Unknown'),
+            'timestamp': details.get('Start Time', ''),
+            'map': details.get('Map Name', 'Unknown'),
+            'gametype': details.get('Variant Name', 'Unknown'),
             'red_team': red_team,
             'blue_team': blue_team,
             'winners': winners,
@@ -892,26 +1575,75 @@ def main():
         }
         matchhistory['matches'].append(match_entry)
 
-    with open(MATCHHISTORY_FILE, 'w') as f:
-        json.dump(matchhistory, f, indent=2)
-    print(f"  Saved {MATCHHISTORY_FILE}")
+    save_artifact(MATCHHISTORY_FILE, matchhistory, indent)
+
+    # Counts for the summary below, taken before the game records are dropped
+    total_games = len(all_games)
+    ranked_count = len(ranked_games)
+    untagged_count = len(untagged_games)
+    playlist_counts = {}
+    for game in ranked_games:
+        pl = game.playlist
+        if pl:
+            playlist_counts[pl] = playlist_counts.get(pl, 0) + 1
+
+    if rank_only:
+        print(f"  Rank-only run: {GAMES_DB_FILE}, {game_shards.GAMES_DIR}/, {GAMESDATA_FILE}, "
+              f"{site_aggregates.AGGREGATES_DIR}/ and {EMBLEMS_FILE} left unchanged")
+    else:
+        # Extract and save player emblems (most recent emblem for each player)
+        # Maps discord_id to their emblem_url
+        emblems = {}
+        for game in all_games:
+            for player in game.detailed_stats or ():
+                emblem_url = player.emblem_url
+                if emblem_url:
+                    player_name = player.player
+                    # Get discord ID for this player
+                    user_id = player_to_id.get(player_name)
+                    if user_id:
+                        emblems[user_id] = {
+                            'emblem_url': emblem_url,
+                            'player_name': player_name,
+                            'discord_name': rankstats.get(user_id, {}).get('discord_name', player_name)
+                        }
+
+        save_artifact(EMBLEMS_FILE, emblems, indent, f"{len(emblems)} player emblems")
+
+        # Store ALL games in the SQLite game store; the JSON files below are generated from it
+        conn = game_store.connect(GAMES_DB_FILE)
+        inserted, updated, deleted = game_store.sync_games(conn, (game.to_json() for game in all_games), source_hashes,
+                                                           INGEST_MANIFEST_VERSION)
+        print(f"  Synced {GAMES_DB_FILE} ({inserted} inserted, {updated} unchanged, {deleted} removed)")
+        # Drop the game records before reloading the full dicts, so only one copy is alive
+        del all_games, ranked_games, untagged_games, games_by_playlist, games_by_season, live_games_by_playlist
+        game_dicts = game_store.load_games(conn)
+        conn.close()
+
+        # Save ALL games to games/ (includes ranked and unranked): the index plus changed month shards
+        # Games have their playlist set from determine_playlist() - None for unranked
+        index, written, removed = game_shards.write_game_shards(game_dicts, indent=indent)
+        print(f"  Saved {game_shards.GAMES_DIR}/{game_shards.GAMES_INDEX_FILE} ({len(game_dicts)} total games, "
+              f"{len(index['shards'])} shards: {len(written)} written, {len(removed)} removed)")
+        save_artifact(GAMESDATA_FILE, game_dicts, indent, f"{len(game_dicts)} total games")
+
+        # Career and breakdown totals for the site, in one pass over the same games
+        aggregates = site_aggregates.build_aggregates(game_dicts)
+        sizes = site_aggregates.write_aggregates(aggregates, indent=indent)
+        print(f"  Saved {site_aggregates.AGGREGATES_DIR}/ (" +
+              ', '.join(f"{os.path.basename(path)} {size / 1024:.1f} KB" for path, size in sizes.items()) + ")")
 
     # Print summary
     print("\n" + "=" * 50)
     print("STATS POPULATION SUMMARY")
     print("=" * 50)
     print(f"\nGames Summary:")
-    print(f"  Total games (stats tracked): {len(all_games)}")
-    print(f"  Ranked games (XP/rank counts): {len(ranked_games)}")
-    print(f"  Unranked games (stats only): {len(untagged_games)}")
+    print(f"  Total games (stats tracked): {total_games}")
+    print(f"  Ranked games (XP/rank counts): {ranked_count}")
+    print(f"  Unranked games (stats only): {untagged_count}")
 
     # Count ranked games by playlist
     print(f"\nRanked Games by Playlist:")
-    playlist_counts = {}
-    for game in ranked_games:
-        pl = game.get('playlist')
-        if pl:
-            playlist_counts[pl] = playlist_counts.get(pl, 0) + 1
     for pl, count in sorted(playlist_counts.items()):
         print(f"  {pl}: {count} games")
 
@@ -928,63 +1660,116 @@ def main():
         losses = d.get('losses', 0)
         print(f"  {name:20s} | Rank: {rank:2d} | XP: {xp:4d} | W-L: {wins}-{losses}")
 
-    # STEP 6: Update HTML file with embedded data
-    print("\nStep 6: Updating HTML file...")
-    update_html_file(all_games, rankstats)
+    # STEP 6: Update the data script loaded by the HTML page
+    if not rank_only:
+        print("\nStep 6: Updating HTML page data...")
+        update_html_data(game_dicts, rankstats, indent)
 
     print("\nDone!")
 
 
-def update_html_file(games_data, rank_stats):
-    """Update the HTML file with embedded gamesData and rankStats."""
-    import re
+def snapshot_stats_dir():
+    """Get {filename: (size, mtime_ns)} for every xlsx file in the stats folder."""
+    snapshot = {}
+    for filename in os.listdir(STATS_DIR):
+        if filename.endswith('.xlsx'):
+            try:
+                stat = os.stat(os.path.join(STATS_DIR, filename))
+            except OSError:
+                continue  # Removed between listdir and stat
+            snapshot[filename] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+def watch(workers=None, poll_interval=WATCH_POLL_INTERVAL, debounce=WATCH_DEBOUNCE, full_rebuild=False,
+          pretty=False):
+    """
+    Keep the site data up to date as new stats files land in STATS_DIR.
 
-    with open(HTML_FILE, 'r') as f:
-        html_content = f.read()
-
-    # Update gamesData - find and replace the entire line
-    games_json = json.dumps(games_data)
-    # Use a function to avoid escape issues
-    def replace_games(match):
-        return f'let gamesData = {games_json};'
-
-    html_content = re.sub(
-        r'let gamesData = \[.*?\];',
-        replace_games,
-        html_content,
-        flags=re.DOTALL
-    )
-
-    # Add or update rankStats
-    rank_stats_json = json.dumps(rank_stats)
-
-    def replace_rankstats(match):
-        return f'let rankStats = {rank_stats_json};'
-
-    if 'let rankStats = ' in html_content:
-        html_content = re.sub(
-            r'let rankStats = \{.*?\};',
-            replace_rankstats,
-            html_content,
-            flags=re.DOTALL
-        )
-    else:
-        # Insert rankStats after gamesData line
-        def insert_rankstats(match):
-            return f'{match.group(0)}\n        let rankStats = {rank_stats_json};'
+    Polls the folder, waits until it has been quiet for `debounce` seconds (so a
+    burst of games or a file still being copied is handled in one go), then
+    re-runs main(). The ingestion manifest means only the new files are parsed.
+
+    Args:
+        full_rebuild: Re-parse everything on the initial run (see main)
+    """
+    print(f"[WATCH] Watching {STATS_DIR}/ (poll every {poll_interval}s, debounce {debounce}s)")
+    main(full_rebuild=full_rebuild, workers=workers, pretty=pretty)
+    last_snapshot = snapshot_stats_dir()
 
-        html_content = re.sub(
-            r'let gamesData = \[.*?\];',
-            insert_rankstats,
-            html_content,
-            flags=re.DOTALL
-        )
+    try:
+        while True:
+            time.sleep(poll_interval)
+            current = snapshot_stats_dir()
+            if current == last_snapshot:
+                continue
+
+            # Wait for the folder to settle before ingesting
+            while True:
+                time.sleep(debounce)
+                settled = snapshot_stats_dir()
+                if settled == current:
+                    break
+                current = settled
+
+            changed = [f for f in current if last_snapshot.get(f) != current[f]]
+            removed = [f for f in last_snapshot if f not in current]
+            print(f"\n[WATCH] {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - "
+                  f"{len(changed)} new/changed, {len(removed)} removed stats file(s)")
+            try:
+                main(workers=workers, pretty=pretty)
+            except Exception as e:
+                # Keep watching; the snapshot is left as it was, so the next poll retries the rebuild
+                print(f"[WATCH] Rebuild failed: {e}")
+                continue
+            last_snapshot = current
+    except KeyboardInterrupt:
+        print("\n[WATCH] Stopped")
+
+def update_html_data(games_data, rank_stats, indent=None):
+    """
+    Write the gamesData and rankStats globals of h2carnagereport.html to its data script.
 
-    with open(HTML_FILE, 'w') as f:
-        f.write(html_content)
+    The page loads HTML_DATA_FILE with a <script src> tag, so new data is
+    written straight to that file and the HTML itself is never rewritten.
+    """
+    raw = b''.join([
+        b'// Generated by populate_stats.py - do not edit\n',
+        b'let gamesData = ', artifact_writer.encode_json(games_data, indent), b';\n',
+        b'let rankStats = ', artifact_writer.encode_json(rank_stats, indent), b';\n'
+    ])
+    sizes = artifact_writer.write_artifact(HTML_DATA_FILE, raw)
+    print(f"  Saved {HTML_DATA_FILE} ({sizes[HTML_DATA_FILE] / 1024:.1f} KB)")
 
-    print(f"  Updated {HTML_FILE}")
+    with open(HTML_FILE, 'r') as f:
+        if f'src="{HTML_DATA_FILE}"' not in f.read():
+            print(f"  Warning: {HTML_FILE} doesn't load {HTML_DATA_FILE} - add "
+                  f'<script src="{HTML_DATA_FILE}"></script> before its inline script')
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Populate site data and rankings from stats files")
+    parser.add_argument('--full', action='store_true',
+                        help=f"Ignore {INGEST_MANIFEST_FILE} and re-parse every stats file")
+    parser.add_argument('--workers', type=int, default=None,
+                        help=f"Parse new/changed stats files and replay playlists in N processes. Default: "
+                             f"parse with one process per CPU when at least {PARALLEL_MIN_FILES} files changed "
+                             f"(an estimated crossover), else serially, and replay serially")
+    parser.add_argument('--watch', action='store_true',
+                        help=f"Keep running and rebuild whenever files in {STATS_DIR}/ change")
+    parser.add_argument('--poll-interval', type=float, default=WATCH_POLL_INTERVAL,
+                        help=f"Watch mode: seconds between folder checks (default: {WATCH_POLL_INTERVAL})")
+    parser.add_argument('--debounce', type=float, default=WATCH_DEBOUNCE,
+                        help=f"Watch mode: seconds the folder must be quiet before a rebuild (default: {WATCH_DEBOUNCE})")
+    parser.add_argument('--rank-only', action='store_true',
+                        help="Only read Game Details/Post Game Report and update the rankings")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Write the site JSON files indented instead of compact "
+                             "(rankstats/gamestats/matchhistory are always indented)")
+    args = parser.parse_args()
+    if args.watch and args.rank_only:
+        parser.error("--rank-only can't be combined with --watch")
+    if args.watch:
+        watch(workers=args.workers, poll_interval=args.poll_interval, debounce=args.debounce,
+              full_rebuild=args.full, pretty=args.pretty)
+    else:
+        main(full_rebuild=args.full, workers=args.workers, rank_only=args.rank_only, pretty=args.pretty)
@@ -5,6 +5,8 @@ from discord.ui import View, Button
 from typing import List
 from datetime import datetime
 
+import artifact_writer
+
 # Will be imported from bot.py
 POSTGAME_LOBBY_ID = None
 QUEUE_CHANNEL_ID = None
@@ -111,9 +113,8 @@ def save_match_history(series, winner: str):
     # Add new match
     history["matches"].append(match_entry)
     
-    # Save back to file
-    with open(history_file, 'w') as f:
-        json.dump(history, f, indent=2)
+    # Save back to file (same format as populate_stats.py's matchhistory.json)
+    artifact_writer.write_json_artifact(history_file, history, indent=artifact_writer.BOT_SHARED_INDENT)
     
     log_action(f"Saved {match_type} match {series.series_number} to {history_file}")
 
@@ -232,8 +233,7 @@ def log_individual_game(series, game_number: int, winner: str):
     
     history["games"].append(game_entry)
     
-    with open(history_file, 'w') as f:
-        json.dump(history, f, indent=2)
+    artifact_writer.write_json_artifact(history_file, history, indent=artifact_writer.BOT_SHARED_INDENT)
     
     log_action(f"Logged individual game {game_number} to {history_file}")
     
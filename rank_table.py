@@ -0,0 +1,124 @@
+"""
+rank_table.py - Precompiled rank lookups from xp_config.json
+
+Both rank engines (the bot's STATSRANKS cog and populate_stats.py) turn XP into
+a rank level and pick win/loss XP factors by rank. RankTable does that from
+one parsed copy of xp_config.json: rank lookups are a bisect over the sorted
+lower bounds, and the factors are precomputed per level.
+
+get_rank_table() caches one table per config file and rebuilds it only when
+the file's mtime or size changes, so callers can ask for it on every lookup.
+
+Usage:
+    from rank_table import get_rank_table
+    table = get_rank_table()
+    rank, xp_in_rank, xp_for_next = table.get_rank_progress(1234)
+"""
+
+import bisect
+import json
+import os
+
+XP_CONFIG_FILE = 'xp_config.json'
+
+# Win factors only apply above this rank, loss factors only below LOSS_FACTOR_MAX_RANK
+WIN_FACTOR_MIN_RANK = 40
+LOSS_FACTOR_MAX_RANK = 30
+
+# Win factor for ranks above WIN_FACTOR_MIN_RANK missing from win_factors
+DEFAULT_HIGH_RANK_WIN_FACTOR = 0.50
+
+# {config path: (mtime_ns, size, RankTable)}
+_tables = {}
+
+
+class RankTable:
+    """
+    Rank thresholds and XP factors from one xp_config.json.
+
+    A rank is the highest level whose minimum XP is <= the player's XP
+    (level 1 below every minimum).
+    """
+
+    __slots__ = ('game_win', 'game_loss', 'max_level', '_mins', '_levels', '_level_mins',
+                 '_win_factors', '_loss_factors', '_win_factor_table', '_loss_factor_table')
+
+    def __init__(self, xp_config):
+        self.game_win = xp_config.get('game_win', 0)
+        self.game_loss = xp_config.get('game_loss', 0)
+
+        thresholds = sorted((int(min_xp), int(level))
+                            for level, (min_xp, max_xp) in xp_config.get('rank_thresholds', {}).items())
+        self._mins = [min_xp for min_xp, _ in thresholds]
+        self._levels = [level for _, level in thresholds]
+        self._level_mins = {level: min_xp for min_xp, level in thresholds}
+        self.max_level = max(self._levels, default=1)
+
+        self._win_factors = {int(rank): factor for rank, factor in xp_config.get('win_factors', {}).items()}
+        self._loss_factors = {int(rank): factor for rank, factor in xp_config.get('loss_factors', {}).items()}
+        self._win_factor_table = [self._compute_win_factor(rank) for rank in range(self.max_level + 1)]
+        self._loss_factor_table = [self._compute_loss_factor(rank) for rank in range(self.max_level + 1)]
+
+    @classmethod
+    def from_file(cls, path=XP_CONFIG_FILE):
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def _compute_win_factor(self, rank):
+        if rank <= WIN_FACTOR_MIN_RANK:
+            return 1.0  # Full win bonus
+        return self._win_factors.get(rank, DEFAULT_HIGH_RANK_WIN_FACTOR)
+
+    def _compute_loss_factor(self, rank):
+        if rank >= LOSS_FACTOR_MAX_RANK:
+            return 1.0  # Full loss penalty
+        return self._loss_factors.get(rank, 1.0)
+
+    def thresholds(self):
+        """Get the (minimum XP, level) pairs, sorted by minimum XP."""
+        return list(zip(self._mins, self._levels))
+
+    def calculate_rank(self, xp):
+        """Get the rank level for an XP total."""
+        index = bisect.bisect_right(self._mins, xp) - 1
+        if index < 0:
+            return 1
+        # Levels sharing a minimum: the highest one wins
+        return self._levels[index]
+
+    def get_rank_progress(self, xp):
+        """Get (rank, XP into the rank, XP needed for the next rank)."""
+        rank = self.calculate_rank(xp)
+        if rank >= self.max_level or rank + 1 not in self._level_mins:
+            return rank, xp, 0  # Max rank
+        current_min = self._level_mins.get(rank, 0)
+        return rank, xp - current_min, self._level_mins[rank + 1] - xp
+
+    def get_win_factor(self, rank):
+        """Get the win XP factor for a rank. Higher ranks gain less XP."""
+        if 0 <= rank < len(self._win_factor_table):
+            return self._win_factor_table[rank]
+        return self._compute_win_factor(rank)
+
+    def get_loss_factor(self, rank):
+        """Get the loss XP factor for a rank. Lower ranks lose less XP."""
+        if 0 <= rank < len(self._loss_factor_table):
+            return self._loss_factor_table[rank]
+        return self._compute_loss_factor(rank)
+
+
+def get_rank_table(path=XP_CONFIG_FILE):
+    """
+    Get the RankTable for a config file, rebuilding it only when the file changed.
+
+    Raises:
+        OSError: the config file doesn't exist
+    """
+    stat = os.stat(path)
+    cached = _tables.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    table = RankTable.from_file(path)
+    _tables[path] = (stat.st_mtime_ns, stat.st_size, table)
+    return table
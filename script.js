@@ -1,6 +1,20 @@
 // Initialize empty games data array
 let gamesData = [];
 
+// Game history: a small index of every game plus month shards with the detail
+// sheets (versus, detailed stats, medals, weapons), fetched when first needed.
+// Falls back to the single gameshistory.json written by older versions.
+const GAMES_INDEX_URL = 'games/index.json';
+const LEGACY_GAMES_URL = 'gameshistory.json';
+let gameShardFiles = {};     // shard key -> file in games/
+let gameShardRequests = {};  // shard key -> fetch promise, so each shard is fetched once
+
+// Career and breakdown totals precomputed by populate_stats.py (see site_aggregates.py),
+// one file per kind: players, maps, variants, medals, weapons
+const AGGREGATES_DIR = 'aggregates/';
+let aggregates = {};         // kind -> {name: totals}, once loaded
+let aggregateRequests = {};  // kind -> fetch promise
+
 // Global player ranks (randomly assigned once)
 let playerRanks = {};
 
@@ -485,7 +499,7 @@ async function loadGamesData() {
     console.log('[DEBUG] Starting to load games data...');
     console.log('[DEBUG] Current URL:', window.location.href);
     console.log('[DEBUG] Protocol:', window.location.protocol);
-    console.log('[DEBUG] Fetch URL: gameshistory.json');
+    console.log('[DEBUG] Fetch URL:', GAMES_INDEX_URL);
     
     // Check if running from file:// protocol
     if (window.location.protocol === 'file:') {
@@ -508,7 +522,13 @@ async function loadGamesData() {
     
     try {
         console.log('[DEBUG] Attempting fetch...');
-        const response = await fetch('gameshistory.json');
+        let response = await fetch(GAMES_INDEX_URL);
+        let isIndex = true;
+        if (response.status === 404) {
+            console.log('[DEBUG] No game index, falling back to', LEGACY_GAMES_URL);
+            response = await fetch(LEGACY_GAMES_URL);
+            isIndex = false;
+        }
         
         console.log('[DEBUG] Response status:', response.status);
         console.log('[DEBUG] Response ok:', response.ok);
@@ -523,7 +543,16 @@ async function loadGamesData() {
         const text = await response.text();
         console.log('[DEBUG] Response size:', text.length, 'bytes');
         
-        gamesData = JSON.parse(text);
+        const data = JSON.parse(text);
+        if (isIndex) {
+            gamesData = data.games;
+            gameShardFiles = {};
+            Object.entries(data.shards).forEach(([shard, info]) => {
+                gameShardFiles[shard] = info.file;
+            });
+        } else {
+            gamesData = data;
+        }
         
         console.log('[DEBUG] Games loaded successfully!');
         console.log('[DEBUG] Number of games:', gamesData.length);
@@ -565,7 +594,7 @@ async function loadGamesData() {
         let helpText = 'Check browser console (F12) for details';
         
         if (error.message.includes('404') || error.message.includes('Not Found')) {
-            helpText = 'File gameshistory.json not found. Make sure it\'s in the same directory as index.html';
+            helpText = 'Game data not found. Make sure games/index.json (or gameshistory.json) is in the same directory as index.html';
         } else if (error.message.includes('Failed to fetch')) {
             helpText = 'Cannot load file. Are you running from file:// ? You need to use a web server (see README.md)';
         } else if (error.name === 'SyntaxError') {
@@ -584,6 +613,111 @@ async function loadGamesData() {
     }
 }
 
+// Fetch one month shard and merge its detail sheets into the games it holds
+function loadGameShard(shard) {
+    if (!gameShardRequests[shard]) {
+        gameShardRequests[shard] = fetch('games/' + gameShardFiles[shard])
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status} - ${response.statusText}`);
+                }
+                return response.json();
+            })
+            .then(data => {
+                gamesData.forEach(game => {
+                    if (game.shard === shard) {
+                        Object.assign(game, data.games[game.source_file]);
+                        game.detailsLoaded = true;
+                    }
+                });
+                console.log(`[DEBUG] Loaded game shard ${shard}`);
+            })
+            .catch(error => {
+                delete gameShardRequests[shard];  // Retry on next use
+                throw error;
+            });
+    }
+    return gameShardRequests[shard];
+}
+
+// Fetch one aggregates file (resolves at once when it is loaded)
+function loadAggregate(kind) {
+    if (!aggregateRequests[kind]) {
+        aggregateRequests[kind] = fetch(`${AGGREGATES_DIR}${kind}.json`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status} - ${response.statusText}`);
+                }
+                return response.json();
+            })
+            .then(data => {
+                aggregates[kind] = data[kind];
+                console.log(`[DEBUG] Loaded ${kind} aggregates`);
+                return aggregates[kind];
+            })
+            .catch(error => {
+                delete aggregateRequests[kind];  // Retry on next use
+                throw error;
+            });
+    }
+    return aggregateRequests[kind];
+}
+
+function loadAggregates(kinds) {
+    return Promise.all(kinds.map(loadAggregate));
+}
+
+// Only the official Halo 2 medals (medalIcons) of a {medal: count} breakdown
+function halo2Medals(medalCounts) {
+    return Object.fromEntries(Object.entries(medalCounts || {}).filter(([medal]) => medalIcons[medal]));
+}
+
+function sumCounts(counts) {
+    return Object.values(counts || {}).reduce((sum, count) => sum + count, 0);
+}
+
+// Games in gamesData order for a list of source files
+function gamesFromSourceFiles(sourceFiles) {
+    const wanted = new Set(sourceFiles);
+    return gamesData.filter(game => wanted.has(game.source_file));
+}
+
+// A weapon search name covers every weapon stat containing it ('rifle' -> battle rifle, sniper rifle, ...)
+function matchWeaponAggregates(weaponName) {
+    const query = weaponName.toLowerCase();
+    const merged = { kills: 0, games: new Set(), players: {}, maps: {}, variants: {} };
+    Object.entries(aggregates.weapons || {}).forEach(([weapon, entry]) => {
+        if (!weapon.toLowerCase().includes(query)) return;
+        merged.kills += entry.kills;
+        entry.games.forEach(sourceFile => merged.games.add(sourceFile));
+        Object.entries(entry.players).forEach(([name, stats]) => {
+            if (!merged.players[name]) {
+                merged.players[name] = { kills: 0, games: 0 };
+            }
+            merged.players[name].kills += stats.kills;
+            merged.players[name].games += stats.games;
+        });
+        Object.entries(entry.maps).forEach(([map, kills]) => {
+            merged.maps[map] = (merged.maps[map] || 0) + kills;
+        });
+        Object.entries(entry.variants).forEach(([variant, kills]) => {
+            merged.variants[variant] = (merged.variants[variant] || 0) + kills;
+        });
+    });
+    return merged;
+}
+
+// Make sure the detail sheets of these games are loaded (resolves at once when they are)
+function loadGameDetails(games) {
+    const shards = new Set(games.filter(game => game.shard && !game.detailsLoaded).map(game => game.shard));
+    return Promise.all([...shards].map(loadGameShard));
+}
+
+function showGameDetailsError(element, error) {
+    console.error('[ERROR] Failed to load game details:', error);
+    element.innerHTML = `<div class="loading-message">[ ERROR LOADING GAME DETAILS ]<br>${error.message}</div>`;
+}
+
 function switchMainTab(tabName) {
     const allMainTabs = document.querySelectorAll('.main-tab-content');
     allMainTabs.forEach(tab => tab.style.display = 'none');
@@ -762,7 +896,10 @@ function toggleGameDetails(gameNumber) {
             const gameIndex = parseInt(gameItem.getAttribute('data-game-index'));
             const game = gamesData[gameIndex];
             if (game) {
-                gameContent.innerHTML = renderGameContent(game);
+                gameContent.innerHTML = '<div class="loading-message">Loading game details...</div>';
+                loadGameDetails([game])
+                    .then(() => { gameContent.innerHTML = renderGameContent(game); })
+                    .catch(error => showGameDetailsError(gameContent, error));
             }
         }
     }
@@ -1813,7 +1950,9 @@ function selectPvpPlayer(playerNum, playerName) {
     const player2 = document.getElementById('pvpPlayer2').value.trim();
     
     if (player1 && player2 && player1 !== player2) {
-        renderPvpComparison(player1, player2);
+        loadAggregate('players')
+            .then(() => renderPvpComparison(player1, player2))
+            .catch(error => showGameDetailsError(document.getElementById('pvpComparisonContent'), error));
     }
 }
 
@@ -1872,6 +2011,17 @@ function setupSearchBox(inputElement, resultsElement, boxNumber) {
         
         console.log('[SEARCH] Searching through', gamesData.length, 'games');
         
+        // Medal/weapon totals come from the aggregates: search again once they are loaded
+        if (!aggregates.medals || !aggregates.weapons) {
+            loadAggregates(['medals', 'weapons'])
+                .then(() => {
+                    if (inputElement.value.toLowerCase().trim() === query) {
+                        inputElement.dispatchEvent(new Event('input'));
+                    }
+                })
+                .catch(error => console.error('[ERROR] Failed to load aggregates:', error));
+        }
+        
         const results = [];
         
         // Search for players - by both in-game name and discord name
@@ -1972,17 +2122,8 @@ function setupSearchBox(inputElement, resultsElement, boxNumber) {
             });
 
             matchedMedals.forEach(medal => {
-                // Count total of this medal across all games
-                let totalCount = 0;
-                gamesData.forEach(game => {
-                    if (game.medals) {
-                        game.medals.forEach(playerMedals => {
-                            if (playerMedals[medal]) {
-                                totalCount += parseInt(playerMedals[medal]) || 0;
-                            }
-                        });
-                    }
-                });
+                // Total of this medal across all games
+                const totalCount = ((aggregates.medals || {})[medal] || {}).total || 0;
                 if (totalCount > 0) {
                     results.push({
                         type: 'medal',
@@ -2001,20 +2142,8 @@ function setupSearchBox(inputElement, resultsElement, boxNumber) {
             });
 
             matchedWeapons.forEach(weapon => {
-                // Count total kills with this weapon across all games
-                // Weapons are stored at game.weapons[] with keys like "Sniper Rifle kills"
-                let totalKills = 0;
-                gamesData.forEach(game => {
-                    if (game.weapons) {
-                        game.weapons.forEach(playerWeapons => {
-                            Object.keys(playerWeapons).forEach(key => {
-                                if (key.toLowerCase().includes(weapon.toLowerCase()) && key.toLowerCase().includes('kills')) {
-                                    totalKills += parseInt(playerWeapons[key]) || 0;
-                                }
-                            });
-                        });
-                    }
-                });
+                // Total kills with this weapon across all games
+                const totalKills = matchWeaponAggregates(weapon).kills;
                 if (totalKills > 0) {
                     results.push({
                         type: 'weapon',
@@ -2130,26 +2259,40 @@ function openSearchResultsPage(type, name) {
     // Scroll to top
     window.scrollTo(0, 0);
     
+    let renderResults = null;
+    let aggregateKind = null;
     if (type === 'player') {
         searchResultsTitle.innerHTML = `${getPlayerRankIcon(name, 'small')} ${name}`;
-        searchResultsContent.innerHTML = renderPlayerSearchResults(name);
+        renderResults = renderPlayerSearchResults;
+        aggregateKind = 'players';
     } else if (type === 'map') {
         const mapImage = mapImages[name] || defaultMapImage;
         searchResultsTitle.innerHTML = `<img src="${mapImage}" class="title-map-icon" alt="${name}"> ${name}`;
-        searchResultsContent.innerHTML = renderMapSearchResults(name);
+        renderResults = renderMapSearchResults;
+        aggregateKind = 'maps';
     } else if (type === 'gametype') {
         searchResultsTitle.innerHTML = `🎮 ${name}`;
-        searchResultsContent.innerHTML = renderGametypeSearchResults(name);
+        renderResults = renderGametypeSearchResults;
+        aggregateKind = 'variants';
     } else if (type === 'medal') {
         const medalIcon = getMedalIcon(name);
         const iconHtml = medalIcon ? `<img src="${medalIcon}" class="title-medal-icon" alt="${name}">` : '';
         searchResultsTitle.innerHTML = `${iconHtml} ${formatMedalName(name)}`;
-        searchResultsContent.innerHTML = renderMedalSearchResults(name);
+        renderResults = renderMedalSearchResults;
+        aggregateKind = 'medals';
     } else if (type === 'weapon') {
         const weaponIcon = weaponIcons[name.toLowerCase()];
         const iconHtml = weaponIcon ? `<img src="${weaponIcon}" class="title-weapon-icon" alt="${name}">` : '';
         searchResultsTitle.innerHTML = `${iconHtml} ${name.charAt(0).toUpperCase() + name.slice(1)}`;
-        searchResultsContent.innerHTML = renderWeaponSearchResults(name);
+        renderResults = renderWeaponSearchResults;
+        aggregateKind = 'weapons';
+    }
+    
+    if (renderResults) {
+        searchResultsContent.innerHTML = '<div class="loading-message">Loading stats...</div>';
+        loadAggregate(aggregateKind)
+            .then(() => { searchResultsContent.innerHTML = renderResults(name); })
+            .catch(error => showGameDetailsError(searchResultsContent, error));
     }
 }
 
@@ -2209,49 +2352,19 @@ function renderMapSearchResults(mapName) {
     const mapGames = gamesData.filter(game => game.details['Map Name'] === mapName);
     const mapImage = mapImages[mapName] || defaultMapImage;
 
-    // Calculate map stats including medals and player kills
-    let totalGames = mapGames.length;
-    let gametypeCounts = {};
-    let totalMedals = 0;
-    let medalBreakdown = {};
-    let playerStats = {};
-
-    mapGames.forEach(game => {
-        const gt = game.details['Variant Name'] || 'Unknown';
-        gametypeCounts[gt] = (gametypeCounts[gt] || 0) + 1;
-
-        // Count all medals in this game (only Halo 2 medals)
-        if (game.medals) {
-            game.medals.forEach(playerMedals => {
-                Object.entries(playerMedals).forEach(([medal, count]) => {
-                    if (medal !== 'player' && medalIcons[medal]) {
-                        const medalCount = parseInt(count) || 0;
-                        totalMedals += medalCount;
-                        medalBreakdown[medal] = (medalBreakdown[medal] || 0) + medalCount;
-                    }
-                });
-            });
-        }
-
-        // Count player kills/deaths
-        game.players.forEach(player => {
-            const name = player.name;
-            if (!playerStats[name]) {
-                playerStats[name] = { kills: 0, deaths: 0, games: 0 };
-            }
-            playerStats[name].kills += parseInt(player.kills) || 0;
-            playerStats[name].deaths += parseInt(player.deaths) || 0;
-            playerStats[name].games += 1;
-        });
-    });
+    // Map totals including medals (only Halo 2 medals) and player kills
+    const totals = (aggregates.maps || {})[mapName] || { kills: 0, players: {}, medals: {} };
+    const totalGames = mapGames.length;
+    const medalBreakdown = halo2Medals(totals.medals);
+    const totalMedals = sumCounts(medalBreakdown);
+    const playerStats = totals.players;
 
     // Store for modals
     window.currentSearchMedalBreakdown = medalBreakdown;
     window.currentSearchContext = mapName;
     window.currentSearchPlayerStats = playerStats;
 
-    // Calculate total kills
-    const totalKills = Object.values(playerStats).reduce((sum, p) => sum + p.kills, 0);
+    const totalKills = totals.kills;
 
     let html = '<div class="search-results-container">';
 
@@ -2282,49 +2395,20 @@ function renderMapSearchResults(mapName) {
 function renderGametypeSearchResults(gametypeName) {
     const gametypeGames = gamesData.filter(game => game.details['Variant Name'] === gametypeName);
 
-    // Calculate gametype stats including medals and player kills
-    let totalGames = gametypeGames.length;
-    let mapCounts = {};
-    let totalMedals = 0;
-    let medalBreakdown = {};
-    let playerStats = {};
-
-    gametypeGames.forEach(game => {
-        const map = game.details['Map Name'] || 'Unknown';
-        mapCounts[map] = (mapCounts[map] || 0) + 1;
-
-        // Count all medals in this game (only Halo 2 medals)
-        if (game.medals) {
-            game.medals.forEach(playerMedals => {
-                Object.entries(playerMedals).forEach(([medal, count]) => {
-                    if (medal !== 'player' && medalIcons[medal]) {
-                        const medalCount = parseInt(count) || 0;
-                        totalMedals += medalCount;
-                        medalBreakdown[medal] = (medalBreakdown[medal] || 0) + medalCount;
-                    }
-                });
-            });
-        }
-
-        // Count player kills/deaths
-        game.players.forEach(player => {
-            const name = player.name;
-            if (!playerStats[name]) {
-                playerStats[name] = { kills: 0, deaths: 0, games: 0 };
-            }
-            playerStats[name].kills += parseInt(player.kills) || 0;
-            playerStats[name].deaths += parseInt(player.deaths) || 0;
-            playerStats[name].games += 1;
-        });
-    });
+    // Gametype totals including medals (only Halo 2 medals) and player kills
+    const totals = (aggregates.variants || {})[gametypeName] || { kills: 0, players: {}, medals: {}, maps: {} };
+    const totalGames = gametypeGames.length;
+    const mapCounts = totals.maps;
+    const medalBreakdown = halo2Medals(totals.medals);
+    const totalMedals = sumCounts(medalBreakdown);
+    const playerStats = totals.players;
 
     // Store for modals
     window.currentSearchMedalBreakdown = medalBreakdown;
     window.currentSearchContext = gametypeName;
     window.currentSearchPlayerStats = playerStats;
 
-    // Calculate total kills
-    const totalKills = Object.values(playerStats).reduce((sum, p) => sum + p.kills, 0);
+    const totalKills = totals.kills;
 
     let html = '<div class="search-results-container">';
 
@@ -2359,40 +2443,13 @@ function renderGametypeSearchResults(gametypeName) {
 }
 
 function renderMedalSearchResults(medalName) {
-    // Find all games where this medal was earned
-    const medalGames = [];
-    let playerMedalCounts = {};
-    let mapMedalCounts = {};
-    let gametypeMedalCounts = {};
-    let totalEarned = 0;
-
-    gamesData.forEach(game => {
-        if (game.medals) {
-            let gameMedalCount = 0;
-            const mapName = game.details['Map Name'] || 'Unknown';
-            const gametype = game.details['Variant Name'] || 'Unknown';
-
-            game.medals.forEach(playerMedals => {
-                if (playerMedals[medalName]) {
-                    const count = parseInt(playerMedals[medalName]) || 0;
-                    gameMedalCount += count;
-                    totalEarned += count;
-
-                    const playerName = playerMedals.player;
-                    if (!playerMedalCounts[playerName]) {
-                        playerMedalCounts[playerName] = 0;
-                    }
-                    playerMedalCounts[playerName] += count;
-                }
-            });
-
-            if (gameMedalCount > 0) {
-                medalGames.push({ game, count: gameMedalCount });
-                mapMedalCounts[mapName] = (mapMedalCounts[mapName] || 0) + gameMedalCount;
-                gametypeMedalCounts[gametype] = (gametypeMedalCounts[gametype] || 0) + gameMedalCount;
-            }
-        }
-    });
+    // All games where this medal was earned, with totals by player, map and gametype
+    const totals = (aggregates.medals || {})[medalName] || { total: 0, games: [], players: {}, maps: {}, variants: {} };
+    const medalGames = gamesFromSourceFiles(totals.games);
+    const playerMedalCounts = totals.players;
+    const mapMedalCounts = totals.maps;
+    const gametypeMedalCounts = totals.variants;
+    const totalEarned = totals.total;
 
     // Store for modal
     window.currentSearchPlayerStats = Object.fromEntries(
@@ -2474,7 +2531,7 @@ function renderMedalSearchResults(medalName) {
 
     // Games list
     html += '<div class="search-games-list">';
-    medalGames.forEach(({ game, count }) => {
+    medalGames.forEach(game => {
         html += renderSearchGameCard(game, gamesData.length - gamesData.indexOf(game));
     });
     html += '</div>';
@@ -2484,46 +2541,13 @@ function renderMedalSearchResults(medalName) {
 }
 
 function renderWeaponSearchResults(weaponName) {
-    // Find all games where this weapon was used
-    // Weapons are stored at game.weapons[] with keys like "Sniper Rifle kills"
-    const weaponGames = [];
-    let playerWeaponStats = {};
-    let mapWeaponKills = {};
-    let gametypeWeaponKills = {};
-    let totalKills = 0;
-
-    gamesData.forEach(game => {
-        let gameWeaponKills = 0;
-        const mapName = game.details['Map Name'] || 'Unknown';
-        const gametype = game.details['Variant Name'] || 'Unknown';
-
-        if (game.weapons) {
-            game.weapons.forEach(playerWeapons => {
-                const playerName = playerWeapons.Player;
-                Object.keys(playerWeapons).forEach(key => {
-                    if (key.toLowerCase().includes(weaponName.toLowerCase()) && key.toLowerCase().includes('kills')) {
-                        const kills = parseInt(playerWeapons[key]) || 0;
-                        gameWeaponKills += kills;
-                        totalKills += kills;
-
-                        if (playerName) {
-                            if (!playerWeaponStats[playerName]) {
-                                playerWeaponStats[playerName] = { kills: 0, games: 0 };
-                            }
-                            playerWeaponStats[playerName].kills += kills;
-                            playerWeaponStats[playerName].games += 1;
-                        }
-                    }
-                });
-            });
-        }
-
-        if (gameWeaponKills > 0) {
-            weaponGames.push({ game, kills: gameWeaponKills });
-            mapWeaponKills[mapName] = (mapWeaponKills[mapName] || 0) + gameWeaponKills;
-            gametypeWeaponKills[gametype] = (gametypeWeaponKills[gametype] || 0) + gameWeaponKills;
-        }
-    });
+    // All games where this weapon got kills, with totals by player, map and gametype
+    const totals = matchWeaponAggregates(weaponName);
+    const weaponGames = gamesFromSourceFiles(totals.games);
+    const playerWeaponStats = totals.players;
+    const mapWeaponKills = totals.maps;
+    const gametypeWeaponKills = totals.variants;
+    const totalKills = totals.kills;
 
     // Store for modal
     window.currentSearchPlayerStats = Object.fromEntries(
@@ -2605,7 +2629,7 @@ function renderWeaponSearchResults(weaponName) {
 
     // Games list
     html += '<div class="search-games-list">';
-    weaponGames.forEach(({ game, kills }) => {
+    weaponGames.forEach(game => {
         html += renderSearchGameCard(game, gamesData.length - gamesData.indexOf(game));
     });
     html += '</div>';
@@ -2781,7 +2805,14 @@ function toggleSearchGameDetails(searchCardId, gameNumber) {
         const game = gamesData[gamesData.length - gameNumber];
         if (game) {
             gameItem.classList.add('expanded');
-            gameContent.innerHTML = renderGameContent(game);
+            gameContent.innerHTML = '<div class="loading-message">Loading game details...</div>';
+            loadGameDetails([game])
+                .then(() => {
+                    if (gameItem.classList.contains('expanded')) {
+                        gameContent.innerHTML = renderGameContent(game);
+                    }
+                })
+                .catch(error => showGameDetailsError(gameContent, error));
         }
     }
 }
@@ -2822,62 +2853,32 @@ function openPlayerModal(playerName) {
     
     modal.classList.add('active');
     
-    setTimeout(() => {
-        const stats = calculatePlayerStats(playerName);
-        modalPlayerStats.innerHTML = renderPlayerModalStats(stats);
-    }, 100);
+    loadAggregate('players')
+        .then(() => {
+            const stats = calculatePlayerStats(playerName);
+            modalPlayerStats.innerHTML = renderPlayerModalStats(stats);
+        })
+        .catch(error => showGameDetailsError(modalPlayerStats, error));
 }
 
 function calculatePlayerStats(playerName) {
+    const totals = (aggregates.players || {})[playerName] || {};
     const stats = {
-        games: 0,
-        wins: 0,
-        kills: 0,
-        deaths: 0,
-        assists: 0,
-        bestSpree: 0,
+        games: totals.games || 0,
+        wins: totals.first_places || 0,
+        kills: totals.kills || 0,
+        deaths: totals.deaths || 0,
+        assists: totals.assists || 0,
+        bestSpree: totals.best_spree || 0,
         totalDamage: 0,
-        accuracy: 0,
-        accuracyCount: 0,
-        totalMedals: 0,
-        medalBreakdown: {}
+        accuracy: totals.accuracy_total || 0,
+        accuracyCount: totals.accuracy_games || 0,
+        totalMedals: sumCounts(totals.medals),
+        medalBreakdown: { ...(totals.medals || {}) },
+        nemesis: totals.nemesis || null,
+        favoriteVictim: totals.favorite_victim || null
     };
 
-    gamesData.forEach(game => {
-        const player = game.players.find(p => p.name === playerName);
-        if (player) {
-            stats.games++;
-            if (player.place === '1st') stats.wins++;
-            stats.kills += player.kills || 0;
-            stats.deaths += player.deaths || 0;
-            stats.assists += player.assists || 0;
-
-            if (player.accuracy) {
-                stats.accuracy += player.accuracy;
-                stats.accuracyCount++;
-            }
-
-            // Count medals from game.medals array
-            if (game.medals) {
-                const playerMedals = game.medals.find(m => m.player === playerName);
-                if (playerMedals) {
-                    Object.entries(playerMedals).forEach(([medal, count]) => {
-                        if (medal !== 'player') {
-                            const medalCount = parseInt(count) || 0;
-                            stats.totalMedals += medalCount;
-                            stats.medalBreakdown[medal] = (stats.medalBreakdown[medal] || 0) + medalCount;
-                        }
-                    });
-                }
-            }
-        }
-
-        const gameStat = game.stats ? game.stats.find(s => s.Player === playerName) : null;
-        if (gameStat && gameStat.best_spree > stats.bestSpree) {
-            stats.bestSpree = gameStat.best_spree;
-        }
-    });
-
     stats.kd = stats.deaths > 0 ? (stats.kills / stats.deaths).toFixed(2) : stats.kills.toFixed(2);
     stats.winrate = stats.games > 0 ? ((stats.wins / stats.games) * 100).toFixed(1) : '0.0';
     stats.avgAccuracy = stats.accuracyCount > 0 ? (stats.accuracy / stats.accuracyCount).toFixed(1) : '0.0';
@@ -2896,10 +2897,22 @@ function renderPlayerModalStats(stats) {
     html += `<div class="stat-card"><div class="stat-label">Assists</div><div class="stat-value">${stats.assists}</div></div>`;
     html += `<div class="stat-card"><div class="stat-label">Best Spree</div><div class="stat-value">${stats.bestSpree}</div></div>`;
     html += `<div class="stat-card"><div class="stat-label">Avg Accuracy</div><div class="stat-value">${stats.avgAccuracy}%</div></div>`;
+    html += rivalStatCard('Nemesis', stats.nemesis, 'deaths');
+    html += rivalStatCard('Favorite Victim', stats.favoriteVictim, 'kills');
     html += '</div>';
     return html;
 }
 
+// Stat card for a [name, kills] rival pair from aggregates/players.json
+function rivalStatCard(label, rival, unit) {
+    if (!rival) {
+        return `<div class="stat-card"><div class="stat-label">${label}</div><div class="stat-value">-</div></div>`;
+    }
+    const [name, kills] = rival;
+    return `<div class="stat-card"><div class="stat-label">${label}</div><div class="stat-value">${escapeHtml(name)}</div>` +
+        `<div class="stat-sublabel">${kills} ${unit}</div></div>`;
+}
+
 function openComparisonModal(player1Name, player2Name) {
     const modal = document.getElementById('playerModal');
     const modalPlayerName = document.getElementById('modalPlayerName');
@@ -2912,12 +2925,14 @@ function openComparisonModal(player1Name, player2Name) {
     
     modal.classList.add('active');
     
-    setTimeout(() => {
-        const stats1 = calculatePlayerStats(player1Name);
-        const stats2 = calculatePlayerStats(player2Name);
-        const h2h = calculateHeadToHead(player1Name, player2Name);
-        modalPlayerStats.innerHTML = renderComparisonStats(player1Name, stats1, player2Name, stats2, h2h);
-    }, 100);
+    loadAggregate('players')
+        .then(() => {
+            const stats1 = calculatePlayerStats(player1Name);
+            const stats2 = calculatePlayerStats(player2Name);
+            const h2h = calculateHeadToHead(player1Name, player2Name);
+            modalPlayerStats.innerHTML = renderComparisonStats(player1Name, stats1, player2Name, stats2, h2h);
+        })
+        .catch(error => showGameDetailsError(modalPlayerStats, error));
 }
 
 function calculateHeadToHead(player1, player2) {
@@ -3130,23 +3145,8 @@ function filterProfileByWinLoss(filterType) {
 function showWeaponBreakdown() {
     if (!currentProfilePlayer) return;
     
-    // Calculate weapon stats for the player
-    const weaponStats = {};
-    
-    currentProfileGames.forEach(game => {
-        const weaponData = game.weapons?.find(w => w.Player === currentProfilePlayer);
-        if (weaponData) {
-            Object.keys(weaponData).forEach(key => {
-                if (key !== 'Player' && key.toLowerCase().includes('kills')) {
-                    const weaponName = key.replace(/ kills/gi, '').trim();
-                    const kills = parseInt(weaponData[key]) || 0;
-                    if (kills > 0) {
-                        weaponStats[weaponName] = (weaponStats[weaponName] || 0) + kills;
-                    }
-                }
-            });
-        }
-    });
+    // Kills per weapon for the player (from the player aggregates)
+    const weaponStats = ((aggregates.players || {})[currentProfilePlayer] || {}).weapons || {};
     
     // Sort by most kills
     const sortedWeapons = Object.entries(weaponStats).sort((a, b) => b[1] - a[1]);
@@ -3197,25 +3197,9 @@ function closeWeaponBreakdown() {
 function showMedalBreakdown() {
     if (!currentProfilePlayer) return;
 
-    // Calculate medal stats for the player from game.medals array
+    // Medals earned by the player (from the player aggregates)
     // Only count medals that are in the official Halo 2 medalIcons list
-    const medalStats = {};
-
-    currentProfileGames.forEach(game => {
-        if (game.medals) {
-            const playerMedals = game.medals.find(m => m.player === currentProfilePlayer);
-            if (playerMedals) {
-                Object.entries(playerMedals).forEach(([medal, count]) => {
-                    if (medal !== 'player' && medalIcons[medal]) {
-                        const medalCount = parseInt(count) || 0;
-                        if (medalCount > 0) {
-                            medalStats[medal] = (medalStats[medal] || 0) + medalCount;
-                        }
-                    }
-                });
-            }
-        }
-    });
+    const medalStats = halo2Medals(((aggregates.players || {})[currentProfilePlayer] || {}).medals);
 
     // Sort by most earned
     const sortedMedals = Object.entries(medalStats).sort((a, b) => b[1] - a[1]);
@@ -3532,18 +3516,25 @@ function openPlayerProfile(playerName) {
     document.getElementById('profilePlayerName').textContent = displayName;
     document.getElementById('profileRankIcon').innerHTML = getPlayerRankIcon(playerName, 'large');
 
-    // Calculate overall stats
-    const stats = calculatePlayerOverallStats(playerName);
-    renderProfileStats(stats);
+    loadAggregate('players')
+        .then(() => {
+            // Another profile may have been opened while the stats loaded
+            if (currentProfilePlayer !== playerName) return;
 
-    // Get player's games
-    currentProfileGames = getPlayerGames(playerName);
+            // Calculate overall stats
+            const stats = calculatePlayerOverallStats(playerName);
+            renderProfileStats(stats);
 
-    // Populate filter dropdowns
-    populateProfileFilters();
+            // Get player's games
+            currentProfileGames = getPlayerGames(playerName);
 
-    // Render games list
-    renderProfileGames(currentProfileGames);
+            // Populate filter dropdowns
+            populateProfileFilters();
+
+            // Render games list
+            renderProfileGames(currentProfileGames);
+        })
+        .catch(error => console.error('[ERROR] Failed to load player stats:', error));
 }
 
 function closePlayerProfile() {
@@ -3554,54 +3545,16 @@ function closePlayerProfile() {
 }
 
 function calculatePlayerOverallStats(playerName) {
-    let games = 0, wins = 0, kills = 0, deaths = 0, assists = 0, totalScore = 0, totalMedals = 0;
-    
-    gamesData.forEach(game => {
-        const player = game.players.find(p => p.name === playerName);
-        if (player) {
-            games++;
-            kills += player.kills || 0;
-            deaths += player.deaths || 0;
-            assists += player.assists || 0;
-            totalScore += parseInt(player.score) || 0;
-            
-            // Count total medals from game.medals array (only Halo 2 medals)
-            if (game.medals) {
-                const playerMedals = game.medals.find(m => m.player === playerName);
-                if (playerMedals) {
-                    Object.entries(playerMedals).forEach(([key, count]) => {
-                        if (key !== 'player' && medalIcons[key]) {
-                            totalMedals += parseInt(count) || 0;
-                        }
-                    });
-                }
-            }
-            
-            // Check if player won
-            const hasTeams = game.players.some(p => isValidTeam(p.team));
-            const gameType = game.details['Variant Name'] || game.details['Game Type'] || '';
-            const isOddball = gameType.toLowerCase().includes('oddball');
-            
-            if (hasTeams && isValidTeam(player.team)) {
-                const teams = {};
-                game.players.forEach(p => {
-                    if (isValidTeam(p.team)) {
-                        if (isOddball) {
-                            teams[p.team] = (teams[p.team] || 0) + timeToSeconds(p.score);
-                        } else {
-                            teams[p.team] = (teams[p.team] || 0) + (parseInt(p.score) || 0);
-                        }
-                    }
-                });
-                const sortedTeams = Object.entries(teams).sort((a, b) => b[1] - a[1]);
-                if (sortedTeams[0] && sortedTeams[0][0] === player.team) wins++;
-            } else {
-                // FFA - check if highest score
-                const maxScore = Math.max(...game.players.map(p => parseInt(p.score) || 0));
-                if ((parseInt(player.score) || 0) === maxScore) wins++;
-            }
-        }
-    });
+    const totals = (aggregates.players || {})[playerName] || {};
+    const games = totals.games || 0;
+    const wins = totals.wins || 0;
+    const kills = totals.kills || 0;
+    const deaths = totals.deaths || 0;
+    const assists = totals.assists || 0;
+    const totalScore = totals.score || 0;
+
+    // Count total medals (only Halo 2 medals)
+    const totalMedals = sumCounts(halo2Medals(totals.medals));
     
     return {
         games,
@@ -0,0 +1,150 @@
+"""
+seasons.py - Ranked seasons defined by date ranges
+
+seasons.json splits the ranked history into seasons. When it exists,
+populate_stats.py replays only the current season's games for rankstats.json
+(ranks reset at each season start) and writes a snapshot per season to
+seasons/, so past-season leaderboards are served from a file instead of
+replaying history filtered by date. Without seasons.json all games form one
+season and no snapshots are written.
+
+Format (dates inclusive, YYYY-MM-DD; the last season may leave out "end"):
+    {
+      "seasons": [
+        {"id": "s1", "name": "Season 1", "start": "2025-11-01", "end": "2026-01-31"},
+        {"id": "s2", "name": "Season 2", "start": "2026-02-01"}
+      ]
+    }
+
+Snapshots (seasons/<id>.json):
+    {"version": 1, "season": {...}, "status": "final" | "live", "inputs": "<sha256>",
+     "games": {playlist: count},
+     "players": {user_id: {"name": ..., "playlists": {playlist: {xp, rank, highest_rank,
+                                                                  wins, losses, games}}}}}
+
+A season that has ended is "final": its snapshot is only rewritten when its
+inputs (games, XP settings, player IDs) change. The current season is "live"
+and rewritten on every run. seasons/index.json lists every snapshot.
+
+Usage:
+    import seasons
+    season_list = seasons.load_seasons()
+    current = seasons.current_season(season_list)
+"""
+
+import json
+import os
+from datetime import date, datetime
+
+import artifact_writer
+from game_store import parse_start_time
+
+SEASONS_FILE = 'seasons.json'
+SEASONS_DIR = 'seasons'
+SEASON_INDEX_FILE = 'index.json'
+
+# Bump when the snapshot layout changes; old snapshots are rebuilt
+SEASON_SNAPSHOT_VERSION = 1
+
+STATUS_FINAL = 'final'
+STATUS_LIVE = 'live'
+
+
+def parse_date(text):
+    """Convert a YYYY-MM-DD string to a date."""
+    return datetime.strptime(text, '%Y-%m-%d').date()
+
+def load_seasons(path=SEASONS_FILE):
+    """
+    Load the season list from seasons.json, sorted by start date.
+
+    Returns:
+        [] if the file doesn't exist
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        season_list = json.load(f).get('seasons', [])
+    return sorted(season_list, key=lambda season: season['start'])
+
+def season_contains(season, day):
+    """Check if a date falls inside a season."""
+    if day < parse_date(season['start']):
+        return False
+    return not season.get('end') or day <= parse_date(season['end'])
+
+def season_ended(season, today=None):
+    """Check if a season's end date has passed."""
+    today = today or date.today()
+    return bool(season.get('end')) and parse_date(season['end']) < today
+
+def current_season(season_list, today=None):
+    """Get the season containing today, else the latest one already started, else None."""
+    today = today or date.today()
+    started = [season for season in season_list if parse_date(season['start']) <= today]
+    for season in started:
+        if season_contains(season, today):
+            return season
+    return started[-1] if started else None
+
+def game_date(game):
+    """
+    Get the date a game was played (game_records.Game), or None.
+
+    Uses the Game Details Start Time, falling back to the YYYYMMDD prefix of
+    the stats file name.
+    """
+    start = parse_start_time(game.start_time)
+    if start:
+        return datetime.fromisoformat(start).date()
+    try:
+        return datetime.strptime((game.source_file or '')[:8], '%Y%m%d').date()
+    except ValueError:
+        return None
+
+def season_of(season_list, game):
+    """Get the season a game belongs to, or None if it falls outside every season."""
+    day = game_date(game)
+    if day is None:
+        return None
+    for season in season_list:
+        if season_contains(season, day):
+            return season
+    return None
+
+def split_by_season(season_list, games_by_playlist):
+    """Get {season id: {playlist: [games]}}; games outside every season are left out."""
+    by_season = {season['id']: {playlist: [] for playlist in games_by_playlist} for season in season_list}
+    for playlist, games in games_by_playlist.items():
+        for game in games:
+            season = season_of(season_list, game)
+            if season:
+                by_season[season['id']][playlist].append(game)
+    return by_season
+
+
+def snapshot_path(season, seasons_dir=SEASONS_DIR):
+    return os.path.join(seasons_dir, f"{season['id']}.json")
+
+def load_snapshot(season, seasons_dir=SEASONS_DIR):
+    """Load a season's snapshot, or None if it is missing or from another version."""
+    try:
+        with open(snapshot_path(season, seasons_dir), 'r') as f:
+            snapshot = json.load(f)
+        if snapshot.get('version') == SEASON_SNAPSHOT_VERSION:
+            return snapshot
+    except:
+        pass
+    return None
+
+def save_snapshot(snapshot, seasons_dir=SEASONS_DIR):
+    """Write a season snapshot (compact)."""
+    os.makedirs(seasons_dir, exist_ok=True)
+    artifact_writer.write_json_artifact(snapshot_path(snapshot['season'], seasons_dir), snapshot)
+
+def save_index(season_list, statuses, seasons_dir=SEASONS_DIR):
+    """Write seasons/index.json: each season with its snapshot file and status."""
+    os.makedirs(seasons_dir, exist_ok=True)
+    index = [dict(season, file=os.path.basename(snapshot_path(season)), status=statuses[season['id']])
+             for season in season_list if season['id'] in statuses]
+    artifact_writer.write_json_artifact(os.path.join(seasons_dir, SEASON_INDEX_FILE), {'seasons': index})
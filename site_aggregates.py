@@ -0,0 +1,208 @@
+"""
+site_aggregates.py - Career and breakdown totals precomputed for the site
+
+The site used to total every career stat in the browser by scanning all games
+(player stats, the map, gametype, medal and weapon pages and their leader
+lists), which needed every game's detail sheets. populate_stats.py now
+computes these totals in one pass over the games and writes them to
+aggregates/, one file per kind, so a page fetches only the file it shows:
+
+- players.json:  {name: {games, first_places, wins, kills, deaths, assists, score,
+                         accuracy_total, accuracy_games, best_spree,
+                         medals: {medal: count}, weapons: {weapon: kills},
+                         nemesis: [name, kills] | null, favorite_victim: [name, kills] | null}}
+- maps.json:     {map: {games, kills, players: {name: {kills, deaths, games}},
+                        medals: {medal: count}, variants: {variant: games}, leaders}}
+- variants.json: {variant: {... as maps, with maps: {map: games} instead of variants}}
+- medals.json:   {medal: {total, games: [source_file, ...], players: {name: count},
+                          maps: {map: count}, variants: {variant: count}, leaders}}
+- weapons.json:  {weapon: {kills, games: [source_file, ...], players: {name: {kills, games}},
+                           maps: {map: kills}, variants: {variant: kills}, leaders}}
+
+Each file is {"version": 1, "<kind>": {...}}. Weapons are the weapon stat
+columns with a kill count ("magnum kills" -> "magnum", "magnum headshot kills"
+-> "magnum headshot"). wins follow the winner in games/index.json (see
+game_shards.game_winner); first_places counts games a player placed 1st.
+leaders lists the top LEADER_COUNT [name, value] pairs by kills or count.
+nemesis and favorite_victim come from the Versus sheets of every game summed
+into one career kill matrix (see versus_matrix.sum_matrices).
+
+Usage:
+    import site_aggregates
+    site_aggregates.write_aggregates(site_aggregates.build_aggregates(games))
+"""
+
+import os
+import re
+
+import artifact_writer
+from game_shards import game_teams, game_winner
+from versus_matrix import VersusMatrix, favorite_victim, nemesis, sum_matrices
+
+AGGREGATES_DIR = 'aggregates'
+AGGREGATES_VERSION = 1
+AGGREGATE_KINDS = ('players', 'maps', 'variants', 'medals', 'weapons')
+
+# Players listed in each leaders list
+LEADER_COUNT = 10
+
+WEAPON_KILLS_SUFFIX = re.compile(r' kills', re.IGNORECASE)
+
+
+def leading_int(value):
+    """Integer at the start of a value, like JavaScript's parseInt ('1:30' -> 1), else 0."""
+    match = re.match(r'\s*([+-]?\d+)', str(value))
+    return int(match.group(1)) if match else 0
+
+def weapon_kill_columns(weapon_line):
+    """Get (weapon, kills) for the kill columns of a gameshistory.json weapons line."""
+    for column, value in weapon_line.items():
+        if column != 'Player' and 'kills' in column.lower():
+            yield WEAPON_KILLS_SUFFIX.sub('', column).strip(), leading_int(value)
+
+def new_player():
+    return {'games': 0, 'first_places': 0, 'wins': 0, 'kills': 0, 'deaths': 0, 'assists': 0, 'score': 0,
+            'accuracy_total': 0, 'accuracy_games': 0, 'best_spree': 0, 'medals': {}, 'weapons': {}}
+
+def new_group(breakdown):
+    """A map or variant entry; breakdown is the key counting games of the other kind."""
+    return {'games': 0, 'kills': 0, 'players': {}, 'medals': {}, breakdown: {}}
+
+def add_count(counts, key, amount=1):
+    counts[key] = counts.get(key, 0) + amount
+
+def leaders(values):
+    """Top LEADER_COUNT [name, value] pairs, highest first."""
+    return [list(item) for item in sorted(values.items(), key=lambda item: item[1], reverse=True)[:LEADER_COUNT]]
+
+def build_aggregates(games):
+    """
+    Total up gameshistory.json game dicts (one pass).
+
+    Returns:
+        {kind: {name: entry}} for every kind in AGGREGATE_KINDS
+    """
+    players, maps, variants, medals, weapons = {}, {}, {}, {}, {}
+    versus = []
+
+    for game in games:
+        details = game.get('details') or {}
+        map_name = details.get('Map Name')
+        variant = details.get('Variant Name')
+        map_label = map_name or 'Unknown'
+        variant_label = variant or 'Unknown'
+        source_file = game.get('source_file')
+
+        teams = game_teams(game)
+        winner = game_winner(game, teams)
+        groups = []
+        if map_name is not None:
+            groups.append(maps.setdefault(map_name, new_group('variants')))
+            add_count(groups[-1]['variants'], variant_label)
+        if variant is not None:
+            groups.append(variants.setdefault(variant, new_group('maps')))
+            add_count(groups[-1]['maps'], map_label)
+
+        if game.get('versus'):
+            versus.append(VersusMatrix.from_json(game['versus']))
+
+        players_in_game = {line['name'] for line in game['players']}
+        best_sprees = {row['player']: row.get('best_spree') or 0 for row in game.get('detailed_stats') or ()}
+        for line in game['players']:
+            name = line['name']
+            player = players.setdefault(name, new_player())
+            player['games'] += 1
+            player['first_places'] += line.get('place') == '1st'
+            player['wins'] += winner is not None and winner == (str(line.get('team') or '').strip() if teams else name)
+            player['kills'] += line.get('kills') or 0
+            player['deaths'] += line.get('deaths') or 0
+            player['assists'] += line.get('assists') or 0
+            player['score'] += leading_int(line.get('score'))
+            if line.get('accuracy'):
+                player['accuracy_total'] += line['accuracy']
+                player['accuracy_games'] += 1
+            player['best_spree'] = max(player['best_spree'], best_sprees.get(name, 0))
+
+            for group in groups:
+                group_player = group['players'].setdefault(name, {'kills': 0, 'deaths': 0, 'games': 0})
+                group_player['kills'] += line.get('kills') or 0
+                group_player['deaths'] += line.get('deaths') or 0
+                group_player['games'] += 1
+                group['kills'] += line.get('kills') or 0
+
+        for group in groups:
+            group['games'] += 1
+
+        earned = {}
+        for line in game.get('medals') or ():
+            name = line['player']
+            for medal, value in line.items():
+                count = leading_int(value) if medal != 'player' else 0
+                if count > 0:
+                    if name in players_in_game:
+                        add_count(players[name]['medals'], medal, count)
+                    entry = medals.setdefault(medal, {'total': 0, 'games': [], 'players': {}, 'maps': {}, 'variants': {}})
+                    add_count(entry['players'], name, count)
+                    for group in groups:
+                        add_count(group['medals'], medal, count)
+                    add_count(earned, medal, count)
+        for medal, count in earned.items():
+            entry = medals[medal]
+            entry['total'] += count
+            entry['games'].append(source_file)
+            add_count(entry['maps'], map_label, count)
+            add_count(entry['variants'], variant_label, count)
+
+        weapon_kills = {}
+        for line in game.get('weapons') or ():
+            name = line.get('Player')
+            for weapon, kills in weapon_kill_columns(line):
+                if kills <= 0:
+                    continue
+                add_count(weapon_kills, weapon, kills)
+                entry = weapons.setdefault(weapon, {'kills': 0, 'games': [], 'players': {}, 'maps': {}, 'variants': {}})
+                if name:
+                    if name in players_in_game:
+                        add_count(players[name]['weapons'], weapon, kills)
+                    weapon_player = entry['players'].setdefault(name, {'kills': 0, 'games': 0})
+                    weapon_player['kills'] += kills
+                    weapon_player['games'] += 1
+        for weapon, kills in weapon_kills.items():
+            entry = weapons[weapon]
+            entry['kills'] += kills
+            entry['games'].append(source_file)
+            add_count(entry['maps'], map_label, kills)
+            add_count(entry['variants'], variant_label, kills)
+
+    career = sum_matrices(versus, players)
+    for name, player in players.items():
+        rival, victim = nemesis(career, name), favorite_victim(career, name)
+        player['nemesis'] = list(rival) if rival else None
+        player['favorite_victim'] = list(victim) if victim else None
+
+    for group in list(maps.values()) + list(variants.values()):
+        group['leaders'] = leaders({name: stats['kills'] for name, stats in group['players'].items()})
+    for entry in medals.values():
+        entry['leaders'] = leaders(entry['players'])
+    for entry in weapons.values():
+        entry['leaders'] = leaders({name: stats['kills'] for name, stats in entry['players'].items()})
+
+    return {'players': players, 'maps': maps, 'variants': variants, 'medals': medals, 'weapons': weapons}
+
+def aggregate_path(kind, aggregates_dir=AGGREGATES_DIR):
+    return os.path.join(aggregates_dir, f"{kind}.json")
+
+def write_aggregates(aggregates, aggregates_dir=AGGREGATES_DIR, indent=None):
+    """
+    Write one file per kind to aggregates/.
+
+    Returns:
+        {path: size in bytes} of the JSON files
+    """
+    os.makedirs(aggregates_dir, exist_ok=True)
+    sizes = {}
+    for kind in AGGREGATE_KINDS:
+        path = aggregate_path(kind, aggregates_dir)
+        data = {'version': AGGREGATES_VERSION, kind: aggregates[kind]}
+        sizes[path] = artifact_writer.write_json_artifact(path, data, indent)[path]
+    return sizes
@@ -19,7 +19,6 @@ The identity files contain MAC addresses. The filename (without .xlsx) IS the
 player's in-game profile name used in stats.
 """
 
-import pandas as pd
 import json
 import os
 import io
@@ -59,6 +58,9 @@ def extract_mac_from_xlsx(file_data):
     Returns:
         MAC address string (uppercase, colon-separated) or None
     """
+    # pandas is heavy to import; only load it when an identity file is read
+    import pandas as pd
+
     try:
         xl = pd.ExcelFile(file_data)
         mac_address = None
@@ -0,0 +1,91 @@
+"""
+trajectory_store.py - Per-game rank/XP history for rank-over-time charts
+
+The XP replay in populate_stats.py records a (game index, xp, rank) point for
+every player after every ranked game of the replayed history (the current
+season when seasons.json is used), kept in xp_checkpoint.json so resumed runs
+continue the series. This module turns those points into
+trajectories.json, keyed by Discord user, with each column delta-encoded:
+the first value is absolute and every following value is the change from the
+one before. Game indexes and ranks mostly step by small amounts, so the file
+stays small and the site or bot can rebuild any chart with a running sum.
+
+Format (written compactly by populate_stats through artifact_writer):
+    {
+      "version": 1,
+      "playlists": {
+        "MLG 4v4": {
+          "games": ["20251128_201839.xlsx", ...],      // game index -> stats file
+          "players": {
+            "180809401228197889": {"name": "2D", "game": [0, 3, 1], "xp": [100, 0, -75], "rank": [2, 0, -1]}
+          }
+        }
+      }
+    }
+
+Usage:
+    import trajectory_store
+    points = trajectory_store.decode_player(data['playlists']['MLG 4v4']['players'][user_id])
+"""
+
+TRAJECTORIES_FILE = 'trajectories.json'
+TRAJECTORIES_VERSION = 1
+
+# Point columns, in the order they are recorded
+COLUMNS = ('game', 'xp', 'rank')
+
+
+def delta_encode(values):
+    """[5, 7, 7, 4] -> [5, 2, 0, -3]"""
+    encoded = []
+    previous = 0
+    for value in values:
+        encoded.append(value - previous)
+        previous = value
+    return encoded
+
+def delta_decode(deltas):
+    """[5, 2, 0, -3] -> [5, 7, 7, 4]"""
+    values = []
+    total = 0
+    for delta in deltas:
+        total += delta
+        values.append(total)
+    return values
+
+def encode_player(name, points):
+    """Get the stored form of one player's [[game, xp, rank], ...] points."""
+    entry = {'name': name}
+    for column, values in zip(COLUMNS, zip(*points)):
+        entry[column] = delta_encode(values)
+    return entry
+
+def decode_player(entry):
+    """Get [[game, xp, rank], ...] back from a stored player entry."""
+    return [list(point) for point in zip(*(delta_decode(entry[column]) for column in COLUMNS))]
+
+def build_trajectories(playlist_states, player_to_id, names):
+    """
+    Build the trajectories.json data from replayed playlist states.
+
+    Args:
+        playlist_states: {playlist: checkpoint state with 'games' and 'trajectories'}
+        player_to_id: {in-game name: user_id}
+        names: {user_id: display name}
+
+    Several in-game names of one user are merged into one series, ordered by game.
+    """
+    playlists = {}
+    for playlist, state in playlist_states.items():
+        by_user = {}
+        for player_name, points in state.get('trajectories', {}).items():
+            by_user.setdefault(player_to_id[player_name], []).extend(points)
+        players = {}
+        for user_id, points in by_user.items():
+            points.sort(key=lambda point: point[0])
+            players[user_id] = encode_player(names.get(user_id, user_id), points)
+        playlists[playlist] = {
+            'games': [source_file for source_file, _ in state['games']],
+            'players': players
+        }
+    return {'version': TRAJECTORIES_VERSION, 'playlists': playlists}
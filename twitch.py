@@ -12,15 +12,14 @@ import os
 import re
 import io
 import logging
+import importlib.util
 from typing import Optional, List, Dict, Tuple
 
-# Optional imports for identity sync
-try:
-    import paramiko
-    import pandas as pd
-    IDENTITY_SYNC_AVAILABLE = True
-except ImportError:
-    IDENTITY_SYNC_AVAILABLE = False
+# Optional dependencies for identity sync. Only probe for them here;
+# sync_identity imports them on first use so bot startup doesn't pay for pandas.
+IDENTITY_SYNC_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None for module in ("paramiko", "pandas")
+)
 
 # Logging
 logger = logging.getLogger("twitch")
@@ -0,0 +1,166 @@
+"""
+versus_matrix.py - Kill matrices built from the Versus sheet
+
+Each game's Versus sheet is stored as an ordered player-name list plus a square
+kill matrix: kills[i][j] is how many times names[i] killed names[j].
+
+On disk (games/ shards, ingest_manifest.json) the matrix is a list of lists:
+    "versus": {"players": ["Rocky", "2D", ...], "kills": [[0, 4, ...], ...]}
+
+In memory VersusMatrix holds it as a NumPy array when NumPy is installed (plain
+lists otherwise), and sum_matrices() adds up the matrices of many games over a
+chosen set of players to build career kill graphs.
+
+Usage:
+    from versus_matrix import VersusMatrix, sum_matrices, nemesis
+    career = sum_matrices(game.versus for game in games if game.versus)
+    print(nemesis(career, 'Rocky'))
+"""
+
+import importlib.util
+import sys
+
+# NumPy is optional and only imported when the first matrix is built
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+
+def _numpy():
+    """Get the numpy module, or None if it isn't installed."""
+    if not NUMPY_AVAILABLE:
+        return None
+    import numpy
+    return numpy
+
+def build_versus(kills_by_killer):
+    """
+    Convert {killer: {victim: kills}} to the on-disk matrix form.
+
+    Names are the killers in row order followed by any victims that never got a
+    row; missing cells are 0.
+    """
+    names = list(kills_by_killer)
+    for victims in kills_by_killer.values():
+        for victim in victims:
+            if victim not in kills_by_killer and victim not in names:
+                names.append(victim)
+
+    kills = [[kills_by_killer.get(killer, {}).get(victim, 0) for victim in names] for killer in names]
+    return {'players': names, 'kills': kills}
+
+
+class VersusMatrix:
+    """
+    Square kill matrix for an ordered list of player names.
+
+    kills is a NumPy int array when NumPy is available, else a list of lists.
+    """
+
+    __slots__ = ('names', 'index', 'kills')
+
+    def __init__(self, names, kills):
+        self.names = tuple(sys.intern(n) for n in names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        np = _numpy()
+        if np is not None:
+            self.kills = np.array(kills, dtype=np.int32).reshape(len(self.names), len(self.names))
+        else:
+            self.kills = [list(row) for row in kills]
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data['players'], data['kills'])
+
+    def to_json(self):
+        kills = self.kills.tolist() if hasattr(self.kills, 'tolist') else [list(row) for row in self.kills]
+        return {'players': list(self.names), 'kills': kills}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __eq__(self, other):
+        if not isinstance(other, VersusMatrix):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    def __repr__(self):
+        return f"VersusMatrix({len(self.names)} players)"
+
+    def kills_of(self, killer, victim):
+        """How many times killer killed victim (0 if either isn't in the matrix)."""
+        if killer not in self.index or victim not in self.index:
+            return 0
+        return int(self.kills[self.index[killer]][self.index[victim]])
+
+    def total_kills(self):
+        """Get {name: kills} summed over each row."""
+        if hasattr(self.kills, 'sum'):
+            return dict(zip(self.names, self.kills.sum(axis=1).tolist()))
+        return {name: sum(row) for name, row in zip(self.names, self.kills)}
+
+    def total_deaths(self):
+        """Get {name: deaths} summed over each column."""
+        if hasattr(self.kills, 'sum'):
+            return dict(zip(self.names, self.kills.sum(axis=0).tolist()))
+        return {name: sum(row[j] for row in self.kills) for j, name in enumerate(self.names)}
+
+
+def sum_matrices(matrices, players=None):
+    """
+    Add up kill matrices from many games.
+
+    Args:
+        matrices: VersusMatrix objects (e.g. one per game)
+        players: Names to keep, in output order. Defaults to every name seen,
+            in first-seen order. Kills involving other players are dropped.
+
+    Returns:
+        VersusMatrix over the selected players
+    """
+    matrices = list(matrices)
+    if players is None:
+        seen = {}
+        for matrix in matrices:
+            for name in matrix.names:
+                seen.setdefault(name, None)
+        players = list(seen)
+    players = list(dict.fromkeys(players))
+    index = {name: i for i, name in enumerate(players)}
+    size = len(players)
+
+    np = _numpy()
+    if np is not None:
+        total = np.zeros((size, size), dtype=np.int64)
+        for matrix in matrices:
+            positions = [(i, index[name]) for i, name in enumerate(matrix.names) if name in index]
+            if not positions:
+                continue
+            source, target = (np.array(p) for p in zip(*positions))
+            total[np.ix_(target, target)] += np.asarray(matrix.kills)[np.ix_(source, source)]
+        return VersusMatrix(players, total)
+
+    total = [[0] * size for _ in range(size)]
+    for matrix in matrices:
+        positions = [(i, index[name]) for i, name in enumerate(matrix.names) if name in index]
+        for i, target_i in positions:
+            row, out = matrix.kills[i], total[target_i]
+            for j, target_j in positions:
+                out[target_j] += row[j]
+    return VersusMatrix(players, total)
+
+def nemesis(matrix, player):
+    """Get (name, kills) of whoever killed player the most, or None."""
+    if player not in matrix.index:
+        return None
+    j = matrix.index[player]
+    candidates = [(int(row[j]), name) for name, row in zip(matrix.names, matrix.kills) if name != player]
+    kills, name = max(candidates, key=lambda c: c[0], default=(0, None))
+    return (name, kills) if kills > 0 else None
+
+def favorite_victim(matrix, player):
+    """Get (name, kills) of whoever player killed the most, or None."""
+    if player not in matrix.index:
+        return None
+    row = matrix.kills[matrix.index[player]]
+    candidates = [(int(row[j]), name) for j, name in enumerate(matrix.names) if name != player]
+    kills, name = max(candidates, key=lambda c: c[0], default=(0, None))
+    return (name, kills) if kills > 0 else None
@@ -0,0 +1,324 @@
+"""
+xlsx_reader.py - Minimal streaming reader for the stats workbooks
+
+The stats server writes small, fixed-layout xlsx files. This module reads the
+sheet XML straight out of the zip container into plain Python rows, which is
+much cheaper than building a pandas DataFrame per sheet.
+
+It only handles what the stats files actually contain. Values follow
+pandas.read_excel's inference: whole numbers read as int, pandas' default NA
+strings as missing, and a column whose strings all look like numbers (the
+stats server writes the score as text) is converted to int, or to float if it
+has fractions or missing cells. Anything it cannot represent exactly the way
+pandas would (date-formatted cells, error cells, boolean-like text, numbers
+padded with spaces, duplicate or blank headers, missing sheets) raises
+UnsupportedWorkbook so the caller can fall back to pandas.
+
+Usage:
+    from xlsx_reader import read_sheets, UnsupportedWorkbook
+    sheets = read_sheets('stats/20251128_201839.xlsx', ['Game Details', 'Versus'])
+    for row in sheets['Game Details'].rows:
+        print(row.get('Map Name'))
+"""
+
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+_SHEET = f'{{{MAIN_NS}}}sheet'
+_ROW = f'{{{MAIN_NS}}}row'
+_CELL = f'{{{MAIN_NS}}}c'
+_VALUE = f'{{{MAIN_NS}}}v'
+_INLINE = f'{{{MAIN_NS}}}is'
+_TEXT = f'{{{MAIN_NS}}}t'
+_SHARED_ITEM = f'{{{MAIN_NS}}}si'
+_XF = f'{{{MAIN_NS}}}xf'
+_CELL_XFS = f'{{{MAIN_NS}}}cellXfs'
+_NUM_FMT = f'{{{MAIN_NS}}}numFmt'
+_REL = f'{{{PKG_REL_NS}}}Relationship'
+_REL_ID = f'{{{REL_NS}}}id'
+
+_SHARED_STRINGS_TYPE = REL_NS + '/sharedStrings'
+_STYLES_TYPE = REL_NS + '/styles'
+
+_CELL_REF_RE = re.compile(r'^([A-Z]+)(\d+)$')
+
+# Built-in number formats that openpyxl reads as dates/times
+_BUILTIN_DATE_FORMATS = set(range(14, 23)) | {45, 46, 47}
+# Quoted literals, [colour]/[locale] blocks and escaped characters in a format code
+_FORMAT_LITERAL_RE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+
+# Text pandas.read_excel converts to numbers or reads as missing (its default na_values)
+_INT_TEXT_RE = re.compile(r'^[+-]?\d+$')
+_FLOAT_TEXT_RE = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+_NA_STRINGS = {'', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+               '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'}
+_BOOL_STRINGS = {'true', 'false'}
+
+
+class UnsupportedWorkbook(Exception):
+    """The workbook doesn't match the layout this reader handles; use pandas instead."""
+
+
+class Sheet:
+    """
+    Header and data rows of one worksheet.
+
+    Each row is a dict of header -> value, like a DataFrame row. Empty cells
+    are left out of the dict, so row.get(column, default) returns the default.
+    """
+
+    __slots__ = ('name', 'columns', 'rows')
+
+    def __init__(self, name, columns, rows):
+        self.name = name
+        self.columns = columns
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sheet):
+            return NotImplemented
+        return self.name == other.name and self.columns == other.columns and self.rows == other.rows
+
+    def __repr__(self):
+        return f"Sheet({self.name!r}, {len(self.columns)} columns, {len(self.rows)} rows)"
+
+
+def column_index(ref):
+    """Convert a cell reference like 'C7' to (column index, row number), both 0-based."""
+    match = _CELL_REF_RE.match(ref)
+    if not match:
+        raise UnsupportedWorkbook(f"Unexpected cell reference {ref!r}")
+    letters, row = match.groups()
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord('A') + 1)
+    return index - 1, int(row) - 1
+
+def _text_of(element):
+    """Concatenate all <t> text under an inline or shared string element."""
+    return ''.join(t.text or '' for t in element.iter(_TEXT))
+
+def _resolve_target(target):
+    """Resolve a workbook relationship target to a zip member name."""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join('xl', target))
+
+def _workbook_parts(archive):
+    """
+    Find the sheet, shared string and style parts of a workbook.
+
+    Returns:
+        (members, shared_strings_member, styles_member) where members maps
+        sheet name -> zip member name
+    """
+    rels = list(ET.fromstring(archive.read('xl/_rels/workbook.xml.rels')).iter(_REL))
+    targets = {rel.get('Id'): _resolve_target(rel.get('Target')) for rel in rels}
+    by_type = {rel.get('Type'): _resolve_target(rel.get('Target')) for rel in rels}
+
+    workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+    members = {}
+    for sheet in workbook.iter(_SHEET):
+        rel_id = sheet.get(_REL_ID)
+        if rel_id in targets:
+            members[sheet.get('name')] = targets[rel_id]
+    return members, by_type.get(_SHARED_STRINGS_TYPE), by_type.get(_STYLES_TYPE)
+
+def _shared_strings(archive, member):
+    """Load the shared string table, if the workbook has one."""
+    if not member:
+        return []
+    with archive.open(member) as data:
+        return [_text_of(item) for _, item in ET.iterparse(data) if item.tag == _SHARED_ITEM]
+
+def is_date_format(format_code):
+    """Check if a number format code displays a date or time."""
+    code = _FORMAT_LITERAL_RE.sub('', format_code).split(';')[0]
+    return any(ch in code for ch in 'dmyhsDMYHS')
+
+def _date_styles(archive, member):
+    """Get the cell style indexes whose number format is a date or time."""
+    if not member:
+        return set()
+    styles = ET.fromstring(archive.read(member))
+    custom_formats = {int(fmt.get('numFmtId')): fmt.get('formatCode', '') for fmt in styles.iter(_NUM_FMT)}
+
+    date_styles = set()
+    cell_xfs = styles.find(_CELL_XFS)
+    if cell_xfs is None:
+        return date_styles
+    for index, xf in enumerate(cell_xfs.iter(_XF)):
+        fmt_id = int(xf.get('numFmtId', 0))
+        if fmt_id in _BUILTIN_DATE_FORMATS or (fmt_id in custom_formats and is_date_format(custom_formats[fmt_id])):
+            date_styles.add(str(index))
+    return date_styles
+
+def _cell_value(cell, shared_strings, date_styles):
+    """Convert one <c> element to the Python value pandas would produce."""
+    cell_type = cell.get('t', 'n')
+
+    if cell_type == 'inlineStr':
+        inline = cell.find(_INLINE)
+        return _text_of(inline) if inline is not None else None
+
+    value = cell.find(_VALUE)
+    text = value.text if value is not None else None
+
+    if cell_type == 'str':
+        return text
+    if text is None:
+        return None
+    if cell_type == 's':
+        return shared_strings[int(text)]
+    if cell_type == 'b':
+        return text == '1'
+    if cell_type == 'n':
+        # pandas would turn date-formatted numbers into timestamps
+        if cell.get('s') in date_styles:
+            raise UnsupportedWorkbook("Date-formatted cell")
+        if '.' in text or 'E' in text or 'e' in text:
+            # openpyxl reads '23.0' as a float and pandas turns it back into 23
+            number = float(text)
+            return int(number) if number.is_integer() else number
+        return int(text)
+    raise UnsupportedWorkbook(f"Unsupported cell type {cell_type!r}")
+
+def _stream_rows(stream, shared_strings, date_styles):
+    """Yield each non-empty row of a worksheet as a list of cell values."""
+    for _, element in ET.iterparse(stream):
+        if element.tag != _ROW:
+            continue
+
+        values = []
+        for position, cell in enumerate(element.iter(_CELL)):
+            ref = cell.get('r')
+            index = column_index(ref)[0] if ref else position
+            if index < len(values):
+                raise UnsupportedWorkbook("Cells out of order")
+            values.extend([None] * (index - len(values)))
+            values.append(_cell_value(cell, shared_strings, date_styles))
+
+        element.clear()
+        # pandas skips blank lines
+        if any(v is not None for v in values):
+            yield values
+
+def _number_from_text(text):
+    """Parse text the way pandas converts a numeric-looking column, or None if it isn't a number."""
+    if _INT_TEXT_RE.match(text):
+        return int(text)
+    if _FLOAT_TEXT_RE.match(text):
+        return float(text)
+    if _FLOAT_TEXT_RE.match(text.strip()):
+        raise UnsupportedWorkbook(f"Number with surrounding spaces {text!r}")
+    return None
+
+def _infer_column(values):
+    """
+    Apply pandas' per-column type inference to one column's values (None = missing).
+
+    A column of numbers and numeric text becomes numeric: int if every cell is
+    a whole number and none is missing, else float. Columns with other text
+    keep their values as read.
+    """
+    present = [v for v in values if v is not None]
+    texts = [v for v in present if isinstance(v, str)]
+    if texts:
+        numbers = [_number_from_text(v) for v in texts]
+        if any(n is None for n in numbers):
+            if all(v.lower() in _BOOL_STRINGS for v in texts):
+                raise UnsupportedWorkbook("Boolean-like text column")
+            return values
+        if any(isinstance(v, bool) for v in present):
+            raise UnsupportedWorkbook("Numeric text mixed with booleans")
+        parsed = iter(numbers)
+        values = [next(parsed) if isinstance(v, str) else v for v in values]
+        present = [v for v in values if v is not None]
+
+    if not present or any(isinstance(v, (bool, str)) for v in present):
+        return values
+    if len(present) < len(values) or any(isinstance(v, float) for v in present):
+        return [None if v is None else float(v) for v in values]
+    return values
+
+def _build_sheet(name, row_values):
+    """Turn header + data rows into a Sheet, rejecting layouts pandas would rename."""
+    rows_iter = iter(row_values)
+    header = next(rows_iter, None)
+    if header is None:
+        return Sheet(name, [], [])
+
+    while header and header[-1] is None:
+        header.pop()
+    if any(h is None or h == '' for h in header):
+        raise UnsupportedWorkbook(f"Blank header cell in {name!r}")
+    if len(set(header)) != len(header):
+        raise UnsupportedWorkbook(f"Duplicate header in {name!r}")
+
+    data = []
+    for values in rows_iter:
+        if len(values) > len(header) and any(v is not None for v in values[len(header):]):
+            raise UnsupportedWorkbook(f"Data outside header columns in {name!r}")
+        values = [None if isinstance(v, str) and v in _NA_STRINGS else v for v in values[:len(header)]]
+        if all(v is None for v in values):
+            raise UnsupportedWorkbook(f"Row of NA strings in {name!r}")
+        data.append(values + [None] * (len(header) - len(values)))
+
+    columns = [_infer_column([values[i] for values in data]) for i in range(len(header))]
+    rows = [{col: v for col, v in zip(header, values) if v is not None} for values in zip(*columns)]
+    return Sheet(name, header, rows)
+
+def read_sheets(file_path, sheet_names):
+    """
+    Read the given sheets of an xlsx file without pandas.
+
+    Args:
+        file_path: Path (or file object) of the xlsx file
+        sheet_names: Names of the sheets to read
+
+    Returns:
+        dict of sheet name -> Sheet
+
+    Raises:
+        UnsupportedWorkbook: the file needs the full pandas reader
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            members, strings_member, styles_member = _workbook_parts(archive)
+            shared_strings = _shared_strings(archive, strings_member)
+            date_styles = _date_styles(archive, styles_member)
+
+            sheets = {}
+            for name in sheet_names:
+                if name not in members:
+                    raise UnsupportedWorkbook(f"Missing sheet {name!r}")
+                with archive.open(members[name]) as stream:
+                    sheets[name] = _build_sheet(name, _stream_rows(stream, shared_strings, date_styles))
+            return sheets
+    except (zipfile.BadZipFile, KeyError, ET.ParseError, ValueError, IndexError) as e:
+        raise UnsupportedWorkbook(str(e)) from e
+
+def sheet_from_dataframe(name, df):
+    """Convert a pandas DataFrame to a Sheet, dropping NaN cells like the streaming reader."""
+    import pandas as pd
+
+    columns = list(df.columns)
+    rows = []
+    for values in df.itertuples(index=False, name=None):
+        row = {}
+        for col, value in zip(columns, values):
+            if pd.isna(value):
+                continue
+            # numpy scalars -> plain Python values
+            row[col] = value.item() if hasattr(value, 'item') else value
+        rows.append(row)
+    return Sheet(name, columns, rows)
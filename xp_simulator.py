@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+xp_simulator.py - What-if XP replays for tuning xp_config.json
+
+Replays the ranked game history under many candidate XP configs and prints the
+final rank distribution each one produces, without touching rankstats.json.
+The ranked games are read from games.db once and turned into per-playlist
+arrays (player index + win/loss/tie per game). With NumPy installed, all
+configs are then replayed together, one array step per game. Without it, each
+config is replayed with populate_stats.replay_ranked_game(). --workers splits
+the configs across a process pool either way.
+
+Candidates come from config files (an xp_config.json-style dict, or
+{name: config}) and/or a grid that scales the current xp_config.json.
+
+Usage:
+    python xp_simulator.py                                  # current config only
+    python xp_simulator.py candidates/*.json
+    python xp_simulator.py --win-scale 0.5 1.0 --loss-scale 0.5 1.0 1.5 --threshold-scale 0.8 1.0 1.2
+    python xp_simulator.py candidates/*.json --workers 4 --output whatif.json
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import time
+
+import game_store
+from game_records import Game
+from populate_stats import RANKED_PLAYLISTS, XP_CONFIG_FILE, determine_winners_losers, replay_ranked_game
+from rank_table import RankTable
+
+# Name of the unmodified xp_config.json in the results
+CURRENT_CONFIG_NAME = 'current'
+
+# Rank levels per column of the printed distribution
+RANK_BUCKET_SIZE = 10
+
+WIN, LOSS, TIE = 1, -1, 0
+
+# NumPy is optional; without it every config is replayed in plain Python
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+
+def load_ranked_games(db_path=game_store.GAMES_DB_FILE):
+    """
+    Get {playlist: [Game]} for the ranked playlists, in replay order (by source file).
+
+    Only the Post Game Report is loaded; that is all XP replay looks at.
+    """
+    if not os.path.exists(db_path):
+        raise SystemExit(f"{db_path} not found - run populate_stats.py first")
+
+    conn = game_store.connect(db_path)
+    games_by_playlist = {}
+    for playlist in RANKED_PLAYLISTS:
+        game_ids = [row['id'] for row in game_store.find_games(conn, playlist=playlist)]
+        games_by_playlist[playlist] = [Game.from_json({'players': game['players']}, game['source_file'], playlist)
+                                       for game in game_store.load_games(conn, game_ids)]
+    conn.close()
+    return games_by_playlist
+
+
+class RankedSequence:
+    """
+    One playlist's ranked games as replay steps.
+
+    names are the players in first-seen order. Each step is (player indexes,
+    outcomes) for one game; a game listing the same name twice is split into
+    several steps so no step touches a player twice.
+    """
+
+    __slots__ = ('playlist', 'games', 'names', 'steps')
+
+    def __init__(self, playlist, games):
+        self.playlist = playlist
+        self.games = games
+        index = {}
+        self.steps = []
+        for game in games:
+            winners, losers = determine_winners_losers(game)
+            step = ([], [])
+            for player in game.players:
+                player_index = index.setdefault(player.name, len(index))
+                if player_index in step[0]:
+                    self.steps.append(step)
+                    step = ([], [])
+                outcome = WIN if player.name in winners else LOSS if player.name in losers else TIE
+                step[0].append(player_index)
+                step[1].append(outcome)
+            if step[0]:
+                self.steps.append(step)
+        self.names = list(index)
+
+
+def scaled_config(xp_config, win_scale=1.0, loss_scale=1.0, threshold_scale=1.0):
+    """Copy an XP config with its win factors, loss factors and rank XP bounds scaled."""
+    config = json.loads(json.dumps(xp_config))
+    config['win_factors'] = {rank: round(factor * win_scale, 4)
+                             for rank, factor in xp_config.get('win_factors', {}).items()}
+    config['loss_factors'] = {rank: round(factor * loss_scale, 4)
+                              for rank, factor in xp_config.get('loss_factors', {}).items()}
+    config['rank_thresholds'] = {level: [int(round(min_xp * threshold_scale)), int(round(max_xp * threshold_scale))]
+                                 for level, (min_xp, max_xp) in xp_config.get('rank_thresholds', {}).items()}
+    return config
+
+def load_candidate_configs(paths):
+    """Get [(name, config)] from config files; a file holds one config or {name: config}."""
+    candidates = []
+    for path in paths:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if 'rank_thresholds' in data:
+            candidates.append((os.path.splitext(os.path.basename(path))[0], data))
+        else:
+            candidates.extend(data.items())
+    return candidates
+
+def grid_configs(xp_config, win_scales, loss_scales, threshold_scales):
+    """Get [(name, config)] for every combination of scales (skipping the all-1.0 one)."""
+    candidates = []
+    for win_scale, loss_scale, threshold_scale in itertools.product(win_scales, loss_scales, threshold_scales):
+        if win_scale == loss_scale == threshold_scale == 1.0:
+            continue
+        name = f"win x{win_scale:g}, loss x{loss_scale:g}, thresholds x{threshold_scale:g}"
+        candidates.append((name, scaled_config(xp_config, win_scale, loss_scale, threshold_scale)))
+    return candidates
+
+
+def simulate_python(sequences, configs):
+    """
+    Replay every sequence under each config with replay_ranked_game().
+
+    Returns:
+        [{playlist: [final rank per player in sequence.names order]}] per config
+    """
+    results = []
+    for config in configs:
+        rank_table = RankTable(config)
+        ranks = {}
+        for sequence in sequences:
+            player_states = {}
+            for game in sequence.games:
+                replay_ranked_game(player_states, game, rank_table, verbose=False)
+            ranks[sequence.playlist] = [player_states[name]['rank'] for name in sequence.names]
+        results.append(ranks)
+    return results
+
+def simulate_numpy(sequences, configs):
+    """
+    Replay every sequence under all configs at once (same results as simulate_python).
+
+    Per game step, XP and ranks are (configs x players in the game) arrays.
+    Rank lookups compare against each config's thresholds padded to the same
+    length; win/loss factors are gathered from per-config tables indexed by rank.
+    """
+    import numpy as np
+    tables = [RankTable(config) for config in configs]
+    max_level = max(table.max_level for table in tables)
+    max_thresholds = max(len(table.thresholds()) for table in tables) or 1
+
+    # Padding minimum no XP total reaches
+    mins = np.full((len(tables), max_thresholds), np.iinfo(np.int64).max, dtype=np.int64)
+    levels = np.ones((len(tables), max_thresholds), dtype=np.int64)
+    for row, table in enumerate(tables):
+        for column, (min_xp, level) in enumerate(table.thresholds()):
+            mins[row, column] = min_xp
+            levels[row, column] = level
+    win_factors = np.array([[table.get_win_factor(rank) for rank in range(max_level + 1)] for table in tables])
+    loss_factors = np.array([[table.get_loss_factor(rank) for rank in range(max_level + 1)] for table in tables])
+    game_win = np.array([float(table.game_win) for table in tables])[:, None]
+    game_loss = np.array([float(table.game_loss) for table in tables])[:, None]
+
+    def calculate_ranks(xp):
+        # bisect_right over each config's minimums, then its level (1 below every minimum)
+        position = (mins[:, None, :] <= xp[:, :, None]).sum(axis=2) - 1
+        found = np.take_along_axis(levels, np.maximum(position, 0), axis=1)
+        return np.where(position < 0, 1, found)
+
+    results = [{} for _ in tables]
+    for sequence in sequences:
+        xp = np.zeros((len(tables), len(sequence.names)), dtype=np.int64)
+        ranks = np.ones((len(tables), len(sequence.names)), dtype=np.int64)
+        for player_indexes, outcomes in sequence.steps:
+            player_indexes = np.array(player_indexes)
+            outcomes = np.array(outcomes)
+            won = outcomes == WIN
+            lost = outcomes == LOSS
+            current_ranks = ranks[:, player_indexes]
+            # int() truncates toward zero, like replay_ranked_game()
+            win_change = np.trunc(game_win * np.take_along_axis(win_factors, current_ranks, axis=1))
+            loss_change = np.trunc(game_loss * np.take_along_axis(loss_factors, current_ranks, axis=1))
+            change = np.where(won, win_change, np.where(lost, loss_change, 0)).astype(np.int64)
+            new_xp = xp[:, player_indexes] + change
+            new_xp = np.where(lost, np.maximum(new_xp, 0), new_xp)
+            xp[:, player_indexes] = new_xp
+            ranks[:, player_indexes] = calculate_ranks(new_xp)
+        for row, rank_row in enumerate(ranks.tolist()):
+            results[row][sequence.playlist] = rank_row
+    return results
+
+def simulate(sequences, configs):
+    """Replay under each config, vectorized when NumPy is installed."""
+    if not configs:
+        return []
+    if NUMPY_AVAILABLE:
+        return simulate_numpy(sequences, configs)
+    return simulate_python(sequences, configs)
+
+def simulate_parallel(sequences, configs, workers=1):
+    """Run simulate() over the configs in workers processes (results keep the configs' order)."""
+    if workers <= 1 or len(configs) <= 1:
+        return simulate(sequences, configs)
+
+    from concurrent.futures import ProcessPoolExecutor
+    chunk_size = -(-len(configs) // workers)
+    chunks = [configs[i:i + chunk_size] for i in range(0, len(configs), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_results = executor.map(simulate, [sequences] * len(chunks), chunks)
+        return [result for chunk in chunk_results for result in chunk]
+
+
+def rank_distribution(ranks):
+    """Get {rank: players} sorted by rank."""
+    distribution = {}
+    for rank in sorted(ranks):
+        distribution[rank] = distribution.get(rank, 0) + 1
+    return distribution
+
+def bucket_counts(ranks, max_level):
+    """Count players per RANK_BUCKET_SIZE levels (1-10, 11-20, ...)."""
+    counts = [0] * (-(-max_level // RANK_BUCKET_SIZE))
+    for rank in ranks:
+        counts[min((rank - 1) // RANK_BUCKET_SIZE, len(counts) - 1)] += 1
+    return counts
+
+def print_report(sequences, names, results, max_level):
+    """Print each playlist's rank distribution per config, one row per config."""
+    buckets = [f"{start}-{min(start + RANK_BUCKET_SIZE - 1, max_level)}"
+               for start in range(1, max_level + 1, RANK_BUCKET_SIZE)]
+    name_width = max(len(name) for name in names)
+    for sequence in sequences:
+        if not sequence.names:
+            continue
+        print(f"\n{sequence.playlist}: {len(sequence.games)} games, {len(sequence.names)} players")
+        print(f"  {'config':<{name_width}}  {'mean':>5}  {'max':>3}  " + '  '.join(f"{b:>5}" for b in buckets))
+        for name, result in zip(names, results):
+            ranks = result[sequence.playlist]
+            counts = bucket_counts(ranks, max_level)
+            print(f"  {name:<{name_width}}  {sum(ranks) / len(ranks):5.1f}  {max(ranks):>3}  "
+                  + '  '.join(f"{c:>5}" for c in counts))
+
+
+def main(config_paths=(), win_scales=(1.0,), loss_scales=(1.0,), threshold_scales=(1.0,),
+         workers=1, output=None, db_path=game_store.GAMES_DB_FILE):
+    with open(XP_CONFIG_FILE, 'r') as f:
+        xp_config = json.load(f)
+    candidates = [(CURRENT_CONFIG_NAME, xp_config)]
+    candidates += load_candidate_configs(config_paths)
+    candidates += grid_configs(xp_config, win_scales, loss_scales, threshold_scales)
+    names = [name for name, _ in candidates]
+    configs = [config for _, config in candidates]
+
+    start = time.perf_counter()
+    games_by_playlist = load_ranked_games(db_path)
+    sequences = [RankedSequence(playlist, games) for playlist, games in games_by_playlist.items()]
+    load_time = time.perf_counter() - start
+    game_count = sum(len(sequence.games) for sequence in sequences)
+    print(f"Loaded {game_count} ranked games from {db_path} in {load_time:.2f}s")
+
+    start = time.perf_counter()
+    results = simulate_parallel(sequences, configs, workers)
+    elapsed = time.perf_counter() - start
+    engine = 'NumPy' if NUMPY_AVAILABLE else 'Python'
+    print(f"Simulated {len(configs)} configs in {elapsed:.2f}s ({engine}, {workers} worker(s))")
+
+    max_level = max(RankTable(config).max_level for config in configs)
+    print_report(sequences, names, results, max_level)
+
+    if output:
+        report = {
+            'games': {sequence.playlist: len(sequence.games) for sequence in sequences},
+            'configs': [{'name': name,
+                         'ranks': {playlist: rank_distribution(ranks) for playlist, ranks in result.items()}}
+                        for name, result in zip(names, results)]
+        }
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved {output}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare final rank distributions under candidate XP configs")
+    parser.add_argument('configs', nargs='*',
+                        help="Candidate config files (an xp_config.json-style dict or {name: config})")
+    parser.add_argument('--win-scale', type=float, nargs='+', default=[1.0],
+                        help="Grid: multipliers for win_factors")
+    parser.add_argument('--loss-scale', type=float, nargs='+', default=[1.0],
+                        help="Grid: multipliers for loss_factors")
+    parser.add_argument('--threshold-scale', type=float, nargs='+', default=[1.0],
+                        help="Grid: multipliers for the rank_thresholds XP bounds")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Split the configs across N processes (default: 1)")
+    parser.add_argument('--db', default=game_store.GAMES_DB_FILE,
+                        help=f"Game store to read (default: {game_store.GAMES_DB_FILE})")
+    parser.add_argument('--output', help="Also write every rank distribution to this JSON file")
+    args = parser.parse_args()
+    main(args.configs, args.win_scale, args.loss_scale, args.threshold_scale,
+         workers=args.workers, output=args.output, db_path=args.db)